@@ -0,0 +1 @@
+# Benchmark suite package
\ No newline at end of file
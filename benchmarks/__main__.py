@@ -0,0 +1,8 @@
+"""
+Run the benchmark suite: python -m benchmarks [--output results.json]
+"""
+
+import sys
+from benchmarks.runner import main
+
+sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,442 @@
+"""
+Benchmark cases driving the real game classes under fixed seeds
+"""
+
+import os
+import pygame
+from benchmarks.runner import benchmark, SkipBenchmark
+from src.config import Config
+
+WEATHER_TYPES = ["clear", "rain", "storm"]
+PARTICLE_COUNTS = [200, 2000, 10000]
+CAMERA_OFFSETS = [0, -400, -1280]
+ENTITY_COUNTS = [100, 1000, 5000]
+
+def _settled_weather(env, weather_type, particles):
+    """Build a weather system that has reached full intensity"""
+    from src.systems.weather_system import WeatherSystem
+    from src.systems.rain_particles import RainParticleSystem
+    
+    env.reseed()
+    weather = WeatherSystem()
+    weather.rain_particles = RainParticleSystem(particles, Config.SCREEN_WIDTH,
+                                                Config.SCREEN_HEIGHT, seed=env.seed)
+    weather.set_weather(weather_type)
+    
+    # Never auto-change weather while being measured
+    weather.weather_change_interval = float('inf')
+    for _ in range(120):
+        weather.update(1000.0 / Config.SIMULATION_RATE)
+    return weather
+
+def _playing_state(env):
+    """Enter the game state on the shared game manager"""
+    from src.game_manager import GameStateType
+    
+    env.reseed()
+    env.game_manager.change_state(GameStateType.PLAYING)
+    return env.game_manager.current_state
+
+@benchmark("weather")
+def weather_cases(env):
+    dt = 1000.0 / Config.SIMULATION_RATE
+    for weather_type in WEATHER_TYPES:
+        for particles in PARTICLE_COUNTS:
+            names = (f"update/{weather_type}/{particles}", f"render/{weather_type}/{particles}")
+            if not env.wants(*names):
+                continue
+            weather = _settled_weather(env, weather_type, particles)
+            yield names[0], lambda w=weather: w.update(dt)
+            yield names[1], lambda w=weather: w.render(env.screen)
+
+@benchmark("world")
+def world_cases(env):
+    ground_level = Config.SCREEN_HEIGHT - 100
+    draw_names = [f"draw_world/offset{offset}" for offset in CAMERA_OFFSETS]
+    if env.wants(*draw_names):
+        state = _playing_state(env)
+        for name, offset in zip(draw_names, CAMERA_OFFSETS):
+            yield name, lambda o=offset: state._draw_world(env.screen, (o, 0))
+            
+    # Building one chunk, as the streaming thread does
+    if env.wants("generate_chunk", "stream/running"):
+        from src.systems.world_streamer import WorldStreamer
+        world = WorldStreamer(env.seed, ground_level, threaded=False)
+        yield "generate_chunk", lambda: world.generate(7)
+        
+        # Streaming bookkeeping per tick while running; a new chunk every ~100 ticks
+        view = [0.0]
+        def stream():
+            view[0] += 10.0
+            world.update(view[0], view[0] + Config.SCREEN_WIDTH)
+        yield "stream/running", stream
+        
+    # Memory of a long run's buildings, as the old per-object dicts and as
+    # slotted objects; compare alloc_peak_bytes
+    count = 10000
+    if not env.wants(f"objects/dicts/{count}", f"objects/compact/{count}"):
+        return
+    from src.systems.world_objects import Building
+    import random
+    rng = random.Random(env.seed)
+    heights = [rng.randint(150, 300) for _ in range(count)]
+    masks = [rng.getrandbits(16) for _ in heights]
+    def dict_objects():
+        return [{
+            'type': 'building',
+            'rect': pygame.Rect(i * 120, ground_level - height, 80, height),
+            'color': Config.GRAY,
+            'height': height,
+            'depth': 40,
+            'window_mask': mask
+        } for i, (height, mask) in enumerate(zip(heights, masks))]
+    def compact_objects():
+        return [Building(pygame.Rect(i * 120, ground_level - height, 80, height), Config.GRAY, 40, mask)
+                for i, (height, mask) in enumerate(zip(heights, masks))]
+    yield f"objects/dicts/{count}", dict_objects
+    yield f"objects/compact/{count}", compact_objects
+
+@benchmark("spatial")
+def spatial_cases(env):
+    import random
+    from src.systems.spatial_index import SpatialGrid
+    
+    # A long run's worth of buildings and trees along the ground
+    count = 20000
+    if not env.wants(f"query_viewport/{count}", f"query_interact/{count}",
+                     f"linear_scan_viewport/{count}", "move_entity", "remove_insert"):
+        return
+    rng = random.Random(env.seed)
+    ground_level = Config.SCREEN_HEIGHT - 100
+    objects = []
+    for i in range(count):
+        height = rng.randint(60, 300)
+        objects.append({'rect': pygame.Rect(i * 100 + rng.randint(0, 50), ground_level - height, 80, height)})
+    grid = SpatialGrid()
+    for obj in objects:
+        grid.insert(obj, obj['rect'])
+        
+    middle = count * 50
+    viewport = pygame.Rect(middle, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+    near_player = pygame.Rect(middle + 600, ground_level - 75, 50, 50)
+    yield f"query_viewport/{count}", lambda: grid.query(viewport)
+    yield f"query_interact/{count}", lambda: grid.query(near_player)
+    yield f"linear_scan_viewport/{count}", lambda: [obj for obj in objects if obj['rect'].colliderect(viewport)]
+    
+    # An entity walking; most steps stay in the same cells
+    walker = {'rect': pygame.Rect(middle, ground_level - 48, 32, 48)}
+    grid.insert(walker, walker['rect'])
+    def move():
+        walker['rect'].x += 7
+        grid.move(walker, walker['rect'])
+    yield "move_entity", move
+    
+    def churn():
+        obj = objects[rng.randrange(count)]
+        grid.remove(obj)
+        grid.insert(obj, obj['rect'])
+    yield "remove_insert", churn
+
+@benchmark("player")
+def player_cases(env):
+    if not env.wants("update/idle", "update/walking", "render", "render/facing_left",
+                     "create/with_avatar"):
+        return
+        
+    from src.entities.player import Player
+    
+    dt = 1000.0 / Config.SIMULATION_RATE
+    ground_level = Config.SCREEN_HEIGHT - 100
+    player = Player(Config.SCREEN_WIDTH // 2, ground_level - 50, {'player_name': 'Bench'})
+    
+    def walk():
+        player.move_right(dt)
+        player.update(dt, ground_level)
+        
+    yield "update/idle", lambda: player.update(dt, ground_level)
+    yield "update/walking", walk
+    yield "render", lambda: player.render(env.screen, (0, 0))
+    
+    def render_facing_left():
+        player.facing_right = False
+        player.render(env.screen, (0, 0))
+        player.facing_right = True
+    yield "render/facing_left", render_facing_left
+    
+    # Built on every GameState.enter; the avatar comes from the sprite cache
+    import numpy as np
+    avatar = np.random.default_rng(env.seed).integers(0, 256, (300, 400, 3), dtype=np.uint8)
+    avatar_data = {'player_name': 'Bench', 'has_avatar': True}
+    yield "create/with_avatar", lambda: Player(0, 0, avatar_data, avatar)
+
+@benchmark("entities")
+def entity_cases(env):
+    import random
+    from src.entities.ecs import EntityStore, movement_system, animation_system, render_system
+    from src.entities.player import Player
+    
+    dt = 1000.0 / Config.SIMULATION_RATE
+    ground_level = Config.SCREEN_HEIGHT - 100
+    rng = random.Random(env.seed)
+    for count in ENTITY_COUNTS:
+        if not env.wants(f"update/{count}", f"render/{count}"):
+            continue
+            
+        # Walkers, some mid-jump, all on screen: the worst case for drawing
+        store = EntityStore()
+        player = Player(Config.SCREEN_WIDTH // 2, ground_level - 50, {'player_name': 'Bench'}, store=store)
+        sprite = store.sprites[store.sprite[player.entity]]
+        for _ in range(count - 1):
+            entity = store.spawn()
+            store.add_position(entity, rng.uniform(0, Config.SCREEN_WIDTH - 32), rng.uniform(100, ground_level - 48))
+            store.add_velocity(entity, rng.uniform(-5, 5), rng.uniform(-10, 0), 1.0, Config.GRAVITY)
+            store.add_collider(entity, 32, 48)
+            store.add_sprite(entity, sprite)
+            store.add_animation(entity)
+            
+        def update(store=store):
+            movement_system(store, dt, ground_level)
+            animation_system(store, dt)
+        yield f"update/{count}", update
+        yield f"render/{count}", lambda store=store: render_system(store, env.screen, (0, 0))
+
+@benchmark("audio")
+def audio_cases(env):
+    if not env.wants("create_beep/0.1s", "create_beep/1.0s", "synth_tone/1.0s",
+                     "synth_rain_bed/2.0s", "synth_thunder/2.5s"):
+        return
+        
+    from src import audio_synth
+    
+    audio_manager = env.game_manager.audio_manager
+    audio_manager.prewarm()
+    yield "create_beep/0.1s", lambda: audio_manager._create_beep(440, 0.1)
+    yield "create_beep/1.0s", lambda: audio_manager._create_beep(440, 1.0)
+    
+    # Uncached synthesis, as on a first launch
+    yield "synth_tone/1.0s", lambda: audio_synth.to_int16(audio_synth.tone(440, 1.0))
+    yield "synth_rain_bed/2.0s", lambda: audio_synth.to_int16(audio_synth.rain_bed(2.0))
+    yield "synth_thunder/2.5s", lambda: audio_synth.to_int16(audio_synth.thunder(2.5))
+
+@benchmark("avatar")
+def avatar_cases(env):
+    if not env.wants("update_avatar_preview", "update_avatar_preview/slider_moved",
+                     "create_default_avatar", "generate_default_avatar/400x300",
+                     "generate_player_sprite/32x48", "process_camera_frame"):
+        return
+        
+    try:
+        import cv2  # noqa: F401
+    except ImportError:
+        raise SkipBenchmark("OpenCV is not installed")
+        
+    from src.states.avatar_creation import AvatarCreationState
+    
+    env.reseed()
+    state = AvatarCreationState(env.game_manager)
+    state._create_ui()
+    state._create_default_avatar()
+    state.is_photo_taken = True
+    state.sliders['skin_tone']['value'] = 0.8
+    
+    yield "update_avatar_preview", state._update_avatar_preview
+    
+    def move_slider():
+        slider = state.sliders['skin_tone']
+        slider['value'] = 0.9 if slider['value'] == 0.8 else 0.8
+        state._update_avatar_preview()
+    yield "update_avatar_preview/slider_moved", move_slider
+    yield "create_default_avatar", state._create_default_avatar
+    
+    # Uncached procedural generation, as on the first use of a size
+    from src.graphics import image_tools
+    yield "generate_default_avatar/400x300", lambda: image_tools.default_avatar(400, 300)
+    yield "generate_player_sprite/32x48", lambda: image_tools.player_sprite(32, 48)
+    
+    # Per-frame work the capture thread does for a webcam-sized frame
+    import numpy as np
+    from src.systems.webcam_capture import WebcamCapture, FileReplaySource
+    
+    rng = np.random.default_rng(env.seed)
+    frames = rng.integers(0, 256, (4, Config.WEBCAM_HEIGHT, Config.WEBCAM_WIDTH, 3), dtype=np.uint8)
+    replay_path = os.path.join(env.work_dir, "replay.npy")
+    np.save(replay_path, frames)
+    source = FileReplaySource(replay_path, realtime=False)
+    capture = WebcamCapture(source, state.camera_rect.size)
+    yield "process_camera_frame", lambda: capture.process(source.read()[1])
+
+@benchmark("save")
+def save_cases(env):
+    if not env.wants("json_png/save", "json_png/load", "container/save",
+                     "container/load_player", "container/load_with_avatar"):
+        return
+        
+    import json
+    import numpy as np
+    from src.save_manager import write_atomic
+    from src.save_format import build_container, SaveContainer
+    
+    rng = np.random.default_rng(env.seed)
+    avatar = rng.integers(0, 256, (300, 400, 3), dtype=np.uint8)
+    player_data = env.game_manager.save_manager.load_player_data()
+    
+    # Legacy layout: indented JSON plus a PNG next to it
+    json_path = os.path.join(env.work_dir, "bench_player.json")
+    png_path = os.path.join(env.work_dir, "bench_avatar.png")
+    avatar_surface = pygame.surfarray.make_surface(avatar.swapaxes(0, 1))
+    
+    def json_save():
+        write_atomic(json_path, json.dumps(player_data, indent=2).encode('utf-8'))
+        pygame.image.save(avatar_surface, png_path)
+        
+    def json_load():
+        with open(json_path) as f:
+            json.load(f)
+        pygame.surfarray.array3d(pygame.image.load(png_path))
+        
+    container_path = os.path.join(env.work_dir, "bench_player.sav")
+    
+    def container_save():
+        write_atomic(container_path, build_container({'player': player_data, 'avatar': avatar}))
+        
+    def container_load_player():
+        with SaveContainer(container_path) as container:
+            container.get('player')
+            
+    def container_load_avatar():
+        with SaveContainer(container_path) as container:
+            container.get('player')
+            np.array(container.get('avatar'))
+            
+    json_save()
+    container_save()
+    yield "json_png/save", json_save
+    yield "json_png/load", json_load
+    yield "container/save", container_save
+    yield "container/load_player", container_load_player
+    yield "container/load_with_avatar", container_load_avatar
+
+@benchmark("profiles")
+def profile_cases(env):
+    import numpy as np
+    from src.save_manager import write_atomic
+    from src.save_format import build_container, read_table
+    from src.profile_store import ProfileStore, RECORD_DTYPE
+    
+    count = 10000
+    if not env.wants(f"open_index/{count}", f"list_profiles/{count}", f"get_page/{count}",
+                     "page_thumbnails"):
+        return
+        
+    page_size = Config.PROFILE_PAGE_SIZE
+    rng = np.random.default_rng(env.seed)
+    directory = os.path.join(env.work_dir, "bench_profiles")
+    store = ProfileStore(directory)
+    
+    # One full page of real profile files with thumbnails, the rest index only
+    records = np.zeros(count, dtype=RECORD_DTYPE)
+    records['id'] = np.arange(1, count + 1)
+    records['last_played'] = rng.random(count) * 1e6
+    records['high_score'] = rng.integers(0, 100000, count)
+    records['name'] = [f"Player {i}".encode('utf-8') for i in range(count)]
+    records['last_played'][:page_size] += 2e6
+    for profile_id in range(1, page_size + 1):
+        thumb = rng.integers(0, 256, Config.PROFILE_THUMB_SIZE[::-1] + (3,), dtype=np.uint8)
+        data = build_container({'player': {}, 'thumb': thumb})
+        write_atomic(store.profile_path(profile_id), data)
+        _, compression, shape, offset, _ = read_table(data)[1]['thumb']
+        records[profile_id - 1]['thumb_offset'] = offset
+        records[profile_id - 1]['thumb_height'], records[profile_id - 1]['thumb_width'] = shape[:2]
+    store.records = records
+    store._write_index()
+    
+    profiles = store.list_profiles()
+    page = store.get_page(0, page_size, profiles)
+    
+    def page_thumbnails():
+        from src.graphics.image_tools import to_surface
+        for profile in page:
+            to_surface(store.load_thumbnail(profile))
+            
+    yield f"open_index/{count}", lambda: ProfileStore(directory)
+    yield f"list_profiles/{count}", store.list_profiles
+    yield f"get_page/{count}", lambda: store.get_page(count // page_size // 2, page_size, profiles)
+    yield "page_thumbnails", page_thumbnails
+
+@benchmark("surfaces")
+def surface_cases(env):
+    if not env.wants("pause_overlay", "lightning_flash", "camera/upload", "camera/blit"):
+        return
+        
+    import numpy as np
+    from src.graphics.frame_upload import FrameUploader
+    
+    state = _playing_state(env)
+    yield "pause_overlay", lambda: state._draw_pause_overlay(env.screen)
+    yield "lightning_flash", lambda: state.weather_system._render_lightning(env.screen)
+    
+    # A webcam frame arriving, then being drawn
+    rng = np.random.default_rng(env.seed)
+    frame = rng.integers(0, 256, (Config.WEBCAM_HEIGHT, Config.WEBCAM_WIDTH, 3), dtype=np.uint8)
+    uploader = FrameUploader()
+    uploader.upload(frame)
+    yield "camera/upload", lambda: uploader.upload(frame)
+    yield "camera/blit", lambda: env.screen.blit(uploader.surface, (0, 0))
+
+@benchmark("sprites")
+def sprite_cases(env):
+    import random
+    from src.graphics.sprite_batch import TextureAtlas, SpriteBatch
+    from src.graphics.surface_manager import create_surface
+    
+    # Small opaque sprites, as separate surfaces and packed into an atlas
+    count = 1000
+    if not env.wants(f"blit_each/{count}", f"blits/separate/{count}", f"blits/atlas/{count}",
+                     f"batch/{count}"):
+        return
+        
+    rng = random.Random(env.seed)
+    sources = []
+    for i in range(16):
+        surface = create_surface((32, 48))
+        surface.fill((rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        sources.append(surface)
+    atlas = TextureAtlas()
+    packed = [atlas.add(i, surface) for i, surface in enumerate(sources)]
+    positions = [(rng.uniform(0, Config.SCREEN_WIDTH - 32), rng.uniform(0, Config.SCREEN_HEIGHT - 48))
+                 for _ in range(count)]
+    layers = [rng.randrange(4) for _ in range(count)]
+    
+    def blit_each():
+        for i, position in enumerate(positions):
+            env.screen.blit(sources[i % 16], position)
+    yield f"blit_each/{count}", blit_each
+    yield f"blits/separate/{count}", lambda: env.screen.blits(
+        [(sources[i % 16], position) for i, position in enumerate(positions)], doreturn=0)
+    yield f"blits/atlas/{count}", lambda: env.screen.blits(
+        [(packed[i % 16], position) for i, position in enumerate(positions)], doreturn=0)
+        
+    # Queued one by one on four layers, then drawn in one call
+    batch = SpriteBatch()
+    def batched():
+        for i, position in enumerate(positions):
+            batch.add(packed[i % 16], position, layers[i])
+        batch.flush(env.screen)
+        batch.end_frame()
+    yield f"batch/{count}", batched
+
+@benchmark("frame")
+def frame_cases(env):
+    names = [f"full/{weather_type}" for weather_type in WEATHER_TYPES]
+    if not env.wants(*names):
+        return
+        
+    game_manager = env.game_manager
+    state = _playing_state(env)
+    
+    # Hold each case's weather while it is timed
+    state.weather_system.weather_change_interval = float('inf')
+    for name, weather_type in zip(names, WEATHER_TYPES):
+        if env.wants(name):
+            state.weather_system.set_weather(weather_type)
+            yield name, lambda: game_manager.simulate(1, render_every=1)
\ No newline at end of file
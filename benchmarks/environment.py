@@ -0,0 +1,59 @@
+"""
+Shared headless game environment for benchmark cases
+"""
+
+import os
+import sys
+import atexit
+import random
+import shutil
+import tempfile
+
+# Repository root, so src stays importable after changing directory
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_environment = None
+
+class BenchmarkEnvironment:
+    def __init__(self, seed=0):
+        from src.headless import HeadlessRunner
+        
+        # Keep saves and caches out of the working tree
+        if ROOT_DIR not in sys.path:
+            sys.path.insert(0, ROOT_DIR)
+        self.work_dir = tempfile.mkdtemp(prefix="stormrunner-bench-")
+        os.chdir(self.work_dir)
+        atexit.register(shutil.rmtree, self.work_dir, True)
+        
+        self.seed = seed
+        self.runner = HeadlessRunner(seed)
+        self.game_manager = self.runner.setup()
+        self.screen = self.game_manager.screen
+        
+        # Group being set up and the cases the runner was asked for
+        self.group = None
+        self.name_filter = None
+        
+    def reseed(self):
+        """Reset the random generators so each case starts identically"""
+        random.seed(self.seed)
+        try:
+            import numpy as np
+            np.random.seed(self.seed)
+        except ImportError:
+            pass
+            
+    def wants(self, *names):
+        """Check whether any of the current group's named cases will be run
+        
+        Case generators check this before setup the filter may make
+        pointless.
+        """
+        return not self.name_filter or any(self.name_filter in f"{self.group}/{name}" for name in names)
+
+def get_environment():
+    """Get the shared benchmark environment, creating it on first use"""
+    global _environment
+    if _environment is None:
+        _environment = BenchmarkEnvironment()
+    return _environment
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Benchmark harness: timing, allocation tracking, JSON reports and comparison
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+
+# Registered benchmark case generators, in definition order
+BENCHMARKS = []
+
+def benchmark(group):
+    """Register a case generator yielding (name, operation) pairs
+    
+    Generators are run lazily; they should check env.wants() before setup
+    for cases the name filter may exclude.
+    """
+    def decorator(func):
+        BENCHMARKS.append((group, func))
+        return func
+    return decorator
+
+class SkipBenchmark(Exception):
+    """Raised by a case generator when a dependency is unavailable"""
+
+def time_operation(operation, min_time=0.2, max_runs=10000, warmup=3):
+    """Time an operation repeatedly and get per-run statistics in ms"""
+    for _ in range(warmup):
+        operation()
+        
+    times = []
+    start = time.perf_counter()
+    while len(times) < max_runs and (time.perf_counter() - start) < min_time or len(times) < 5:
+        run_start = time.perf_counter()
+        operation()
+        times.append((time.perf_counter() - run_start) * 1000.0)
+        
+    times.sort()
+    last = len(times) - 1
+    return {
+        'runs': len(times),
+        'mean_ms': sum(times) / len(times),
+        'median_ms': times[last // 2],
+        'p95_ms': times[int(round(0.95 * last))],
+        'min_ms': times[0],
+    }
+
+def measure_allocations(operation, runs=10):
+    """Measure Python heap allocations per run of an operation"""
+    tracemalloc.start()
+    try:
+        operation()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(runs):
+            operation()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        
+    return {
+        'alloc_net_bytes_per_run': (after - before) / runs,
+        'alloc_peak_bytes': peak - before,
+    }
+
+def run_benchmarks(name_filter=None, min_time=0.2, track_allocations=True):
+    """Run every registered case and get a results report"""
+    from benchmarks.environment import get_environment
+    import benchmarks.cases  # registers the cases
+    
+    env = get_environment()
+    results = {}
+    
+    for group, generator in BENCHMARKS:
+        env.group = group
+        env.name_filter = name_filter
+        try:
+            # Each case is timed as it's yielded, so setup the generator
+            # does before its next case stays out of the timings
+            for name, operation in generator(env):
+                full_name = f"{group}/{name}"
+                if name_filter and name_filter not in full_name:
+                    continue
+                    
+                result = time_operation(operation, min_time)
+                if track_allocations:
+                    result.update(measure_allocations(operation))
+                results[full_name] = result
+                print(f"{full_name:<55} {result['median_ms']:9.4f} ms median "
+                      f"{result['p95_ms']:9.4f} ms p95  ({result['runs']} runs)")
+        except SkipBenchmark as e:
+            print(f"{group}: skipped ({e})")
+            results[group] = {'skipped': str(e)}
+            
+    return {
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+def compare(report, baseline, threshold):
+    """Get cases whose median time grew more than threshold vs a baseline"""
+    regressions = []
+    for name, result in report['results'].items():
+        old = baseline.get('results', {}).get(name)
+        if not old or 'median_ms' not in old or 'median_ms' not in result:
+            continue
+        ratio = result['median_ms'] / old['median_ms'] if old['median_ms'] > 0 else 1.0
+        if ratio > 1.0 + threshold:
+            regressions.append((name, old['median_ms'], result['median_ms'], ratio))
+    return regressions
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Run StormRunner benchmarks")
+    parser.add_argument("--filter", help="only run cases whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to time each case")
+    parser.add_argument("--no-alloc", action="store_true", help="skip allocation tracking")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown flagged as a regression")
+    args = parser.parse_args(argv)
+    
+    # The environment runs in a temporary directory; paths are relative to here
+    output_path = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.compare) if args.compare else None
+    
+    report = run_benchmarks(args.filter, args.min_time, not args.no_alloc)
+    
+    if output_path:
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+        
+    if baseline_path:
+        with open(baseline_path, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for name, old, new, ratio in regressions:
+            print(f"REGRESSION {name}: {old:.4f} ms -> {new:.4f} ms ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print("No regressions")
+        
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -4,16 +4,23 @@ StormRunner - 3D Adventure Game
 Main entry point for the game
 """
 
-import pygame
 import sys
 import os
 
+# Start the startup clock before anything heavy is imported
+from src.startup import startup_timer
+
+import pygame
+
+startup_timer.mark("pygame imported")
+
 def main():
     """Main function to start the game"""
     try:
         # Initialize Pygame
         pygame.init()
         pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        startup_timer.mark("pygame initialised")
         
         # Import and create game manager
         from src.game_manager import GameManager
@@ -3,7 +3,7 @@ Audio manager for music and sound effects
 """
 
 import pygame
-import numpy as np
+import threading
 from src.config import Config
 
 class AudioManager:
@@ -15,13 +15,32 @@ class AudioManager:
         # Sound effects dictionary
         self.sfx = {}
         
-        # Load audio files
-        self._load_audio()
+        # Sounds are synthesised on first use or by prewarm(), not at startup
+        self.synth = None
+        self.loaded = False
+        self._load_lock = threading.Lock()
         
     def _load_audio(self):
         """Load audio files"""
-        # Create placeholder sounds if audio files don't exist
-        self._create_placeholder_sounds()
+        with self._load_lock:
+            if self.loaded:
+                return
+                
+            # Synthesised buffers match the mixer's format and are cached on disk
+            from src.audio_synth import SynthCache
+            mixer_format = pygame.mixer.get_init()
+            if mixer_format:
+                self.synth = SynthCache(sample_rate=mixer_format[0], channels=mixer_format[2])
+            else:
+                self.synth = SynthCache()
+                
+            # Create placeholder sounds if audio files don't exist
+            self._create_placeholder_sounds()
+            self.loaded = True
+            
+    def prewarm(self):
+        """Load all sounds now, e.g. from a background thread"""
+        self._load_audio()
         
     def _create_placeholder_sounds(self):
         """Create placeholder sound effects"""
@@ -39,26 +58,30 @@ class AudioManager:
             # Footstep sound
             self.sfx['footstep'] = self._create_beep(200, 0.05)
             
+            # Weather ambience
+            self.sfx['rain'] = self._create_sound('rain_bed', duration=2.0)
+            self.sfx['thunder'] = self._create_sound('thunder', duration=2.5)
+            
         except Exception as e:
             print(f"Failed to create placeholder sounds: {e}")
             
     def _create_beep(self, frequency, duration):
         """Create a simple beep sound"""
         try:
-            sample_rate = 22050
-            frames = int(duration * sample_rate)
-            arr = []
-            
-            for i in range(frames):
-                time = float(i) / sample_rate
-                wave = 4096 * np.sin(frequency * 2 * np.pi * time)
-                arr.append([int(wave), int(wave)])
-                
-            sound = pygame.sndarray.make_sound(np.array(arr, dtype=np.int16))
-            return sound
+            buffer = self.synth.get('tone', frequency=frequency, duration=duration)
+            return pygame.sndarray.make_sound(buffer)
         except Exception as e:
             print(f"Failed to create beep sound: {e}")
             return None
+            
+    def _create_sound(self, generator, envelope_params=None, **params):
+        """Create a sound from any synthesis generator"""
+        try:
+            buffer = self.synth.get(generator, envelope_params, **params)
+            return pygame.sndarray.make_sound(buffer)
+        except Exception as e:
+            print(f"Failed to create {generator} sound: {e}")
+            return None
         
     def play_music(self, music_name):
         """Play background music"""
@@ -68,15 +91,27 @@ class AudioManager:
         except Exception as e:
             print(f"Failed to play music: {e}")
             
-    def play_sfx(self, sfx_name, volume=1.0):
-        """Play sound effect"""
+    def play_sfx(self, sfx_name, volume=1.0, loops=0):
+        """Play sound effect; loops=-1 repeats it until stop_sfx()
+        
+        Returns the channel it plays on, or None.
+        """
         try:
+            if not self.loaded:
+                self._load_audio()
             if sfx_name in self.sfx and self.sfx[sfx_name]:
                 sound = self.sfx[sfx_name]
                 sound.set_volume(self.sfx_volume * self.master_volume * volume)
-                sound.play()
+                return sound.play(loops)
         except Exception as e:
             print(f"Failed to play sound effect {sfx_name}: {e}")
+        return None
+        
+    def stop_sfx(self, sfx_name):
+        """Stop every playback of a sound effect"""
+        sound = self.sfx.get(sfx_name)
+        if sound:
+            sound.stop()
             
     def stop_music(self):
         """Stop background music"""
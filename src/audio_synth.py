@@ -0,0 +1,153 @@
+"""
+Vectorised procedural sound synthesis with a persistent on-disk cache
+
+Every generator works on whole NumPy arrays in one pass and returns mono
+float samples; to_int16 converts them to the mixer's sample layout.
+"""
+
+import os
+import json
+import hashlib
+import numpy as np
+from src.config import Config
+
+# Bump when generator output changes so stale cache files are ignored
+SYNTH_VERSION = 1
+
+def sample_times(duration, sample_rate):
+    """Get the time in seconds of every sample"""
+    frames = int(duration * sample_rate)
+    return np.arange(frames, dtype=np.float64) / sample_rate
+
+def tone(frequency, duration, sample_rate=22050, amplitude=4096, waveform="sine"):
+    """Generate a periodic tone"""
+    phase = frequency * sample_times(duration, sample_rate)
+    if waveform == "sine":
+        return amplitude * np.sin(2 * np.pi * phase)
+    if waveform == "square":
+        return amplitude * np.sign(np.sin(2 * np.pi * phase))
+    if waveform == "saw":
+        return amplitude * (2 * (phase - np.floor(phase + 0.5)))
+    if waveform == "triangle":
+        return amplitude * (2 * np.abs(2 * (phase - np.floor(phase + 0.5))) - 1)
+    raise ValueError(f"Unknown waveform: {waveform}")
+
+def chord(frequencies, duration, sample_rate=22050, amplitude=4096, waveform="sine"):
+    """Generate several tones mixed at equal volume"""
+    voices = [tone(f, duration, sample_rate, amplitude, waveform) for f in frequencies]
+    return np.sum(voices, axis=0) / max(1, len(voices))
+
+def noise(duration, sample_rate=22050, amplitude=4096, seed=0):
+    """Generate white noise"""
+    rng = np.random.default_rng(seed)
+    frames = int(duration * sample_rate)
+    return amplitude * rng.uniform(-1.0, 1.0, frames)
+
+def envelope(samples, sample_rate=22050, attack=0.01, decay=0.05, sustain=0.7, release=0.05):
+    """Apply an attack/decay/sustain/release envelope"""
+    frames = len(samples)
+    times = np.arange(frames, dtype=np.float64) / sample_rate
+    end = frames / sample_rate
+    
+    # Piecewise-linear gain curve evaluated for all samples at once
+    points_t = [0.0, attack, attack + decay, max(attack + decay, end - release), end]
+    points_g = [0.0, 1.0, sustain, sustain, 0.0]
+    return samples * np.interp(times, points_t, points_g)
+
+def low_pass(samples, width):
+    """Smooth samples with a moving average of the given width"""
+    if width <= 1:
+        return samples
+        
+    # Running sums make the cost independent of the window width
+    half = width // 2
+    padded = np.pad(samples, (half, width - 1 - half), mode="edge")
+    sums = np.cumsum(np.concatenate(([0.0], padded)))
+    return (sums[width:] - sums[:-width]) / width
+
+def rain_bed(duration, sample_rate=22050, amplitude=2048, seed=0):
+    """Generate a soft, loopable rain hiss"""
+    hiss = low_pass(noise(duration, sample_rate, 1.0, seed), 4)
+    
+    # Slow swell so the loop doesn't sound static
+    swell = 0.8 + 0.2 * np.sin(2 * np.pi * sample_times(duration, sample_rate) / max(duration, 1e-6))
+    return amplitude * hiss / max(1e-9, np.max(np.abs(hiss))) * swell
+
+def thunder(duration, sample_rate=22050, amplitude=6000, seed=0):
+    """Generate a low rumble with a sharp crack and long decay"""
+    rng = np.random.default_rng(seed)
+    frames = int(duration * sample_rate)
+    
+    # Brown noise: integrated white noise, re-centred to remove drift
+    rumble = np.cumsum(rng.uniform(-1.0, 1.0, frames))
+    rumble = low_pass(rumble - low_pass(rumble, 2048), 32)
+    rumble /= max(1e-9, np.max(np.abs(rumble)))
+    
+    times = sample_times(duration, sample_rate)
+    crack = rng.uniform(-1.0, 1.0, frames) * np.exp(-times * 30)
+    decay = np.exp(-times * 3 / max(duration, 1e-6))
+    return amplitude * (0.8 * rumble + 0.4 * crack) * decay
+
+def to_int16(samples, channels=2):
+    """Convert float samples to an int16 buffer shaped for the mixer"""
+    mono = np.clip(samples, -32768, 32767).astype(np.int16)
+    if channels == 1:
+        return mono
+    return np.repeat(mono[:, None], channels, axis=1)
+
+GENERATORS = {
+    "tone": tone,
+    "chord": chord,
+    "noise": noise,
+    "rain_bed": rain_bed,
+    "thunder": thunder,
+}
+
+class SynthCache:
+    """Synthesised int16 buffers cached on disk by their parameters"""
+    
+    def __init__(self, cache_dir=None, sample_rate=22050, channels=2):
+        self.cache_dir = cache_dir or Config.SOUND_CACHE_DIR
+        self.sample_rate = sample_rate
+        self.channels = channels
+        
+    def _key(self, generator, params):
+        """Get a stable file name for a generator call"""
+        description = json.dumps({
+            'version': SYNTH_VERSION,
+            'generator': generator,
+            'params': params,
+            'sample_rate': self.sample_rate,
+            'channels': self.channels,
+        }, sort_keys=True)
+        return hashlib.sha1(description.encode("utf-8")).hexdigest()
+        
+    def get(self, generator, envelope_params=None, **params):
+        """Get a buffer, memory-mapping it from disk when already generated"""
+        key_params = dict(params, envelope=envelope_params)
+        path = os.path.join(self.cache_dir, self._key(generator, key_params) + ".npy")
+        
+        if os.path.exists(path):
+            try:
+                return np.load(path, mmap_mode="r")
+            except (OSError, ValueError) as e:
+                print(f"Discarding unreadable sound cache file {path}: {e}")
+                
+        samples = GENERATORS[generator](sample_rate=self.sample_rate, **params)
+        if envelope_params is not None:
+            samples = envelope(samples, self.sample_rate, **envelope_params)
+        buffer = to_int16(samples, self.channels)
+        
+        self._store(path, buffer)
+        return buffer
+        
+    def _store(self, path, buffer):
+        """Write a buffer atomically so a crash never leaves a partial file"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                np.save(f, buffer)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Failed to cache sound: {e}")
\ No newline at end of file
@@ -12,6 +12,11 @@ class Config:
     FPS = 60
     TITLE = "StormRunner - 3D Adventure Game"
     
+    # Simulation timing
+    SIMULATION_RATE = 60  # fixed simulation ticks per second
+    MAX_SIMULATION_STEPS = 5  # catch-up ticks allowed per rendered frame
+    TIME_SCALE = 1.0  # simulated time per real time, >1 runs faster
+    
     # Colors
     BLACK = (0, 0, 0)
     WHITE = (255, 255, 255)
@@ -32,6 +37,10 @@ class Config:
     STORM_SKY = (47, 79, 79)
     RAIN_COLOR = (173, 216, 230)
     LIGHTNING_COLOR = (255, 255, 255)
+    HORIZON_HAZE = 0.3  # how far the sky fades to light gray at the horizon
+    
+    # Key color for transparent areas of pre-rendered world layers
+    WORLD_COLORKEY = (255, 0, 255)
     
     # Game settings
     PLAYER_SPEED = 5
@@ -44,27 +53,69 @@ class Config:
     MUSIC_VOLUME = 0.5
     SFX_VOLUME = 0.8
     
+    # Text rendering
+    TEXT_CACHE_SIZE = 256  # rendered strings kept in the shared font cache
+    
+    # Render caches
+    GRADIENT_CACHE_SIZE = 16  # gradient backgrounds kept in the shared cache
+    IMAGE_CACHE_SIZE = 32  # procedural images kept in the shared cache
+    SPRITE_CACHE_SIZE = 16  # scaled and flipped sprite sets kept in the shared cache
+    SURFACE_CACHE_SIZE = 32  # loaded images and overlays kept in the shared surface manager
+    ATLAS_SIZE = (1024, 1024)  # pixels of the shared texture atlas for small sprites
+    
+    # Startup
+    PREWARM_ON_STARTUP = True  # import heavy modules in the background while the menu shows
+    PREWARM_MODULES = ["numpy", "pygame.surfarray", "pygame.sndarray", "cv2"]
+    STARTUP_REPORT = os.environ.get("STORMRUNNER_STARTUP_REPORT") == "1"
+    
+    # Profiler settings
+    PROFILER_HISTORY = 600  # frames of samples kept for percentiles
+    PROFILER_GRAPH_SIZE = (300, 100)
+    PROFILER_GRAPH_MAX_MS = 33.3  # frame time at the top of the graph
+    PROFILER_DUMP_DIR = "profiles"
+    SURFACE_AUDIT = os.environ.get("STORMRUNNER_SURFACE_AUDIT") == "1"  # count blits that convert pixel formats
+    
+    # Saving
+    SAVE_COALESCE_DELAY = 0.25  # seconds the writer waits for further saves before writing
+    SAVE_COMPRESS_LEVEL = 0  # zlib level for save sections; 0 keeps them raw and memory-mappable
+    PROFILE_THUMB_SIZE = (48, 48)  # avatar thumbnail stored raw in each save for the profile list
+    PROFILE_PAGE_SIZE = 6  # profiles per page in the main menu
+    
     # Paths
     ASSETS_DIR = "assets"
     AUDIO_DIR = os.path.join(ASSETS_DIR, "audio")
     IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
     FONTS_DIR = os.path.join(ASSETS_DIR, "fonts")
     SAVES_DIR = "saves"
+    PROFILES_DIR = os.path.join(SAVES_DIR, "profiles")
+    CACHE_DIR = "cache"
+    SOUND_CACHE_DIR = os.path.join(CACHE_DIR, "sounds")
     
     # Avatar settings
     AVATAR_SIZE = (64, 64)
+    AVATAR_PREVIEW_SIZE = (200, 200)
     WEBCAM_WIDTH = 640
     WEBCAM_HEIGHT = 480
+    WEBCAM_QUEUE_SIZE = 2  # ready frames kept; older ones are dropped
+    WEBCAM_REPLAY_PATH = os.environ.get("STORMRUNNER_WEBCAM_REPLAY", "")  # video or .npy file used instead of the webcam
     
     # Weather settings
     WEATHER_CHANGE_INTERVAL = 30000  # 30 seconds
     RAIN_PARTICLES = 200
     LIGHTNING_DURATION = 100  # milliseconds
     
+    # World settings
+    WINDOW_LIGHT_INTERVAL = 4000  # milliseconds between window light changes
+    WORLD_CHUNK_WIDTH = 1000  # pixels per generated world chunk, a multiple of 50
+    WORLD_PRELOAD_CHUNKS = 1  # chunks generated ahead of the view on each side
+    WORLD_STREAM_THREAD = True  # generate chunks on a worker thread
+    SPATIAL_CELL_SIZE = 256  # pixels per side of a spatial index cell
+    ENTITY_CAPACITY = 64  # initial rows of the entity store, doubled as needed
+    
     @classmethod
     def create_directories(cls):
         """Create necessary directories"""
         directories = [cls.ASSETS_DIR, cls.AUDIO_DIR, cls.IMAGES_DIR, 
-                      cls.FONTS_DIR, cls.SAVES_DIR]
+                      cls.FONTS_DIR, cls.SAVES_DIR, cls.PROFILES_DIR]
         for directory in directories:
             os.makedirs(directory, exist_ok=True)
\ No newline at end of file
@@ -0,0 +1,253 @@
+"""
+Entity store with components in contiguous NumPy arrays, and the batch
+systems that run over it
+
+An entity is a row index. Each row has a flag for whether it is in use
+and a bit mask of the components the entity has, and each component is
+a set of columns shared by all entities. Systems select every entity
+with the components they need and process them in a few array
+operations instead of calling a method per object.
+"""
+
+import numpy as np
+from src.config import Config
+
+# Component bits
+POSITION = 1
+VELOCITY = 2
+COLLIDER = 4
+SPRITE = 8
+ANIMATION = 16
+
+# Columns by name and dtype
+COLUMNS = {
+    'live': np.bool_,
+    'mask': np.uint8,
+    
+    # POSITION, with last tick's for render interpolation
+    'x': np.float64,
+    'y': np.float64,
+    'prev_x': np.float64,
+    'prev_y': np.float64,
+    
+    # VELOCITY, with the horizontal damping per tick and the pull per tick
+    'vel_x': np.float64,
+    'vel_y': np.float64,
+    'friction': np.float64,
+    'gravity': np.float64,
+    
+    # COLLIDER: box size and whether it rests on the ground
+    'width': np.int32,
+    'height': np.int32,
+    'on_ground': np.bool_,
+    
+    # SPRITE: index into the store's sprite list, facing and draw layer
+    'sprite': np.int32,
+    'facing_right': np.bool_,
+    'layer': np.int8,
+    
+    # ANIMATION: current frame, time on it, frame count and frame length
+    'frame': np.int32,
+    'frame_timer': np.float64,
+    'frame_count': np.int32,
+    'frame_time': np.float64,
+}
+
+class EntityStore:
+    def __init__(self, capacity=None):
+        capacity = capacity or Config.ENTITY_CAPACITY
+        for name, dtype in COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+            
+        # Rows in use are below end; destroyed rows are reused first
+        self.end = 0
+        self.free = []
+        self.alive = 0
+        
+        # Sprite variants referenced by the sprite column
+        self.sprites = []
+        self._sprite_ids = {}
+        
+    def __len__(self):
+        return self.alive
+        
+    def _grow(self):
+        """Double the capacity of every column"""
+        for name in COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(len(column) * 2, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+            
+    def spawn(self):
+        """Create an entity with no components and return its id"""
+        if self.free:
+            entity = self.free.pop()
+        else:
+            if self.end == len(self.mask):
+                self._grow()
+            entity = self.end
+            self.end += 1
+        self.live[entity] = True
+        self.alive += 1
+        return entity
+        
+    def destroy(self, entity):
+        """Remove an entity and all its components; removed ids are ignored"""
+        if self.live[entity]:
+            self.live[entity] = False
+            self.mask[entity] = 0
+            self.free.append(entity)
+            self.alive -= 1
+            
+    def select(self, components):
+        """Get the ids of all entities having every given component"""
+        mask = self.mask[:self.end]
+        return np.flatnonzero(((mask & components) == components) & self.live[:self.end])
+        
+    def has(self, entity, components):
+        """Check whether an entity has every given component"""
+        return (int(self.mask[entity]) & components) == components
+        
+    def add_position(self, entity, x, y):
+        """Place an entity in the world"""
+        self.x[entity] = self.prev_x[entity] = x
+        self.y[entity] = self.prev_y[entity] = y
+        self.mask[entity] |= POSITION
+        
+    def add_velocity(self, entity, vel_x=0.0, vel_y=0.0, friction=1.0, gravity=0.0):
+        """Let an entity move, with horizontal friction and gravity per tick"""
+        self.vel_x[entity] = vel_x
+        self.vel_y[entity] = vel_y
+        self.friction[entity] = friction
+        self.gravity[entity] = gravity
+        self.mask[entity] |= VELOCITY
+        
+    def add_collider(self, entity, width, height):
+        """Give an entity a box that rests on the ground"""
+        self.width[entity] = width
+        self.height[entity] = height
+        self.on_ground[entity] = False
+        self.mask[entity] |= COLLIDER
+        
+    def add_sprite(self, entity, variants, layer=0):
+        """Give an entity SpriteVariants to draw, facing right"""
+        self.set_sprite(entity, variants)
+        self.facing_right[entity] = True
+        self.layer[entity] = layer
+        self.mask[entity] |= SPRITE
+        
+    def set_sprite(self, entity, variants):
+        """Switch the sprite an entity draws"""
+        sprite = self._sprite_ids.get(id(variants))
+        if sprite is None:
+            sprite = self._sprite_ids[id(variants)] = len(self.sprites)
+            self.sprites.append(variants)
+        self.sprite[entity] = sprite
+        
+    def add_animation(self, entity, frame_count=4, frame_time=200):
+        """Give an entity a walk cycle that runs while it moves"""
+        self.frame[entity] = 0
+        self.frame_timer[entity] = 0
+        self.frame_count[entity] = frame_count
+        self.frame_time[entity] = frame_time
+        self.mask[entity] |= ANIMATION
+        
+    def query(self, rect):
+        """Get the ids of collider entities overlapping a world rect"""
+        ids = self.select(POSITION | COLLIDER)
+        x = self.x[ids]
+        y = self.y[ids]
+        hit = ((x < rect.right) & (x + self.width[ids] > rect.left) &
+               (y < rect.bottom) & (y + self.height[ids] > rect.top))
+        return ids[hit]
+
+def movement_system(store, dt, ground_level, ids=None):
+    """Apply gravity, velocity, ground collision and friction for one tick"""
+    if ids is None:
+        ids = store.select(POSITION | VELOCITY)
+    if not len(ids):
+        return
+        
+    x = store.x[ids]
+    y = store.y[ids]
+    store.prev_x[ids] = x
+    store.prev_y[ids] = y
+    
+    # Gravity pulls everything not resting on the ground
+    on_ground = store.on_ground[ids]
+    vel_x = store.vel_x[ids]
+    vel_y = store.vel_y[ids] + np.where(on_ground, 0.0, store.gravity[ids])
+    
+    x += vel_x * (dt * 0.1)
+    y += vel_y * (dt * 0.1)
+    
+    # Colliders stop on the ground
+    collides = (store.mask[ids] & COLLIDER) != 0
+    floor = ground_level - store.height[ids]
+    landed = collides & (y >= floor)
+    y = np.where(landed, floor, y)
+    vel_y = np.where(landed, 0.0, vel_y)
+    store.on_ground[ids] = landed
+    
+    store.x[ids] = x
+    store.y[ids] = y
+    store.vel_x[ids] = vel_x * store.friction[ids]
+    store.vel_y[ids] = vel_y
+
+def animation_system(store, dt, ids=None):
+    """Advance walk cycles of moving entities and reset standing ones"""
+    if ids is None:
+        ids = store.select(VELOCITY | ANIMATION)
+    if not len(ids):
+        return
+        
+    moving = np.abs(store.vel_x[ids]) > 0.1
+    timer = store.frame_timer[ids] + np.where(moving, dt, 0.0)
+    advance = moving & (timer > store.frame_time[ids])
+    frame = store.frame[ids]
+    frame = np.where(advance, (frame + 1) % store.frame_count[ids], frame)
+    
+    store.frame[ids] = np.where(moving, frame, 0)
+    store.frame_timer[ids] = np.where(advance, 0.0, timer)
+
+def render_system(store, screen, camera_offset, alpha=1.0, ids=None, batch=None):
+    """Draw every on-screen sprite in layer order with one blits() call
+    
+    Positions are interpolated between the previous and current tick.
+    With a sprite batch the sprites are queued on its entity layer
+    instead. Returns the number of sprites drawn.
+    """
+    if ids is None:
+        ids = store.select(POSITION | SPRITE)
+    if not len(ids):
+        return 0
+        
+    prev_x = store.prev_x[ids]
+    prev_y = store.prev_y[ids]
+    render_x = prev_x + (store.x[ids] - prev_x) * alpha + camera_offset[0]
+    render_y = prev_y + (store.y[ids] - prev_y) * alpha + camera_offset[1]
+    
+    # Same margins as a single sprite's on-screen check
+    visible = ((render_x >= -50) & (render_x <= Config.SCREEN_WIDTH + 50) &
+               (render_y >= -100) & (render_y <= Config.SCREEN_HEIGHT + 50))
+    if not visible.any():
+        return 0
+    ids = ids[visible]
+    render_x = render_x[visible]
+    render_y = render_y[visible]
+    
+    # Lower layers first; entities keep their order within a layer
+    order = np.argsort(store.layer[ids], kind='stable')
+    sprites = store.sprites
+    blits = [(sprites[sprite].right if facing else sprites[sprite].left, (x, y))
+             for sprite, facing, x, y in zip(store.sprite[ids[order]].tolist(),
+                                              store.facing_right[ids[order]].tolist(),
+                                              render_x[order].tolist(),
+                                              render_y[order].tolist())]
+    if batch is not None:
+        from src.graphics.sprite_batch import LAYER_ENTITIES
+        batch.extend(blits, LAYER_ENTITIES)
+    else:
+        screen.blits(blits, doreturn=0)
+    return len(blits)
\ No newline at end of file
@@ -4,68 +4,110 @@ Player entity with avatar support
 
 import pygame
 import os
+import numpy as np
 from src.config import Config
+from src.graphics.font_cache import render_text
+from src.entities.ecs import EntityStore, movement_system, animation_system, SPRITE
+
+# Draw layer of the player, above other entities
+PLAYER_LAYER = 1
+
+def _column(name, kind):
+    """Property reading and writing the player's row of an entity store column"""
+    return property(lambda self: kind(getattr(self.store, name)[self.entity]),
+                    lambda self, value: getattr(self.store, name).__setitem__(self.entity, value))
 
 class Player:
-    def __init__(self, x, y, player_data):
-        self.x = x
-        self.y = y
-        self.width = 32
-        self.height = 48
+    """The player's entity in an entity store, plus input, avatar and name tag
+    
+    Physics and animation state live in the store's component arrays, so
+    the game's batch systems move the player along with every other
+    entity. Without a store the player gets one of its own.
+    """
+    
+    # Component columns of the player's entity
+    x = _column('x', float)
+    y = _column('y', float)
+    prev_x = _column('prev_x', float)
+    prev_y = _column('prev_y', float)
+    vel_x = _column('vel_x', float)
+    vel_y = _column('vel_y', float)
+    width = _column('width', int)
+    height = _column('height', int)
+    on_ground = _column('on_ground', bool)
+    facing_right = _column('facing_right', bool)
+    animation_frame = _column('frame', int)
+    animation_timer = _column('frame_timer', float)
+    
+    def __init__(self, x, y, player_data, avatar_image=None, store=None):
+        self.store = store if store is not None else EntityStore(capacity=1)
+        self.entity = self.store.spawn()
+        self._ids = np.array([self.entity])
         self.player_data = player_data
         
         # Movement
-        self.vel_x = 0
-        self.vel_y = 0
+        self.store.add_position(self.entity, x, y)
+        self.store.add_velocity(self.entity, friction=0.8, gravity=Config.GRAVITY)
+        self.store.add_collider(self.entity, 32, 48)
         self.speed = Config.PLAYER_SPEED
         self.run_speed = Config.PLAYER_RUN_SPEED
         self.is_running = False
-        self.on_ground = False
         
         # Animation
-        self.animation_frame = 0
-        self.animation_timer = 0
-        self.facing_right = True
+        self.store.add_animation(self.entity)
         
-        # Avatar
+        # Avatar, pre-scaled and pre-flipped by the shared sprite cache
         self.avatar_surface = None
-        self.load_avatar()
+        self.avatar_flipped = None
+        self.load_avatar(avatar_image)
         
         # Audio
         self.footstep_timer = 0
         
-    def load_avatar(self):
+    def load_avatar(self, avatar_image=None):
         """Load player avatar"""
+        from src.graphics.sprite_cache import get_sprite_cache, image_key
+        
+        sprite_cache = get_sprite_cache()
+        size = (self.width, self.height)
+        variants = None
         if self.player_data.get('has_avatar', False):
             avatar_path = self.player_data.get('avatar_path', '')
-            if os.path.exists(avatar_path):
+            if avatar_image is not None:
+                # RGB pixels from the save
+                from src.graphics.image_tools import to_surface
+                variants = sprite_cache.get(image_key(avatar_image), size,
+                                            lambda: to_surface(avatar_image), avatar_image)
+            elif os.path.exists(avatar_path):
                 try:
-                    # Load avatar image using pygame
-                    self.avatar_surface = pygame.image.load(avatar_path)
-                    self.avatar_surface = pygame.transform.scale(self.avatar_surface, (self.width, self.height))
+                    # Load avatar image using pygame; a newer file is a new entry
+                    key = ("file", avatar_path, os.path.getmtime(avatar_path))
+                    variants = sprite_cache.get(key, size, lambda: pygame.image.load(avatar_path))
                 except Exception as e:
                     print(f"Failed to load avatar: {e}")
-                    self.create_default_avatar()
-            else:
-                self.create_default_avatar()
-        else:
-            self.create_default_avatar()
+                    
+        if variants is None:
+            variants = self.create_default_avatar()
             
-    def create_default_avatar(self):
-        """Create default avatar"""
-        self.avatar_surface = pygame.Surface((self.width, self.height))
-        self.avatar_surface.fill(Config.BLUE)
+        # Both facings live in the shared atlas with the other small sprites
+        from src.graphics.sprite_batch import get_texture_atlas
+        variants = get_texture_atlas().pack_variants(variants)
+        self.avatar_surface = variants.right
+        self.avatar_flipped = variants.left
+        if self.store.has(self.entity, SPRITE):
+            self.store.set_sprite(self.entity, variants)
+        else:
+            self.store.add_sprite(self.entity, variants, PLAYER_LAYER)
         
-        # Simple character shape
-        pygame.draw.circle(self.avatar_surface, Config.LIGHT_GRAY, 
-                         (self.width // 2, 12), 8)  # Head
-        pygame.draw.rect(self.avatar_surface, Config.RED, 
-                        (self.width // 2 - 8, 20, 16, 20))  # Body
-        pygame.draw.rect(self.avatar_surface, Config.DARK_GRAY, 
-                        (self.width // 2 - 6, 40, 5, 8))  # Left leg
-        pygame.draw.rect(self.avatar_surface, Config.DARK_GRAY, 
-                        (self.width // 2 + 1, 40, 5, 8))  # Right leg
+    def create_default_avatar(self):
+        """Get the default avatar sprites"""
+        from src.graphics.image_tools import generate, to_surface
+        from src.graphics.sprite_cache import get_sprite_cache
         
+        # Simple character shape: head, body and legs on a blue background
+        return get_sprite_cache().get(("generated", "player_sprite"), (self.width, self.height),
+                                      lambda: to_surface(generate("player_sprite", self.width, self.height)))
+                                      
     def move_left(self, dt):
         """Move player left"""
         current_speed = self.run_speed if self.is_running else self.speed
@@ -91,62 +133,56 @@ class Player:
         self.is_running = running
         
     def update(self, dt, ground_level):
-        """Update player"""
-        # Apply gravity
-        if not self.on_ground:
-            self.vel_y += Config.GRAVITY
-            
-        # Update position
-        self.x += self.vel_x * dt * 0.1
-        self.y += self.vel_y * dt * 0.1
+        """Update the player on its own
         
-        # Ground collision
-        if self.y >= ground_level - self.height:
-            self.y = ground_level - self.height
-            self.vel_y = 0
-            self.on_ground = True
-        else:
-            self.on_ground = False
-            
-        # Screen boundaries
-        self.x = max(0, min(self.x, Config.SCREEN_WIDTH * 2 - self.width))
+        A player sharing the game's entity store is updated by the game's
+        batch systems instead.
+        """
+        movement_system(self.store, dt, ground_level, self._ids)
+        animation_system(self.store, dt, self._ids)
         
-        # Friction
-        self.vel_x *= 0.8
+    def get_render_pos(self, alpha=1.0):
+        """Get position interpolated between the previous and current tick"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+                
+    def render(self, screen, camera_offset, alpha=1.0, batch=None):
+        """Render player on its own, sprite and name tag
         
-        # Animation
-        if abs(self.vel_x) > 0.1:
-            self.animation_timer += dt
-            if self.animation_timer > 200:  # Animation speed
-                self.animation_frame = (self.animation_frame + 1) % 4
-                self.animation_timer = 0
-        else:
-            self.animation_frame = 0
-            
-    def render(self, screen, camera_offset):
-        """Render player"""
-        render_x = self.x + camera_offset[0]
-        render_y = self.y + camera_offset[1]
+        With a sprite batch the sprite and name tag are queued instead.
+        """
+        pos_x, pos_y = self.get_render_pos(alpha)
+        render_x = pos_x + camera_offset[0]
+        render_y = pos_y + camera_offset[1]
         
         # Only render if on screen
         if -50 <= render_x <= Config.SCREEN_WIDTH + 50:
             if self.avatar_surface:
-                # Flip sprite if facing left
-                if not self.facing_right:
-                    flipped_surface = pygame.transform.flip(self.avatar_surface, True, False)
-                    screen.blit(flipped_surface, (render_x, render_y))
+                # Both facings are prepared up front
+                sprite = self.avatar_surface if self.facing_right else self.avatar_flipped
+                if batch is not None:
+                    from src.graphics.sprite_batch import LAYER_ENTITIES
+                    batch.add(sprite, (render_x, render_y), LAYER_ENTITIES + PLAYER_LAYER)
                 else:
-                    screen.blit(self.avatar_surface, (render_x, render_y))
+                    screen.blit(sprite, (render_x, render_y))
             else:
                 # Fallback rectangle
                 pygame.draw.rect(screen, Config.BLUE, 
                                (render_x, render_y, self.width, self.height))
                                
-            # Player name above head
-            if self.player_data.get('player_name'):
-                font = pygame.font.Font(None, 20)
-                name_text = font.render(self.player_data['player_name'], True, Config.WHITE)
-                name_rect = name_text.get_rect(center=(render_x + self.width // 2, render_y - 10))
+            self.render_name(screen, camera_offset, alpha, batch)
+            
+    def render_name(self, screen, camera_offset, alpha=1.0, batch=None):
+        """Render the player's name above their head, or queue it on a sprite batch"""
+        if self.player_data.get('player_name'):
+            pos_x, pos_y = self.get_render_pos(alpha)
+            name_text = render_text(self.player_data['player_name'], 20, Config.WHITE)
+            name_rect = name_text.get_rect(center=(pos_x + camera_offset[0] + self.width // 2,
+                                                   pos_y + camera_offset[1] - 10))
+            if batch is not None:
+                from src.graphics.sprite_batch import LAYER_LABELS
+                batch.add(name_text, name_rect, LAYER_LABELS)
+            else:
                 screen.blit(name_text, name_rect)
                 
     def _play_footstep(self, dt):
@@ -5,6 +5,7 @@ Main game manager that handles all game states and systems
 import pygame
 import sys
 from enum import Enum
+from src.startup import startup_timer, prewarm
 
 class GameStateType(Enum):
     MAIN_MENU = "main_menu"
@@ -13,6 +14,13 @@ class GameStateType(Enum):
     PAUSED = "paused"
     GAME_OVER = "game_over"
 
+# Where each state lives; states are imported and built on first use
+STATE_REGISTRY = {
+    GameStateType.MAIN_MENU: ("src.states.main_menu", "MainMenuState"),
+    GameStateType.AVATAR_CREATION: ("src.states.avatar_creation", "AvatarCreationState"),
+    GameStateType.PLAYING: ("src.states.game_state", "GameState"),
+}
+
 class GameManager:
     def __init__(self):
         from src.config import Config
@@ -20,9 +28,29 @@ class GameManager:
         # Initialize display
         self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
         pygame.display.set_caption(Config.TITLE)
+        
+        # Debug mode renders into a target that counts format-converting blits
+        self.display = self.screen
+        self.blit_audit = None
+        if Config.SURFACE_AUDIT:
+            from src.graphics.surface_manager import BlitAudit
+            self.blit_audit = self.screen = BlitAudit(self.display)
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # Fixed-timestep simulation
+        self.tick_ms = 1000.0 / Config.SIMULATION_RATE
+        self.time_scale = Config.TIME_SCALE
+        self.accumulator = 0.0
+        self.render_alpha = 1.0
+        
+        # Replacement for live keyboard/mouse input (e.g. scripted input)
+        self.input_source = None
+        
+        # Frame profiler, toggled with F3
+        from src.profiler import FrameProfiler
+        self.profiler = FrameProfiler()
+        
         # Create necessary directories
         Config.create_directories()
         
@@ -38,33 +66,36 @@ class GameManager:
         self.current_state = None
         self.current_state_type = GameStateType.MAIN_MENU
         
-        # Initialize states
-        self._initialize_states()
-        
         # Player data
         self.player_data = self.save_manager.load_player_data()
         
-    def _initialize_states(self):
-        """Initialize all game states"""
-        from src.states.main_menu import MainMenuState
-        from src.states.avatar_creation import AvatarCreationState
-        from src.states.game_state import GameState
-        
-        self.states[GameStateType.MAIN_MENU] = MainMenuState(self)
-        self.states[GameStateType.AVATAR_CREATION] = AvatarCreationState(self)
-        self.states[GameStateType.PLAYING] = GameState(self)
+        # Only the first state is built up front
+        self.current_state = self._get_state(GameStateType.MAIN_MENU)
+        startup_timer.mark("main menu ready")
         
-        # Set initial state
-        self.current_state = self.states[GameStateType.MAIN_MENU]
+        # Warm up what later states need while the menu is showing
+        if Config.PREWARM_ON_STARTUP:
+            modules = Config.PREWARM_MODULES + [module for module, _ in STATE_REGISTRY.values()]
+            prewarm(modules, startup_timer, [self.audio_manager.prewarm])
+            
+    def _get_state(self, state_type):
+        """Get a game state, importing and creating it on first use"""
+        state = self.states.get(state_type)
+        if state is None:
+            module_name, class_name = STATE_REGISTRY[state_type]
+            module = startup_timer.timed_import(module_name)
+            state = getattr(module, class_name)(self)
+            self.states[state_type] = state
+        return state
         
     def change_state(self, new_state_type):
         """Change to a new game state"""
-        if new_state_type in self.states:
+        if new_state_type in STATE_REGISTRY:
             if self.current_state:
                 self.current_state.exit()
             
             self.current_state_type = new_state_type
-            self.current_state = self.states[new_state_type]
+            self.current_state = self._get_state(new_state_type)
             self.current_state.enter()
             
     def run(self):
@@ -73,36 +104,153 @@ class GameManager:
         
         self.current_state.enter()
         
+        profiler = self.profiler
+        first_frame_shown = False
+        
         while self.running:
-            dt = self.clock.tick(Config.FPS)
+            frame_time = self.clock.tick(Config.FPS)
+            profiler.begin_frame()
             
             # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.quit_game()
-                else:
-                    self.current_state.handle_event(event)
+            with profiler.section('events'):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.quit_game()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        profiler.toggle()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                        profiler.dump()
+                    else:
+                        self.current_state.handle_event(event)
             
-            # Update current state
-            self.current_state.update(dt)
+            # Update current state in fixed ticks
+            with profiler.section('update'):
+                self.advance_simulation(frame_time)
             
             # Render current state
-            self.screen.fill(Config.BLACK)
-            self.current_state.render(self.screen)
+            with profiler.section('render'):
+                self.screen.fill(Config.BLACK)
+                dirty_rects = self.current_state.render(self.screen)
+                
+            # The overlay covers part of the screen the state doesn't track
+            if profiler.enabled:
+                with profiler.section('profiler'):
+                    profiler.draw_overlay(self.screen)
+                dirty_rects = None
+            
+            # The audited frame still has to reach the display
+            if self.blit_audit:
+                self.display.blit(self.blit_audit, (0, 0))
+                self.blit_audit.end_frame()
+                
+            # Update display, only the changed regions when the state knows them
+            with profiler.section('flip'):
+                if dirty_rects is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(dirty_rects)
+                    
+            profiler.end_frame()
             
-            # Update display
-            pygame.display.flip()
+            if not first_frame_shown:
+                first_frame_shown = True
+                startup_timer.mark("first frame")
+                if Config.STARTUP_REPORT:
+                    print(startup_timer.report())
             
+    def advance_simulation(self, frame_time):
+        """Run as many fixed ticks as the elapsed frame time covers"""
+        from src.config import Config
+        
+        self.accumulator += frame_time * self.time_scale
+        
+        # Cap catch-up so a slow frame can't snowball into ever slower ones
+        max_accumulated = self.tick_ms * Config.MAX_SIMULATION_STEPS
+        if self.accumulator > max_accumulated:
+            self.accumulator = max_accumulated
+            
+        ticks = 0
+        while self.accumulator >= self.tick_ms:
+            self.current_state.update(self.tick_ms)
+            self.accumulator -= self.tick_ms
+            ticks += 1
+            
+        # How far rendering is between the previous and the current tick
+        self.render_alpha = self.accumulator / self.tick_ms
+        return ticks
+        
+    def simulate(self, ticks, render_every=0):
+        """Run fixed ticks back to back, as fast as the CPU allows
+        
+        Events come from input_source when one is set. Rendering happens
+        every render_every ticks, or never when it is 0. Returns the number
+        of ticks actually run.
+        """
+        self.render_alpha = 1.0
+        
+        for tick in range(ticks):
+            if not self.running:
+                return tick
+                
+            self.profiler.begin_frame()
+            
+            # Keep SDL's queue drained even though its events are ignored
+            if self.input_source:
+                pygame.event.pump()
+                events = self.input_source.poll(tick)
+            else:
+                events = pygame.event.get()
+                
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.running = False
+                else:
+                    self.current_state.handle_event(event)
+                    
+            with self.profiler.section('update'):
+                self.current_state.update(self.tick_ms)
+                
+            if render_every and tick % render_every == 0:
+                with self.profiler.section('render'):
+                    self.current_state.render(self.screen)
+                if self.blit_audit:
+                    self.blit_audit.end_frame()
+                    
+            self.profiler.end_frame()
+            
+        return ticks
+        
+    def get_pressed_keys(self):
+        """Get held keys from the input source or the live keyboard"""
+        if self.input_source:
+            return self.input_source.get_pressed()
+        return pygame.key.get_pressed()
+        
     def quit_game(self):
         """Quit the game"""
         self.save_manager.save_player_data(self.player_data)
+        
+        # Saves are written in the background; make sure this one lands
+        self.save_manager.close()
         self.running = False
         
     def get_player_data(self):
         """Get current player data"""
         return self.player_data
         
-    def set_player_data(self, data):
-        """Set player data"""
+    def set_player_data(self, data, avatar=None):
+        """Set player data, and the avatar image when it changed"""
         self.player_data = data
-        self.save_manager.save_player_data(data)
\ No newline at end of file
+        self.save_manager.save_player_data(data, avatar)
+        
+    def select_profile(self, profile_id):
+        """Switch to another player profile"""
+        self.player_data = self.save_manager.select_profile(profile_id)
+        
+    def new_profile(self):
+        """Start a fresh player profile"""
+        self.player_data = self.save_manager.new_profile()
+        
+    def get_avatar_image(self):
+        """Get the saved avatar as an RGB array, or None"""
+        return self.save_manager.load_avatar()
\ No newline at end of file
@@ -0,0 +1 @@
+# Graphics utilities package
\ No newline at end of file
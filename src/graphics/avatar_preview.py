@@ -0,0 +1,130 @@
+"""
+Incremental avatar preview pipeline that only redoes stages whose input changed
+"""
+
+from src.config import Config
+from src.graphics.frame_upload import FrameUploader
+
+# Tint colors picked by the hair and eye sliders, from 0.0 to 1.0
+HAIR_COLORS = [(40, 25, 15), (110, 70, 35), (225, 190, 120)]
+EYE_COLORS = [(90, 55, 25), (60, 130, 70), (60, 110, 200)]
+
+def adjust_skin_tone(image, tone_value):
+    """Adjust skin tone of the image"""
+    try:
+        import cv2
+        import numpy as np
+        
+        # Simple color adjustment
+        hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV)
+        
+        # Adjust saturation based on tone value
+        hsv[:, :, 1] = np.clip(hsv[:, :, 1] * (0.5 + tone_value), 0, 255)
+        
+        return cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB)
+    except:
+        return image
+
+def palette_color(palette, value):
+    """Interpolate a color along a palette for a 0.0 to 1.0 value"""
+    position = max(0.0, min(1.0, value)) * (len(palette) - 1)
+    index = min(int(position), len(palette) - 2)
+    blend = position - index
+    start, end = palette[index], palette[index + 1]
+    return tuple(start[i] + (end[i] - start[i]) * blend for i in range(3))
+
+def tint_band(image, top, bottom, color, strength):
+    """Blend a horizontal band of rows toward a color"""
+    import numpy as np
+    
+    height = image.shape[0]
+    rows = slice(int(top * height), int(bottom * height))
+    band = image[rows].astype(np.float32)
+    band += (np.asarray(color, dtype=np.float32) - band) * strength
+    image[rows] = band.astype(np.uint8)
+
+def apply_hair_and_eyes(image, hair_style, eye_color):
+    """Tint the hair and eye regions; the 0.5 defaults leave the image as is"""
+    if hair_style == 0.5 and eye_color == 0.5:
+        return image
+        
+    image = image.copy()
+    if hair_style != 0.5:
+        tint_band(image, 0.0, 0.3, palette_color(HAIR_COLORS, hair_style), 0.35)
+    if eye_color != 0.5:
+        tint_band(image, 0.38, 0.46, palette_color(EYE_COLORS, eye_color), 0.25)
+    return image
+
+class _Stage:
+    """One pipeline step that keeps its output until its key changes"""
+    
+    def __init__(self, compute):
+        self.compute = compute
+        self.key = None
+        self.value = None
+        self.version = 0
+        self.runs = 0
+        
+    def get(self, key, *inputs):
+        """Get the cached output, recomputing it when the key differs"""
+        if self.version == 0 or key != self.key:
+            self.value = self.compute(*inputs)
+            self.key = key
+            self.version += 1
+            self.runs += 1
+        return self.value
+
+class AvatarPreview:
+    """Captured image -> resize -> skin tone -> hair/eye tint -> surface
+    
+    Each stage is keyed on the version of the stage before it plus the
+    slider values it reads, so moving one slider only reruns the stages
+    from that point on and an unchanged frame reruns nothing.
+    """
+    
+    def __init__(self, size=None):
+        self.size = tuple(size or Config.AVATAR_PREVIEW_SIZE)
+        self.image = None
+        self.image_version = 0
+        self.uploader = FrameUploader()
+        
+        self.resize_stage = _Stage(self._resize)
+        self.tone_stage = _Stage(self._tone)
+        self.tint_stage = _Stage(apply_hair_and_eyes)
+        self.upload_stage = _Stage(self.uploader.upload)
+        
+    def set_image(self, image):
+        """Use a new captured image as the pipeline input"""
+        self.image = image
+        self.image_version += 1
+        
+    def _resize(self, image):
+        """Scale the captured image to the preview size"""
+        import cv2
+        return cv2.resize(image, self.size)
+        
+    def _tone(self, image, skin_tone):
+        """Apply the skin tone slider"""
+        if skin_tone == 0.5:
+            return image
+        return adjust_skin_tone(image, skin_tone)
+        
+    def get_surface(self, skin_tone=0.5, hair_style=0.5, eye_color=0.5):
+        """Get the preview surface for the current image and slider values"""
+        if self.image is None:
+            return None
+            
+        resized = self.resize_stage.get(self.image_version, self.image)
+        toned = self.tone_stage.get((self.resize_stage.version, skin_tone), resized, skin_tone)
+        tinted = self.tint_stage.get((self.tone_stage.version, hair_style, eye_color),
+                                     toned, hair_style, eye_color)
+        return self.upload_stage.get(self.tint_stage.version, tinted)
+        
+    def get_stats(self):
+        """Get how many times each stage has run"""
+        return {
+            'resize': self.resize_stage.runs,
+            'tone': self.tone_stage.runs,
+            'tint': self.tint_stage.runs,
+            'upload': self.upload_stage.runs,
+        }
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Shared font and rendered-text cache used by all states and entities
+"""
+
+import pygame
+from collections import OrderedDict
+from src.config import Config
+from src.graphics.surface_manager import prepare
+
+class FontCache:
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or Config.TEXT_CACHE_SIZE
+        
+        # Loaded fonts keyed by (font name, size)
+        self.fonts = {}
+        
+        # Rendered text surfaces in least-recently-used order
+        self.texts = OrderedDict()
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        
+    def get_font(self, size, font_name=None):
+        """Get a prebuilt font for the given size"""
+        key = (font_name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(font_name, size)
+            self.fonts[key] = font
+        return font
+        
+    def render(self, text, size, color, antialias=True, font_name=None):
+        """Get a rendered text surface, rasterising it only on a cache miss
+        
+        The returned surface is shared between callers and must not be
+        modified.
+        """
+        key = (font_name, size, text, tuple(color), antialias)
+        surface = self.texts.get(key)
+        if surface is not None:
+            self.texts.move_to_end(key)
+            self.hits += 1
+            return surface
+            
+        self.misses += 1
+        surface = prepare(self.get_font(size, font_name).render(text, antialias, color))
+        self.texts[key] = surface
+        
+        # Evict the least recently used entries
+        while len(self.texts) > self.max_entries:
+            self.texts.popitem(last=False)
+            
+        return surface
+        
+    def clear(self):
+        """Drop all cached text surfaces"""
+        self.texts.clear()
+
+# Shared instance
+_font_cache = None
+
+def get_font_cache():
+    """Get the shared font cache"""
+    global _font_cache
+    if _font_cache is None:
+        _font_cache = FontCache()
+    return _font_cache
+
+def get_font(size, font_name=None):
+    """Get a prebuilt font from the shared cache"""
+    return get_font_cache().get_font(size, font_name)
+
+def render_text(text, size, color, antialias=True, font_name=None):
+    """Render text through the shared cache"""
+    return get_font_cache().render(text, size, color, antialias, font_name)
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Reusable surfaces for showing NumPy images without per-frame allocation
+"""
+
+import pygame
+from src.graphics.surface_manager import create_surface
+
+class FrameUploader:
+    """One display-format Surface that displays row-major (height, width, channels) images
+    
+    Uploads convert into the surface's own pixels, so drawing it is a
+    plain same-format blit and nothing is allocated per frame. Arrays in
+    pygame's (width, height) surfarray layout can be uploaded as a
+    swapaxes(0, 1) view.
+    """
+    
+    FORMATS = {3: "RGB", 4: "RGBA"}
+    
+    # Red, green and blue masks of the 32-bit layout OpenCV can write directly
+    DIRECT_MASKS = (0xff0000, 0x00ff00, 0x0000ff)
+    
+    def __init__(self):
+        self.buffer = None
+        self.staging = None
+        self.surface = None
+        self.direct = False
+        
+        # Statistics
+        self.uploads = 0
+        self.allocations = 0
+        
+    def _allocate(self, shape, dtype):
+        """Create the display-format surface and the staging array feeding it"""
+        import numpy as np
+        
+        height, width, channels = shape
+        if channels not in self.FORMATS:
+            raise ValueError(f"Unsupported channel count: {channels}")
+            
+        self.surface = create_surface((width, height), alpha=channels == 4)
+        
+        # The common 32-bit layout is written in one OpenCV call; anything
+        # else goes through a staging surface that SDL converts from
+        self.direct = (channels == 3 and self.surface.get_bitsize() == 32 and
+                       self.surface.get_pitch() == width * 4 and
+                       self.surface.get_masks()[:3] == self.DIRECT_MASKS)
+        if self.direct:
+            try:
+                import cv2  # noqa: F401
+            except ImportError:
+                self.direct = False
+                
+        self.buffer = np.zeros(shape, dtype=dtype)
+        self.staging = pygame.image.frombuffer(self.buffer, (width, height), self.FORMATS[channels])
+        self.allocations += 1
+        
+    def upload(self, image):
+        """Copy an image into the shared surface and return the surface
+        
+        The same surface is returned every time, so it always shows the
+        most recent upload.
+        """
+        import numpy as np
+        
+        if image.ndim == 2:
+            image = image[:, :, None].repeat(3, axis=2)
+        if self.buffer is None or self.buffer.shape != image.shape:
+            self._allocate(image.shape, np.uint8)
+            
+        if self.direct and image.dtype == np.uint8:
+            import cv2
+            
+            # View the surface's pixels as BGRX; the view unlocks when dropped
+            height, width = image.shape[:2]
+            pixels = np.frombuffer(self.surface.get_buffer(), dtype=np.uint8).reshape(height, width, 4)
+            cv2.cvtColor(np.ascontiguousarray(image), cv2.COLOR_RGB2BGRA, dst=pixels)
+            del pixels
+        else:
+            np.copyto(self.buffer, image, casting="unsafe")
+            if image.shape[2] == 4:
+                # Add onto cleared pixels so alpha is copied, not blended
+                self.surface.fill((0, 0, 0, 0))
+                self.surface.blit(self.staging, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            else:
+                self.surface.blit(self.staging, (0, 0))
+                
+        self.uploads += 1
+        return self.surface
+        
+    def release(self):
+        """Drop the surface and its backing array"""
+        self.surface = None
+        self.staging = None
+        self.buffer = None
\ No newline at end of file
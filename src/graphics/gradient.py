@@ -0,0 +1,66 @@
+"""
+Cached gradient background surfaces generated with NumPy
+"""
+
+import pygame
+import numpy as np
+from collections import OrderedDict
+from src.config import Config
+from src.graphics.surface_manager import prepare
+
+class GradientCache:
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or Config.GRADIENT_CACHE_SIZE
+        self.surfaces = OrderedDict()
+        
+    def vertical(self, size, top_color, bottom_color):
+        """Get a vertical gradient surface, generating it only when new
+        
+        The returned surface is shared between callers and must not be
+        modified.
+        """
+        key = (tuple(size), tuple(top_color), tuple(bottom_color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+            
+        surface = self._create_vertical(size, top_color, bottom_color)
+        self.surfaces[key] = surface
+        
+        # Evict the least recently used gradients
+        while len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+            
+        return surface
+        
+    def _create_vertical(self, size, top_color, bottom_color):
+        """Generate a vertical gradient surface in one NumPy pass"""
+        width, height = size
+        
+        # One color per row, then stretch the single column across the width
+        ratio = (np.arange(height, dtype=np.float64) / height)[:, None]
+        top = np.asarray(top_color[:3], dtype=np.float64)
+        bottom = np.asarray(bottom_color[:3], dtype=np.float64)
+        column = (top * (1 - ratio) + bottom * ratio).astype(np.uint8)
+        
+        column_surface = pygame.surfarray.make_surface(column[None, :, :])
+        return prepare(pygame.transform.scale(column_surface, (width, height)))
+        
+    def clear(self):
+        """Drop all cached gradients"""
+        self.surfaces.clear()
+
+# Shared instance
+_gradient_cache = None
+
+def get_gradient_cache():
+    """Get the shared gradient cache"""
+    global _gradient_cache
+    if _gradient_cache is None:
+        _gradient_cache = GradientCache()
+    return _gradient_cache
+
+def vertical_gradient(size, top_color, bottom_color):
+    """Get a vertical gradient surface from the shared cache"""
+    return get_gradient_cache().vertical(size, top_color, bottom_color)
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Procedural image toolkit built on NumPy broadcasting
+
+Images are row-major (height, width, 3) uint8 arrays, the layout
+FrameUploader and OpenCV use. Shapes are described in normalised
+coordinates from 0.0 to 1.0 so the same recipe works at any size, and
+masks are float arrays where 1.0 is fully inside the shape.
+"""
+
+import numpy as np
+from collections import OrderedDict
+from src.config import Config
+
+def grid(width, height):
+    """Get normalised pixel-centre coordinates as broadcastable row and column"""
+    xs = (np.arange(width, dtype=np.float32) + 0.5) / width
+    ys = (np.arange(height, dtype=np.float32) + 0.5) / height
+    return xs[None, :], ys[:, None]
+
+def to_image(pixels):
+    """Clamp float pixels to a uint8 image"""
+    return np.clip(pixels, 0, 255).astype(np.uint8)
+
+def _as_float(color):
+    """Get a color as a float array"""
+    return np.asarray(color[:3], dtype=np.float32)
+
+def fill(width, height, color):
+    """Get a single-color image"""
+    image = np.empty((height, width, 3), dtype=np.float32)
+    image[:] = color[:3]
+    return image
+
+def linear_gradient(width, height, start, end, direction=(0.0, 1.0)):
+    """Get a gradient from start to end along a direction vector"""
+    xs, ys = grid(width, height)
+    dx, dy = direction
+    
+    # Project onto the direction, then stretch so the corners reach 0 and 1
+    t = xs * dx + ys * dy
+    low = min(0.0, dx) + min(0.0, dy)
+    high = max(0.0, dx) + max(0.0, dy)
+    t = (t - low) / max(high - low, 1e-6)
+    
+    start = _as_float(start)
+    end = _as_float(end)
+    return start + (end - start) * t[:, :, None]
+
+def bilinear_gradient(width, height, top_left, top_right, bottom_left, bottom_right):
+    """Get a gradient blending four corner colors"""
+    xs, ys = grid(width, height)
+    xs = xs[:, :, None]
+    ys = ys[:, :, None]
+    corners = [_as_float(color) for color in (top_left, top_right, bottom_left, bottom_right)]
+    top = corners[0] + (corners[1] - corners[0]) * xs
+    bottom = corners[2] + (corners[3] - corners[2]) * xs
+    return top + (bottom - top) * ys
+
+def ellipse_mask(width, height, center, radii, softness=0.0):
+    """Get a mask of an ellipse, optionally fading out over its edge"""
+    xs, ys = grid(width, height)
+    distance = np.sqrt(((xs - center[0]) / radii[0]) ** 2 + ((ys - center[1]) / radii[1]) ** 2)
+    if softness <= 0:
+        return (distance <= 1.0).astype(np.float32)
+    return np.clip((1.0 + softness - distance) / softness, 0.0, 1.0)
+
+def rect_mask(width, height, rect):
+    """Get a mask of a (left, top, width, height) rectangle"""
+    xs, ys = grid(width, height)
+    left, top, rect_width, rect_height = rect
+    inside_x = (xs >= left) & (xs < left + rect_width)
+    inside_y = (ys >= top) & (ys < top + rect_height)
+    return (inside_x & inside_y).astype(np.float32)
+
+def silhouette_mask(width, height, softness=0.05):
+    """Get a head-and-shoulders silhouette centred in the image"""
+    head = ellipse_mask(width, height, (0.5, 0.38), (0.17, 0.22), softness)
+    shoulders = ellipse_mask(width, height, (0.5, 1.05), (0.38, 0.42), softness)
+    return np.maximum(head, shoulders)
+
+def _interpolation_weights(size, cells):
+    """Get a (size, cells + 1) matrix of smoothstep weights onto lattice points"""
+    position = (np.arange(size, dtype=np.float32) + 0.5) / size * cells
+    index = np.minimum(position.astype(np.int32), cells - 1)
+    t = position - index
+    
+    # Smoothstep weights hide the lattice lines
+    t = t * t * (3 - 2 * t)
+    weights = np.zeros((size, cells + 1), dtype=np.float32)
+    rows = np.arange(size)
+    weights[rows, index] = 1 - t
+    weights[rows, index + 1] = t
+    return weights
+
+def value_noise(width, height, cells=8, seed=0):
+    """Get smooth 0 to 1 noise by interpolating a random lattice"""
+    rng = np.random.default_rng(seed)
+    lattice = rng.random((cells + 1, cells + 1), dtype=np.float32)
+    
+    # Interpolation is separable, so it is two small matrix products
+    return _interpolation_weights(height, cells) @ lattice @ _interpolation_weights(width, cells).T
+
+def palette_map(values, palette):
+    """Map 0 to 1 values to colors interpolated along a palette"""
+    stops = np.linspace(0.0, 1.0, len(palette))
+    colors = np.asarray(palette, dtype=np.float32)[:, :3]
+    return np.stack([np.interp(values, stops, colors[:, c]) for c in range(3)], axis=-1).astype(np.float32)
+
+def composite(image, color, mask, strength=1.0):
+    """Blend a color over an image wherever the mask is set"""
+    weight = (mask * strength)[:, :, None]
+    return image + (_as_float(color) - image) * weight
+
+def tint(image, color, strength=0.5):
+    """Blend a whole image toward a color"""
+    return image + (_as_float(color) - image) * strength
+
+def resample_nearest(image, width, height):
+    """Scale an image to a new size by picking the nearest source pixels"""
+    source_height, source_width = image.shape[:2]
+    rows = (np.arange(height) * source_height // height)[:, None]
+    columns = (np.arange(width) * source_width // width)[None, :]
+    return np.ascontiguousarray(image[rows, columns])
+
+def default_avatar(width, height, seed=0):
+    """Get the placeholder avatar shown when no photo can be taken"""
+    image = bilinear_gradient(width, height, (100, 150, 200), (166, 150, 200),
+                              (100, 216, 200), (166, 216, 200))
+                              
+    # Faint texture so the gradient doesn't band, then a soft silhouette
+    image += (value_noise(width, height, 6, seed)[:, :, None] - 0.5) * 16
+    image = composite(image, (40, 55, 90), silhouette_mask(width, height), 0.85)
+    return to_image(image)
+
+def player_sprite(width, height):
+    """Get the default player character sprite"""
+    image = fill(width, height, Config.BLUE)
+    image = composite(image, Config.LIGHT_GRAY, ellipse_mask(width, height, (0.5, 0.25), (0.25, 1 / 6)))
+    image = composite(image, Config.RED, rect_mask(width, height, (0.25, 5 / 12, 0.5, 5 / 12)))
+    image = composite(image, Config.DARK_GRAY, rect_mask(width, height, (0.3125, 5 / 6, 5 / 32, 1 / 6)))
+    image = composite(image, Config.DARK_GRAY, rect_mask(width, height, (0.53125, 5 / 6, 5 / 32, 1 / 6)))
+    return to_image(image)
+
+GENERATORS = {
+    "default_avatar": default_avatar,
+    "player_sprite": player_sprite,
+}
+
+class ImageCache:
+    """Generated images kept by recipe and parameters"""
+    
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or Config.IMAGE_CACHE_SIZE
+        self.images = OrderedDict()
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        
+    def get(self, generator, *args, **kwargs):
+        """Get a generated image, building it only on a cache miss
+        
+        The returned array is shared between callers and read-only.
+        """
+        key = (generator, args, tuple(sorted(kwargs.items())))
+        image = self.images.get(key)
+        if image is not None:
+            self.images.move_to_end(key)
+            self.hits += 1
+            return image
+            
+        self.misses += 1
+        image = GENERATORS[generator](*args, **kwargs)
+        image.flags.writeable = False
+        self.images[key] = image
+        if len(self.images) > self.max_entries:
+            self.images.popitem(last=False)
+        return image
+        
+    def clear(self):
+        """Drop all cached images"""
+        self.images.clear()
+
+_image_cache = None
+
+def get_image_cache():
+    """Get the shared image cache"""
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = ImageCache()
+    return _image_cache
+
+def generate(generator, *args, **kwargs):
+    """Get a cached generated image from the shared cache"""
+    return get_image_cache().get(generator, *args, **kwargs)
+
+def to_surface(image):
+    """Get a new display-format Surface holding a copy of an image"""
+    from src.graphics.surface_manager import get_surface_manager
+    return get_surface_manager().from_image(image)
\ No newline at end of file
@@ -0,0 +1,250 @@
+"""
+Texture atlas for small opaque sprites and a layered sprite batch
+
+Sprites packed into the atlas are subsurfaces of one display-format
+surface, so they blit like any other surface while sharing its pixels.
+A SpriteBatch collects a frame's blits by layer and submits them lowest
+layer first in a single Surface.blits() call.
+"""
+
+import pygame
+from collections import deque
+from src.config import Config
+from src.graphics.surface_manager import create_surface
+
+# Batch layers, drawn lowest first
+LAYER_BACKGROUND = 0
+LAYER_WORLD = 10
+LAYER_ENTITIES = 20
+LAYER_LABELS = 30
+
+class TextureAtlas:
+    """Opaque images packed on shelves into one display-format surface
+    
+    Released images leave holes; when a new image doesn't fit, the live
+    images are repacked onto a fresh surface. Subsurfaces handed out
+    earlier keep the old surface alive and stay valid. Images that still
+    don't fit, and images with per-pixel alpha, are handed back as they
+    are.
+    """
+    
+    def __init__(self, size=None, padding=1):
+        self.size = size or Config.ATLAS_SIZE
+        self.padding = padding
+        self.surface = None
+        
+        # Packed subsurfaces by key, and the keys and packed copy of
+        # sprite variants by the id of the (cached) variants
+        self.regions = {}
+        self.variants = {}
+        
+        # Shelf being filled: its top, its height and the next free x
+        self._shelf_y = 0
+        self._shelf_height = 0
+        self._x = 0
+        
+        # Statistics
+        self.packed_area = 0
+        self.released_area = 0
+        self.repacks = 0
+        self.overflow = 0
+        
+    def _place(self, width, height):
+        """Reserve space on the shelves, or get None when it's full"""
+        atlas_width, atlas_height = self.size
+        x, shelf_y, shelf_height = self._x, self._shelf_y, self._shelf_height
+        if x + width > atlas_width:
+            # Start a new shelf below the current one
+            shelf_y += shelf_height + self.padding
+            shelf_height = 0
+            x = 0
+        if width > atlas_width or shelf_y + height > atlas_height:
+            return None
+            
+        self._x = x + width + self.padding
+        self._shelf_y = shelf_y
+        self._shelf_height = max(shelf_height, height)
+        return (x, shelf_y)
+        
+    def _copy_in(self, image, position):
+        """Copy an image to a position and get the subsurface holding it"""
+        if self.surface is None:
+            self.surface = create_surface(self.size)
+        self.surface.blit(image, position)
+        return self.surface.subsurface((position, image.get_size()))
+        
+    def _repack(self):
+        """Move the live images onto a fresh surface, dropping released space"""
+        live = sorted(self.regions.items(), key=lambda item: -item[1].get_height())
+        self.surface = None
+        self._shelf_y = 0
+        self._shelf_height = 0
+        self._x = 0
+        for key, region in live:
+            position = self._place(*region.get_size())
+            if position is None:
+                # Its holders keep the old surface
+                del self.regions[key]
+                self.packed_area -= region.get_width() * region.get_height()
+            else:
+                self.regions[key] = self._copy_in(region, position)
+        self.released_area = 0
+        self.repacks += 1
+        
+        # Packed variants follow their regions
+        for keys, packed in self.variants.values():
+            packed.right = self.regions.get(keys[0], packed.right)
+            packed.left = self.regions.get(keys[1], packed.left)
+            
+    def add(self, key, image):
+        """Copy an image into the atlas and get the subsurface holding it"""
+        region = self.regions.get(key)
+        if region is not None:
+            return region
+            
+        if image.get_flags() & pygame.SRCALPHA:
+            return image
+            
+        width, height = image.get_size()
+        position = self._place(width, height)
+        if position is None and self.released_area:
+            self._repack()
+            position = self._place(width, height)
+        if position is None:
+            self.overflow += 1
+            return image
+            
+        region = self.regions[key] = self._copy_in(image, position)
+        self.packed_area += width * height
+        return region
+        
+    def release(self, key):
+        """Free an image's space for the next repack"""
+        region = self.regions.pop(key, None)
+        if region is not None:
+            area = region.get_width() * region.get_height()
+            self.packed_area -= area
+            self.released_area += area
+            
+    def pack_variants(self, variants):
+        """Get SpriteVariants with both facings packed into the atlas
+        
+        variants should come from the shared sprite cache, which releases
+        them from the atlas when it evicts them. The packed copy doesn't
+        keep the source image alive.
+        """
+        from src.graphics.sprite_cache import SpriteVariants
+        
+        entry = self.variants.get(id(variants))
+        if entry is not None:
+            return entry[1]
+            
+        keys = (("variants", id(variants), "right"), ("variants", id(variants), "left"))
+        packed = SpriteVariants(self.add(keys[0], variants.right),
+                                self.add(keys[1], variants.left))
+        self.variants[id(variants)] = (keys, packed)
+        return packed
+        
+    def release_variants(self, variants):
+        """Free both facings of sprite variants packed by pack_variants()"""
+        entry = self.variants.pop(id(variants), None)
+        if entry is not None:
+            for key in entry[0]:
+                self.release(key)
+                
+    def clear(self):
+        """Drop every packed image and start packing from the top again"""
+        self.surface = None
+        self.regions.clear()
+        self.variants.clear()
+        self._shelf_y = 0
+        self._shelf_height = 0
+        self._x = 0
+        self.packed_area = 0
+        self.released_area = 0
+        
+    def get_stats(self):
+        """Get packed image counts and how much of the atlas is used"""
+        return {
+            'images': len(self.regions),
+            'used': self.packed_area / (self.size[0] * self.size[1]),
+            'repacks': self.repacks,
+            'overflow': self.overflow,
+        }
+
+class SpriteBatch:
+    """A frame's blits collected by layer and drawn in one blits() call"""
+    
+    def __init__(self, history=None):
+        # Blit items, (surface, position) or (surface, position, area), by layer
+        self.layers = {}
+        
+        # Counts for the frame being drawn, and for recent frames
+        self.draw_calls = 0
+        self.blit_count = 0
+        self.frame_draw_calls = deque(maxlen=history or Config.PROFILER_HISTORY)
+        self.frame_blits = deque(maxlen=history or Config.PROFILER_HISTORY)
+        
+    def add(self, surface, position, layer=0, area=None):
+        """Queue one blit"""
+        item = (surface, position) if area is None else (surface, position, area)
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        items.append(item)
+        
+    def extend(self, items, layer=0):
+        """Queue blit items in order, as passed to Surface.blits()"""
+        queued = self.layers.get(layer)
+        if queued is None:
+            self.layers[layer] = list(items)
+        else:
+            queued.extend(items)
+            
+    def flush(self, target):
+        """Draw everything queued onto a surface, lowest layer first"""
+        if not self.layers:
+            return
+            
+        layers = self.layers
+        self.layers = {}
+        if len(layers) == 1:
+            items = next(iter(layers.values()))
+        else:
+            items = []
+            for layer in sorted(layers):
+                items.extend(layers[layer])
+        target.blits(items, doreturn=0)
+        self.draw_calls += 1
+        self.blit_count += len(items)
+        
+    def end_frame(self):
+        """Close the current frame's counts"""
+        self.frame_draw_calls.append(self.draw_calls)
+        self.frame_blits.append(self.blit_count)
+        self.draw_calls = 0
+        self.blit_count = 0
+        
+    def get_stats(self):
+        """Get draw calls and blits of the last frame and on average"""
+        frames = len(self.frame_blits)
+        return {
+            'frames': frames,
+            'last_draw_calls': self.frame_draw_calls[-1] if frames else 0,
+            'last_blits': self.frame_blits[-1] if frames else 0,
+            'avg_draw_calls': sum(self.frame_draw_calls) / frames if frames else 0.0,
+            'avg_blits': sum(self.frame_blits) / frames if frames else 0.0,
+        }
+
+# Shared instance
+_texture_atlas = None
+
+def get_texture_atlas():
+    """Get the shared texture atlas, freeing sprites the sprite cache evicts"""
+    global _texture_atlas
+    if _texture_atlas is None:
+        from src.graphics.sprite_cache import get_sprite_cache
+        
+        _texture_atlas = TextureAtlas()
+        get_sprite_cache().eviction_listeners.append(_texture_atlas.release_variants)
+    return _texture_atlas
\ No newline at end of file
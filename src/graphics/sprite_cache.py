@@ -0,0 +1,95 @@
+"""
+Shared cache of ready-to-blit sprite variants
+
+Each source image is loaded once, then scaled, flipped and converted to
+the display's pixel format up front, so drawing a sprite is a single
+blit with no per-frame transforms or format conversion.
+"""
+
+import pygame
+from collections import OrderedDict
+from src.config import Config
+from src.graphics.surface_manager import prepare
+
+def image_key(image):
+    """Get a cache key for a read-only image array
+    
+    Hashing the pixels costs more than rebuilding a small sprite, so
+    arrays are keyed by identity; the cache keeps the array alive with
+    its entry so the id can't be reused while the key is in use.
+    """
+    return ("image", id(image))
+
+class SpriteVariants:
+    """A sprite facing right and its mirror image facing left"""
+    
+    __slots__ = ('right', 'left', 'source')
+    
+    def __init__(self, right, left, source=None):
+        self.right = right
+        self.left = left
+        self.source = source
+
+class SpriteCache:
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or Config.SPRITE_CACHE_SIZE
+        
+        # Variants keyed by (source key, size) in least-recently-used order
+        self.sprites = OrderedDict()
+        
+        # Called with each SpriteVariants that leaves the cache
+        self.eviction_listeners = []
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        
+    def get(self, key, size, load, source=None):
+        """Get the variants of a sprite, calling load() for its source only on a miss
+        
+        key identifies the source image and load returns it as a Surface.
+        source is kept alive with the entry, for keys built by image_key().
+        The returned surfaces are shared between callers and must not be
+        modified.
+        """
+        cache_key = (key, tuple(size))
+        variants = self.sprites.get(cache_key)
+        if variants is not None:
+            self.sprites.move_to_end(cache_key)
+            self.hits += 1
+            return variants
+            
+        self.misses += 1
+        scaled = pygame.transform.scale(load(), size)
+        variants = SpriteVariants(prepare(scaled),
+                                  prepare(pygame.transform.flip(scaled, True, False)),
+                                  source)
+        self.sprites[cache_key] = variants
+        
+        # Evict the least recently used entries
+        while len(self.sprites) > self.max_entries:
+            self._evicted(self.sprites.popitem(last=False)[1])
+            
+        return variants
+        
+    def _evicted(self, variants):
+        """Tell listeners a sprite left the cache"""
+        for listener in self.eviction_listeners:
+            listener(variants)
+            
+    def clear(self):
+        """Drop all cached sprites"""
+        evicted = list(self.sprites.values())
+        self.sprites.clear()
+        for variants in evicted:
+            self._evicted(variants)
+
+# Shared instance
+_sprite_cache = None
+
+def get_sprite_cache():
+    """Get the shared sprite cache"""
+    global _sprite_cache
+    if _sprite_cache is None:
+        _sprite_cache = SpriteCache()
+    return _sprite_cache
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+Shared creation, loading and caching of display-format surfaces
+
+A blit between surfaces of different pixel formats converts every pixel
+on the way. Surfaces made through here match the display's format (with
+per-pixel alpha only where asked for), so blitting them is a plain copy
+or blend. BlitAudit is a debug render target that counts the blits that
+still take the converting path.
+"""
+
+import os
+import pygame
+from collections import OrderedDict, Counter, deque
+from src.config import Config
+
+def is_display_format(surface, target=None):
+    """Check whether blitting a surface onto the target needs no format conversion"""
+    target = target or pygame.display.get_surface()
+    if target is None:
+        return True
+    return (surface.get_bitsize() == target.get_bitsize() and
+            surface.get_masks()[:3] == target.get_masks()[:3])
+
+def prepare(surface):
+    """Get a surface in the display's pixel format, keeping per-pixel alpha"""
+    if pygame.display.get_surface() is None:
+        # No display yet (headless tools); keep the surface as it is
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+class SurfaceManager:
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or Config.SURFACE_CACHE_SIZE
+        
+        # Loaded images and overlays in least-recently-used order
+        self.surfaces = OrderedDict()
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        
+    def create(self, size, alpha=False, colorkey=None):
+        """Create a new display-format surface
+        
+        alpha gives it per-pixel alpha; colorkey fills it with that color
+        and makes it transparent, with RLE acceleration.
+        """
+        if alpha:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            surface = pygame.Surface(size)
+        surface = prepare(surface)
+        if colorkey is not None:
+            surface.fill(colorkey)
+            surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        return surface
+        
+    def from_image(self, image):
+        """Create a display-format surface from a row-major RGB array"""
+        return prepare(pygame.surfarray.make_surface(image.swapaxes(0, 1)))
+        
+    def _cached(self, key, build):
+        """Get a cached surface, building it only on a miss"""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+            
+        self.misses += 1
+        surface = build()
+        self.surfaces[key] = surface
+        
+        # Evict the least recently used entries
+        while len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+            
+        return surface
+        
+    def load(self, path):
+        """Load an image file as a display-format surface
+        
+        Files are cached by path and modification time. The returned
+        surface is shared between callers and must not be modified.
+        """
+        key = ("file", path, os.path.getmtime(path))
+        return self._cached(key, lambda: prepare(pygame.image.load(path)))
+        
+    def overlay(self, size, color, alpha):
+        """Get a translucent single-color surface for full-screen effects
+        
+        The returned surface is shared between callers and must not be
+        modified.
+        """
+        def build():
+            surface = self.create(size)
+            surface.fill(color)
+            surface.set_alpha(alpha)
+            return surface
+        return self._cached(("overlay", tuple(size), tuple(color), alpha), build)
+        
+    def clear(self):
+        """Drop all cached surfaces"""
+        self.surfaces.clear()
+
+class BlitAudit(pygame.Surface):
+    """Off-screen render target that counts blits needing format conversion
+    
+    It has the display's size and format. The game renders into it and
+    copies it to the display each frame, so debug runs see every blit.
+    """
+    
+    def __init__(self, display, history=None):
+        super().__init__(display.get_size(), 0, display)
+        self.blit_count = 0
+        self.slow_count = 0
+        self.frame_slow = deque(maxlen=history or Config.PROFILER_HISTORY)
+        
+        # Converting sources by (size, bits per pixel, flags), reported once each
+        self.slow_sources = Counter()
+        
+    def _audit(self, source):
+        """Count one blit from a source surface"""
+        self.blit_count += 1
+        if not is_display_format(source, self):
+            self.slow_count += 1
+            signature = (source.get_size(), source.get_bitsize(), source.get_flags())
+            if signature not in self.slow_sources:
+                print(f"Slow blit: {signature[0][0]}x{signature[0][1]} surface, "
+                      f"{signature[1]}-bit, flags {signature[2]:#x}")
+            self.slow_sources[signature] += 1
+            
+    def blit(self, source, dest, area=None, special_flags=0):
+        self._audit(source)
+        return super().blit(source, dest, area, special_flags)
+        
+    def blits(self, blit_sequence, doreturn=1):
+        blit_sequence = list(blit_sequence)
+        for item in blit_sequence:
+            self._audit(item[0])
+        return super().blits(blit_sequence, doreturn)
+        
+    def end_frame(self):
+        """Close the current frame's count"""
+        self.frame_slow.append(self.slow_count)
+        self.slow_count = 0
+        
+    def get_stats(self):
+        """Get blit totals and per-frame slow blit counts"""
+        return {
+            'blits': self.blit_count,
+            'slow_blits': sum(self.slow_sources.values()),
+            'last_frame_slow': self.frame_slow[-1] if self.frame_slow else 0,
+            'max_frame_slow': max(self.frame_slow, default=0),
+        }
+
+# Shared instance
+_surface_manager = None
+
+def get_surface_manager():
+    """Get the shared surface manager"""
+    global _surface_manager
+    if _surface_manager is None:
+        _surface_manager = SurfaceManager()
+    return _surface_manager
+
+def create_surface(size, alpha=False, colorkey=None):
+    """Create a display-format surface through the shared manager"""
+    return get_surface_manager().create(size, alpha, colorkey)
+
+def load_image(path):
+    """Load a cached display-format image through the shared manager"""
+    return get_surface_manager().load(path)
+
+def overlay_surface(size, color, alpha):
+    """Get a cached translucent overlay through the shared manager"""
+    return get_surface_manager().overlay(size, color, alpha)
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""
+Headless, unthrottled simulation runner for batch runs and soak tests
+
+Usage:
+    python -m src.headless --ticks 216000 --seed 1 --script input.json
+    python -m src.headless --ticks 216000 --seed 1 --jobs 8
+
+A script is a JSON list of [tick, action, key] entries, where action is
+"down", "up" or "press" and key is a pygame key name such as "d",
+"space" or "left shift":
+
+    [[0, "down", "d"], [120, "press", "space"], [600, "up", "d"]]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+class PressedKeys:
+    """Held-key lookup compatible with pygame.key.get_pressed()"""
+    
+    def __init__(self, keys):
+        self.keys = keys
+        
+    def __getitem__(self, key):
+        return key in self.keys
+
+class ScriptedInput:
+    """Keyboard input replayed from a tick-indexed script"""
+    
+    def __init__(self, script=None):
+        import pygame
+        
+        # Events to deliver keyed by tick
+        self.events = {}
+        self.held_keys = set()
+        
+        for tick, action, key_name in script or []:
+            key = pygame.key.key_code(key_name)
+            if action in ("down", "press"):
+                self._add_event(tick, pygame.KEYDOWN, key)
+            if action in ("up", "press"):
+                self._add_event(tick + 1 if action == "press" else tick, pygame.KEYUP, key)
+                
+    @classmethod
+    def load(cls, path):
+        """Load a script from a JSON file"""
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+            
+    def _add_event(self, tick, event_type, key):
+        """Queue a key event for a tick"""
+        import pygame
+        event = pygame.event.Event(event_type, key=key, unicode='', mod=0, scancode=0)
+        self.events.setdefault(tick, []).append(event)
+        
+    def poll(self, tick):
+        """Get events for a tick and update the held keys"""
+        import pygame
+        
+        events = self.events.get(tick, [])
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self.held_keys.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self.held_keys.discard(event.key)
+        return events
+        
+    def get_pressed(self):
+        """Get currently held keys"""
+        return PressedKeys(self.held_keys)
+
+class HeadlessRunner:
+    def __init__(self, seed=0, script=None, render_every=0, start_state="playing", audit_blits=False):
+        self.seed = seed
+        self.script = script
+        self.render_every = render_every
+        self.start_state = start_state
+        self.audit_blits = audit_blits
+        self.game_manager = None
+        
+    def setup(self):
+        """Start pygame on dummy drivers and build a seeded game"""
+        # Must be set before pygame initialises its subsystems
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        
+        import pygame
+        pygame.init()
+        try:
+            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        except pygame.error as e:
+            print(f"Audio unavailable in headless mode: {e}")
+            
+        random.seed(self.seed)
+        try:
+            import numpy as np
+            np.random.seed(self.seed)
+        except ImportError:
+            pass
+            
+        # No menu to hide loading behind, and background work skews timings
+        from src.config import Config
+        Config.PREWARM_ON_STARTUP = False
+        Config.WORLD_STREAM_THREAD = False
+        if self.audit_blits:
+            Config.SURFACE_AUDIT = True
+        
+        from src.game_manager import GameManager, GameStateType
+        self.game_manager = GameManager()
+        self.game_manager.input_source = ScriptedInput(self.script)
+        self.game_manager.change_state(GameStateType(self.start_state))
+        return self.game_manager
+        
+    def run(self, ticks):
+        """Run the simulation and report its throughput"""
+        if self.game_manager is None:
+            self.setup()
+            
+        start = time.perf_counter()
+        ticks_run = self.game_manager.simulate(ticks, self.render_every)
+        elapsed = time.perf_counter() - start
+        
+        report = {
+            'seed': self.seed,
+            'ticks': ticks_run,
+            'seconds': elapsed,
+            'ticks_per_second': ticks_run / elapsed if elapsed > 0 else 0.0,
+            'simulated_seconds': ticks_run * self.game_manager.tick_ms / 1000.0,
+        }
+        if self.game_manager.blit_audit:
+            report['blits'] = self.game_manager.blit_audit.get_stats()
+        sprite_batch = getattr(self.game_manager.current_state, 'sprite_batch', None)
+        if sprite_batch is not None and sprite_batch.frame_blits:
+            report['sprites'] = sprite_batch.get_stats()
+        return report
+        
+    def close(self):
+        """Shut pygame down
+        
+        This also restores SDL's signal handlers, so pool workers can be
+        terminated normally afterwards.
+        """
+        import pygame
+        if self.game_manager:
+            self.game_manager.save_manager.close()
+        pygame.quit()
+        self.game_manager = None
+
+def _run_job(job):
+    """Run one headless simulation (multiprocessing entry point)"""
+    seed, ticks, script, render_every, start_state, audit_blits = job
+    runner = HeadlessRunner(seed, script, render_every, start_state, audit_blits)
+    try:
+        return runner.run(ticks)
+    finally:
+        runner.close()
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Run StormRunner headless")
+    parser.add_argument("--ticks", type=int, default=3600, help="simulation ticks per run")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the first run")
+    parser.add_argument("--script", help="JSON input script")
+    parser.add_argument("--render-every", type=int, default=0,
+                        help="render every N ticks (0 never renders)")
+    parser.add_argument("--state", default="playing", help="state to start in")
+    parser.add_argument("--jobs", type=int, default=1, help="parallel runs with consecutive seeds")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--audit-blits", action="store_true",
+                        help="count blits that convert pixel formats (needs --render-every)")
+    args = parser.parse_args(argv)
+    
+    script = None
+    if args.script:
+        with open(args.script, 'r') as f:
+            script = json.load(f)
+            
+    jobs = [(args.seed + i, args.ticks, script, args.render_every, args.state, args.audit_blits)
+            for i in range(args.jobs)]
+    if args.jobs > 1:
+        from multiprocessing import Pool
+        with Pool(args.jobs) as pool:
+            reports = pool.map(_run_job, jobs)
+    else:
+        reports = [_run_job(jobs[0])]
+        
+    for report in reports:
+        print(f"seed {report['seed']}: {report['ticks']} ticks in {report['seconds']:.2f}s "
+              f"({report['ticks_per_second']:.0f} ticks/s, "
+              f"{report['simulated_seconds']:.0f}s of game time)")
+        if 'blits' in report:
+            blits = report['blits']
+            print(f"  {blits['blits']} blits, {blits['slow_blits']} converting pixel formats "
+                  f"(at most {blits['max_frame_slow']} in one frame)")
+        if 'sprites' in report:
+            sprites = report['sprites']
+            print(f"  sprite batch: {sprites['avg_draw_calls']:.1f} draw calls and "
+                  f"{sprites['avg_blits']:.1f} blits per frame over {sprites['frames']} frames")
+              
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(reports, f, indent=2)
+            
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,237 @@
+"""
+Multi-profile save store with a fixed-size record index
+
+Each profile is a save container in its own file. The index holds one
+fixed-size record per profile with what a profile list needs, so listing
+thousands of profiles is one read, and a save rewrites only its own
+record. Thumbnails are read straight from the profile file at the offset
+the index records, without parsing the container.
+"""
+
+import os
+import glob
+import struct
+import threading
+import numpy as np
+from src.config import Config
+
+INDEX_MAGIC = b"SRPI"
+INDEX_VERSION = 1
+
+# Magic, version, record size, record count, last played profile id
+INDEX_HEADER = struct.Struct("<4sHHII")
+
+RECORD_DTYPE = np.dtype([
+    ('id', '<u4'),
+    ('flags', '<u4'),
+    ('last_played', '<f8'),
+    ('high_score', '<i8'),
+    ('thumb_offset', '<u8'),
+    ('thumb_width', '<u2'),
+    ('thumb_height', '<u2'),
+    ('reserved', '<u4'),
+    ('name', 'S32'),
+])
+
+# Record flags
+FLAG_DELETED = 1
+
+class ProfileStore:
+    def __init__(self, directory=None):
+        self.directory = directory or Config.PROFILES_DIR
+        self.index_file = os.path.join(self.directory, "profiles.idx")
+        self._lock = threading.Lock()
+        
+        # In-memory copy of the index and where each profile's record lives
+        self.records = np.zeros(0, dtype=RECORD_DTYPE)
+        self.slots = {}
+        self.last_profile_id = 0
+        self._load_index()
+        
+    def profile_path(self, profile_id):
+        """Get the save file of a profile"""
+        return os.path.join(self.directory, f"profile_{profile_id:06d}.sav")
+        
+    def _load_index(self):
+        """Read the whole index, rebuilding it if it is missing or damaged"""
+        try:
+            if not os.path.exists(self.index_file):
+                if glob.glob(os.path.join(self.directory, "profile_*.sav")):
+                    self.rebuild_index()
+                return
+                
+            with open(self.index_file, 'rb') as f:
+                data = f.read()
+            magic, version, record_size, count, last_id = INDEX_HEADER.unpack_from(data, 0)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION or record_size != RECORD_DTYPE.itemsize:
+                raise ValueError("unrecognised index header")
+                
+            # A crash mid-append can leave a partial record; ignore it
+            count = min(count, (len(data) - INDEX_HEADER.size) // record_size)
+            self.records = np.frombuffer(data, dtype=RECORD_DTYPE, count=count,
+                                         offset=INDEX_HEADER.size).copy()
+            self.slots = {int(profile_id): slot for slot, profile_id in enumerate(self.records['id'])}
+            self.last_profile_id = last_id
+        except Exception as e:
+            print(f"Profile index unreadable, rebuilding: {e}")
+            self.rebuild_index()
+            
+    def _write_header(self, f):
+        """Write the index header at the start of an open index file"""
+        f.seek(0)
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, RECORD_DTYPE.itemsize,
+                                  len(self.records), self.last_profile_id))
+                                  
+    def _write_record(self, slot):
+        """Rewrite one record, and the header, in place"""
+        mode = 'r+b' if os.path.exists(self.index_file) else 'w+b'
+        with open(self.index_file, mode) as f:
+            f.seek(INDEX_HEADER.size + slot * RECORD_DTYPE.itemsize)
+            f.write(self.records[slot:slot + 1].tobytes())
+            self._write_header(f)
+            
+    def _write_index(self):
+        """Write the whole index"""
+        from src.save_manager import write_atomic
+        header = INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, RECORD_DTYPE.itemsize,
+                                   len(self.records), self.last_profile_id)
+        write_atomic(self.index_file, header + self.records.tobytes())
+        
+    def rebuild_index(self):
+        """Recreate the index by scanning every profile file"""
+        from src.save_format import SaveContainer
+        
+        records = []
+        for path in sorted(glob.glob(os.path.join(self.directory, "profile_*.sav"))):
+            try:
+                profile_id = int(os.path.basename(path)[8:-4])
+                with SaveContainer(path) as container:
+                    player_data = container.get('player', {})
+                    meta = container.get('meta', {})
+                    thumb = container.sections.get('thumb')
+                record = np.zeros(1, dtype=RECORD_DTYPE)
+                self._fill_record(record[0], profile_id, player_data,
+                                  meta.get('saved_at', os.path.getmtime(path)), thumb)
+                records.append(record)
+            except Exception as e:
+                print(f"Skipping unreadable profile {path}: {e}")
+                
+        with self._lock:
+            self.records = np.concatenate(records) if records else np.zeros(0, dtype=RECORD_DTYPE)
+            self.slots = {int(profile_id): slot for slot, profile_id in enumerate(self.records['id'])}
+            if self.last_profile_id not in self.slots:
+                self.last_profile_id = int(self.records['id'][np.argmax(self.records['last_played'])]) if records else 0
+            try:
+                self._write_index()
+            except OSError as e:
+                print(f"Failed to write profile index: {e}")
+                
+    def _fill_record(self, record, profile_id, player_data, last_played, thumb_section):
+        """Set a record's fields from player data and the thumbnail section"""
+        record['id'] = profile_id
+        record['flags'] = 0
+        record['last_played'] = last_played
+        record['high_score'] = int(player_data.get('high_score', 0))
+        record['name'] = player_data.get('player_name', '').encode('utf-8')[:32]
+        if thumb_section:
+            _, compression, shape, offset, _ = thumb_section
+            record['thumb_offset'] = offset if compression == 0 else 0
+            record['thumb_height'], record['thumb_width'] = shape[:2]
+        else:
+            record['thumb_offset'] = 0
+            record['thumb_width'] = record['thumb_height'] = 0
+            
+    def create_profile(self):
+        """Reserve a new profile id and its index record"""
+        with self._lock:
+            profile_id = int(self.records['id'].max()) + 1 if len(self.records) else 1
+            record = np.zeros(1, dtype=RECORD_DTYPE)
+            record['id'] = profile_id
+            self.records = np.concatenate([self.records, record])
+            self.slots[profile_id] = len(self.records) - 1
+            self.last_profile_id = profile_id
+            os.makedirs(self.directory, exist_ok=True)
+            self._write_record(self.slots[profile_id])
+        return profile_id
+        
+    def update_profile(self, profile_id, player_data, last_played, thumb_section=None):
+        """Refresh one profile's record after its save file was written
+        
+        Deleted profiles stay deleted.
+        """
+        with self._lock:
+            slot = self.slots.get(profile_id)
+            if slot is not None and self.records[slot]['flags'] & FLAG_DELETED:
+                return
+            if slot is None:
+                record = np.zeros(1, dtype=RECORD_DTYPE)
+                self.records = np.concatenate([self.records, record])
+                slot = self.slots[profile_id] = len(self.records) - 1
+            self._fill_record(self.records[slot], profile_id, player_data, last_played, thumb_section)
+            self.last_profile_id = profile_id
+            self._write_record(slot)
+            
+    def set_last_profile(self, profile_id):
+        """Remember which profile was played last"""
+        with self._lock:
+            self.last_profile_id = profile_id
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r+b') as f:
+                    self._write_header(f)
+                    
+    def delete_profile(self, profile_id):
+        """Hide a profile from listings and remove its save file
+        
+        Saves of the profile still queued elsewhere must be written or
+        dropped first, or they recreate the file.
+        """
+        with self._lock:
+            slot = self.slots.get(profile_id)
+            if slot is None:
+                return
+            self.records[slot]['flags'] |= FLAG_DELETED
+            self._write_record(slot)
+        try:
+            os.remove(self.profile_path(profile_id))
+        except OSError:
+            pass
+            
+    def count(self):
+        """Get the number of live profiles"""
+        return int(np.count_nonzero((self.records['flags'] & FLAG_DELETED) == 0))
+        
+    def list_profiles(self):
+        """Get live profile records, most recently played first"""
+        with self._lock:
+            live = self.records[(self.records['flags'] & FLAG_DELETED) == 0]
+        return live[np.argsort(-live['last_played'], kind='stable')]
+        
+    def get_page(self, page, page_size, profiles=None):
+        """Get one page of profiles as dicts"""
+        if profiles is None:
+            profiles = self.list_profiles()
+        start = page * page_size
+        return [{
+            'id': int(record['id']),
+            'name': record['name'].decode('utf-8', 'ignore'),
+            'last_played': float(record['last_played']),
+            'high_score': int(record['high_score']),
+            'thumb_offset': int(record['thumb_offset']),
+            'thumb_size': (int(record['thumb_width']), int(record['thumb_height'])),
+        } for record in profiles[start:start + page_size]]
+        
+    def load_thumbnail(self, profile):
+        """Read a profile's thumbnail pixels, or None if it has none"""
+        width, height = profile['thumb_size']
+        if not profile['thumb_offset'] or not width or not height:
+            return None
+        try:
+            with open(self.profile_path(profile['id']), 'rb') as f:
+                f.seek(profile['thumb_offset'])
+                data = f.read(width * height * 3)
+            if len(data) != width * height * 3:
+                return None
+            return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+        except OSError as e:
+            print(f"Failed to load thumbnail: {e}")
+            return None
\ No newline at end of file
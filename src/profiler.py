@@ -0,0 +1,230 @@
+"""
+Lightweight frame-time profiler with per-subsystem timings and an overlay
+"""
+
+import os
+import csv
+import json
+import time
+import pygame
+from collections import deque
+from src.config import Config
+
+class _NullSection:
+    """Section used while profiling is off; does nothing"""
+    
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NULL_SECTION = _NullSection()
+
+class _Section:
+    """Times one named block, excluding time spent in nested sections"""
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+        self.children = 0.0
+        
+    def __enter__(self):
+        self.profiler._stack.append(self)
+        self.start = time.perf_counter()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.start
+        stack = self.profiler._stack
+        stack.pop()
+        
+        # Parents only count their own time, so stacked sections add up
+        if stack:
+            stack[-1].children += elapsed
+        self.profiler._add(self.name, (elapsed - self.children) * 1000.0)
+        return False
+
+class FrameProfiler:
+    # Overlay colors, assigned to sections in the order they first appear
+    PALETTE = [
+        (231, 76, 60), (46, 204, 113), (52, 152, 219), (241, 196, 15),
+        (155, 89, 182), (26, 188, 156), (230, 126, 34), (236, 240, 241),
+        (149, 165, 166), (211, 84, 0), (41, 128, 185), (192, 57, 43)
+    ]
+    
+    def __init__(self, history=None):
+        self.enabled = False
+        self.history = history or Config.PROFILER_HISTORY
+        
+        # One dict of section -> milliseconds per frame
+        self.samples = deque(maxlen=self.history)
+        self.sections = []
+        self._current = None
+        self._frame_start = 0.0
+        self._stack = []
+        
+        # Switch requested while a frame was being timed
+        self._toggle_pending = False
+        
+        # Overlay graph buffer, allocated on first draw
+        self._graph_surface = None
+        
+    def toggle(self):
+        """Turn profiling and its overlay on or off
+        
+        Input is handled inside a timed section, so while a frame is being
+        timed the switch waits until end_frame(), when every section has
+        closed.
+        """
+        if self._current is not None:
+            self._toggle_pending = not self._toggle_pending
+            return
+        self.enabled = not self.enabled
+        self._stack = []
+        
+    def section(self, name):
+        """Get a context manager timing a named block of the current frame"""
+        if not self.enabled or self._current is None:
+            return _NULL_SECTION
+        return _Section(self, name)
+        
+    def _add(self, name, milliseconds):
+        """Accumulate time for a section in the current frame"""
+        if name not in self.sections:
+            self.sections.append(name)
+        self._current[name] = self._current.get(name, 0.0) + milliseconds
+        
+    def begin_frame(self):
+        """Start timing a frame"""
+        if not self.enabled:
+            return
+        self._current = {}
+        self._frame_start = time.perf_counter()
+        
+    def end_frame(self):
+        """Finish timing a frame and store its samples"""
+        if self.enabled and self._current is not None:
+            self._store_frame()
+        if self._toggle_pending:
+            self._toggle_pending = False
+            self.toggle()
+            
+    def _store_frame(self):
+        """Close the current frame's samples"""
+        frame = (time.perf_counter() - self._frame_start) * 1000.0
+        
+        # Time no section claimed, e.g. state switching or Python overhead
+        self._current['other'] = max(0.0, frame - sum(self._current.values()))
+        if 'other' not in self.sections:
+            self.sections.append('other')
+        self._current['frame'] = frame
+        self.samples.append(self._current)
+        self._current = None
+        
+    def percentiles(self, name, points=(50, 95, 99)):
+        """Get rolling percentiles of a section's time in milliseconds"""
+        values = sorted(sample.get(name, 0.0) for sample in self.samples)
+        if not values:
+            return {f"p{point}": 0.0 for point in points}
+        last = len(values) - 1
+        return {f"p{point}": values[min(last, int(round(point / 100.0 * last)))] for point in points}
+        
+    def summary(self):
+        """Get percentiles for every section and the whole frame"""
+        return {name: self.percentiles(name) for name in self.sections + ['frame']}
+        
+    def dump_json(self, path):
+        """Write the summary and all raw samples to a JSON file"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({
+                'sections': self.sections,
+                'summary': self.summary(),
+                'samples': list(self.samples)
+            }, f, indent=2)
+            
+    def dump_csv(self, path):
+        """Write one row per frame with a column per section to a CSV file"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        columns = ['frame'] + self.sections
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for sample in self.samples:
+                writer.writerow([f"{sample.get(name, 0.0):.4f}" for name in columns])
+                
+    def dump(self, directory=None):
+        """Dump samples as both JSON and CSV with a timestamped name"""
+        directory = directory or Config.PROFILER_DUMP_DIR
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(directory, f"profile-{stamp}")
+        self.dump_json(base + ".json")
+        self.dump_csv(base + ".csv")
+        print(f"Profiler samples written to {base}.json/.csv")
+        return base
+        
+    def draw_overlay(self, screen):
+        """Draw a stacked frame-time graph and per-section percentiles"""
+        if not self.enabled:
+            return
+            
+        from src.graphics.font_cache import render_text
+        
+        width, height = Config.PROFILER_GRAPH_SIZE
+        graph_rect = pygame.Rect(screen.get_width() - width - 10,
+                                 screen.get_height() - height - 10, width, height)
+        self._draw_graph(screen, graph_rect)
+        
+        # Legend with rolling percentiles, newest sections at the bottom
+        legend_y = graph_rect.top - 16 * (len(self.sections) + 1) - 4
+        pygame.draw.rect(screen, (20, 20, 20),
+                         (graph_rect.left, legend_y - 2, width, graph_rect.top - legend_y))
+        frame = self.percentiles('frame')
+        text = render_text(f"frame  p50 {frame['p50']:.1f}  p95 {frame['p95']:.1f}  p99 {frame['p99']:.1f} ms",
+                           18, Config.WHITE)
+        screen.blit(text, (graph_rect.left, legend_y))
+        for i, name in enumerate(self.sections):
+            stats = self.percentiles(name)
+            color = self.PALETTE[i % len(self.PALETTE)]
+            text = render_text(f"{name:<14} {stats['p50']:5.2f} {stats['p95']:5.2f} {stats['p99']:5.2f}",
+                               18, color)
+            screen.blit(text, (graph_rect.left, legend_y + 16 * (i + 1)))
+            
+    def _draw_graph(self, screen, graph_rect):
+        """Rasterise the stacked bars for the most recent frames in one pass"""
+        import numpy as np
+        
+        width, height = graph_rect.size
+        if self._graph_surface is None or self._graph_surface.get_size() != (width, height):
+            from src.graphics.surface_manager import create_surface
+            self._graph_surface = create_surface((width, height))
+            
+        # Newest frame on the right, one column per frame
+        recent = list(self.samples)[-width:]
+        scale = height / Config.PROFILER_GRAPH_MAX_MS
+        pixels = np.zeros((width, height, 3), dtype=np.uint8)
+        pixels[:] = (20, 20, 20)
+        
+        if recent:
+            offset = width - len(recent)
+            rows = np.arange(height)[None, :]
+            bottom = np.zeros((len(recent), 1))
+            for i, name in enumerate(self.sections):
+                heights = np.array([sample.get(name, 0.0) for sample in recent])[:, None] * scale
+                top = bottom + heights
+                
+                # Rows are counted from the bottom of the graph
+                mask = (rows >= height - top) & (rows < height - bottom)
+                pixels[offset:][mask] = self.PALETTE[i % len(self.PALETTE)]
+                bottom = top
+                
+        # Frame budget line
+        budget_row = int(height - 1000.0 / Config.FPS * scale)
+        if 0 <= budget_row < height:
+            pixels[:, budget_row] = Config.WHITE
+            
+        pygame.surfarray.blit_array(self._graph_surface, pixels)
+        screen.blit(self._graph_surface, graph_rect)
+        pygame.draw.rect(screen, Config.LIGHT_GRAY, graph_rect, 1)
\ No newline at end of file
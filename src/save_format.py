@@ -0,0 +1,199 @@
+"""
+Versioned binary save container
+
+Layout, all integers little-endian:
+
+    header   magic "SRSV", format version (H), section count (H), reserved (I)
+    table    one entry per section: name (16s), kind (B), compression (B),
+             2 pad bytes, shape (3I), offset (Q), stored length (Q)
+    data     section payloads, each starting on a SECTION_ALIGNMENT boundary
+
+Sections are JSON documents, raw bytes or uint8 arrays. Only the header
+and the table are parsed when a file is opened; payloads are decoded on
+first access, and uncompressed arrays are returned as views straight
+onto the memory-mapped file.
+"""
+
+import os
+import mmap
+import json
+import zlib
+import struct
+
+MAGIC = b"SRSV"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sHHI")
+ENTRY = struct.Struct("<16sBB2x3IQQ")
+SECTION_ALIGNMENT = 64
+
+# Section kinds
+KIND_BYTES = 0
+KIND_JSON = 1
+KIND_ARRAY = 2
+
+# Compression
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+
+class SaveFormatError(Exception):
+    """Raised for files that are not valid save containers"""
+
+def _align(position):
+    """Round a position up to the section alignment"""
+    return (position + SECTION_ALIGNMENT - 1) // SECTION_ALIGNMENT * SECTION_ALIGNMENT
+
+def _encode(value, compress_level):
+    """Get (kind, compression, shape, payload) for a section value"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        kind, shape, payload = KIND_BYTES, (0, 0, 0), bytes(value)
+    elif isinstance(value, dict):
+        kind, shape, payload = KIND_JSON, (0, 0, 0), json.dumps(value, separators=(',', ':')).encode('utf-8')
+    else:
+        import numpy as np
+        array = np.ascontiguousarray(value, dtype=np.uint8)
+        if array.ndim > 3:
+            raise ValueError("Array sections have at most 3 dimensions")
+        shape = tuple(array.shape) + (0,) * (3 - array.ndim)
+        kind, payload = KIND_ARRAY, array.tobytes()
+        
+    if compress_level > 0:
+        return kind, COMPRESSION_ZLIB, shape, zlib.compress(payload, compress_level)
+    return kind, COMPRESSION_NONE, shape, payload
+
+def build_container(sections, compress_level=0):
+    """Serialise an ordered mapping of section name -> value to bytes
+    
+    Values may be dicts (stored as JSON), bytes, or uint8 arrays.
+    compress_level 1-9 zlib-compresses payloads; 0 keeps them raw so they
+    can be read without copying.
+    """
+    encoded = []
+    for name, value in sections.items():
+        name_bytes = name.encode('utf-8')
+        if len(name_bytes) > 16:
+            raise ValueError(f"Section name too long: {name}")
+        encoded.append((name_bytes,) + _encode(value, compress_level))
+        
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded), 0)
+    position = _align(HEADER.size + ENTRY.size * len(encoded))
+    
+    table = []
+    chunks = []
+    for name_bytes, kind, compression, shape, payload in encoded:
+        table.append(ENTRY.pack(name_bytes, kind, compression, *shape, position, len(payload)))
+        chunks.append((position, payload))
+        position = _align(position + len(payload))
+        
+    data = bytearray(position)
+    data[:HEADER.size] = header
+    data[HEADER.size:HEADER.size + ENTRY.size * len(table)] = b"".join(table)
+    for offset, payload in chunks:
+        data[offset:offset + len(payload)] = payload
+    return bytes(data)
+
+def read_table(buffer, path="<buffer>"):
+    """Parse a container's header and section table
+    
+    Returns the format version and a dict of section name ->
+    (kind, compression, shape, offset, stored length).
+    """
+    if len(buffer) < HEADER.size:
+        raise SaveFormatError(f"Truncated save file: {path}")
+        
+    magic, version, count, _ = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise SaveFormatError(f"Not a save file: {path}")
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"Save file version {version} is newer than supported {FORMAT_VERSION}")
+    if HEADER.size + count * ENTRY.size > len(buffer):
+        raise SaveFormatError(f"Truncated save file: {path}")
+        
+    sections = {}
+    for i in range(count):
+        name, kind, compression, d0, d1, d2, offset, length = ENTRY.unpack_from(
+            buffer, HEADER.size + i * ENTRY.size)
+        if offset + length > len(buffer):
+            raise SaveFormatError(f"Section extends past end of file: {path}")
+        shape = tuple(d for d in (d0, d1, d2) if d)
+        sections[name.rstrip(b"\0").decode('utf-8')] = (kind, compression, shape, offset, length)
+    return version, sections
+
+class SaveContainer:
+    """Read-only view of a save container file"""
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            self._file.close()
+            raise SaveFormatError(f"Empty save file: {path}")
+            
+        self.sections = {}
+        self._decoded = {}
+        try:
+            self._read_table()
+        except Exception:
+            self.close()
+            raise
+        
+    def _read_table(self):
+        """Parse the header and section table"""
+        self.version, self.sections = read_table(self._map, self.path)
+        
+    def __contains__(self, name):
+        return name in self.sections
+        
+    def _payload(self, name):
+        """Get a section's payload, decompressed if needed"""
+        kind, compression, shape, offset, length = self.sections[name]
+        payload = memoryview(self._map)[offset:offset + length]
+        if compression == COMPRESSION_ZLIB:
+            return zlib.decompress(payload)
+        return payload
+        
+    def get(self, name, default=None):
+        """Get a decoded section, decoding it on first access"""
+        if name not in self.sections:
+            return default
+        if name in self._decoded:
+            return self._decoded[name]
+            
+        kind, compression, shape, offset, length = self.sections[name]
+        payload = self._payload(name)
+        if kind == KIND_JSON:
+            value = json.loads(bytes(payload).decode('utf-8'))
+        elif kind == KIND_ARRAY:
+            import numpy as np
+            value = np.frombuffer(payload, dtype=np.uint8).reshape(shape)
+        else:
+            value = bytes(payload)
+            
+        self._decoded[name] = value
+        return value
+        
+    def close(self):
+        """Close the file; arrays returned without copying become invalid"""
+        self._decoded.clear()
+        try:
+            self._map.close()
+        except BufferError:
+            # A view is still alive; the map is freed with it
+            pass
+        self._file.close()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+def read_container(path):
+    """Open a save container if the file exists, else None"""
+    if not os.path.exists(path):
+        return None
+    return SaveContainer(path)
\ No newline at end of file
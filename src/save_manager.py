@@ -4,38 +4,358 @@ Save and load game data
 
 import json
 import os
+import copy
+import time
+import threading
 from src.config import Config
+from src.save_format import build_container, read_container, read_table, SaveFormatError
+from src.profile_store import ProfileStore
+
+# Version of the player data layout; bump and add a migration when it changes
+SAVE_SCHEMA_VERSION = 1
+
+def write_atomic(path, data):
+    """Write bytes so the file holds either the old or the new contents, never part"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+        
+    # Persist the rename itself; not supported on every platform
+    try:
+        directory_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+    except OSError:
+        pass
+
+def _migrate_v0(player_data, avatar):
+    """Legacy JSON save: pull the avatar PNG into the save itself"""
+    avatar_path = player_data.get('avatar_path', '')
+    if avatar is None and avatar_path and os.path.exists(avatar_path):
+        try:
+            import pygame
+            import numpy as np
+            surface = pygame.image.load(avatar_path)
+            avatar = np.ascontiguousarray(pygame.surfarray.array3d(surface).swapaxes(0, 1))
+        except Exception as e:
+            print(f"Failed to migrate avatar image: {e}")
+    player_data['avatar_path'] = ''
+    return player_data, avatar
+
+# Migration from each schema version to the next
+MIGRATIONS = {
+    0: _migrate_v0,
+}
+
+def migrate(player_data, avatar, schema):
+    """Bring player data saved with an older schema up to date"""
+    while schema < SAVE_SCHEMA_VERSION:
+        player_data, avatar = MIGRATIONS[schema](player_data, avatar)
+        schema += 1
+    return player_data, avatar
+
+def default_player_data():
+    """Get player data for a brand new profile"""
+    return {
+        'player_name': 'Player',
+        'has_avatar': False,
+        'avatar_path': '',
+        'skin_tone': 0.5,
+        'hair_style': 0.5,
+        'eye_color': 0.5,
+        'game_progress': 0,
+        'high_score': 0
+    }
 
 class SaveManager:
     def __init__(self):
-        self.save_file = os.path.join(Config.SAVES_DIR, "player_data.json")
+        # Every player profile is its own save, listed through the index
+        self.store = ProfileStore(Config.PROFILES_DIR)
+        self.profile_id = self.store.last_profile_id if self.store.last_profile_id in self.store.slots else None
+        
+        # Saves from before profiles existed, imported as a profile on first load
+        self.legacy_save_file = os.path.join(Config.SAVES_DIR, "player.sav")
+        self.legacy_json_file = os.path.join(Config.SAVES_DIR, "player_data.json")
+        
+        # Avatar pixels, read from the save only when first asked for
+        self._avatar = None
+        self._avatar_loaded = False
+        
+        # Newest unsaved snapshot; older ones are replaced, not queued
+        self._pending = None
+        self._requested = 0
+        self._written = 0
+        
+        # Newest request known to be on disk; behind _written after a failed write
+        self._saved = 0
+        self._condition = threading.Condition()
+        self._writer = None
+        self._closing = False
+        self._urgent = False
+        
+        # Statistics
+        self.saves_requested = 0
+        self.saves_written = 0
+        self.saves_failed = 0
+        
+    @property
+    def save_file(self):
+        """Get the save file of the current profile, or None before the first save"""
+        if self.profile_id is None:
+            return None
+        return self.store.profile_path(self.profile_id)
+        
+    def save_player_data(self, player_data, avatar=None):
+        """Queue player data, and optionally a new avatar image, to be saved
+        
+        The avatar is a row-major (height, width, 3) RGB array. When it is
+        omitted the current avatar is kept.
+        """
+        # Snapshot now so later changes by the game don't leak into this save
+        snapshot = copy.deepcopy(player_data)
+        if avatar is not None:
+            import numpy as np
+            self._avatar = np.array(avatar, dtype=np.uint8)
+            self._avatar.flags.writeable = False
+            self._avatar_loaded = True
+        else:
+            self.load_avatar()
+            
+        # The first save of a new profile reserves its index record
+        if self.profile_id is None:
+            self.profile_id = self.store.create_profile()
+            
+        with self._condition:
+            self._pending = (self.profile_id, snapshot, self._avatar)
+            self._requested += 1
+            self.saves_requested += 1
+            self._start_writer()
+            self._condition.notify_all()
+            
+    def _start_writer(self):
+        """Start the writer thread if it isn't running"""
+        if self._writer is None or not self._writer.is_alive():
+            self._closing = False
+            self._writer = threading.Thread(target=self._write_loop, name="save-writer", daemon=True)
+            self._writer.start()
+            
+    def _write_loop(self):
+        """Write queued snapshots until closed"""
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closing:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                    
+                # Give rapid successive saves a moment to collapse into one write
+                deadline = time.monotonic() + Config.SAVE_COALESCE_DELAY
+                while not self._closing and not self._urgent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                    
+                snapshot = self._pending
+                generation = self._requested
+                self._pending = None
+                self._urgent = False
+                
+            saved = self._write_save(*snapshot)
+            
+            with self._condition:
+                self._written = generation
+                if saved:
+                    self._saved = generation
+                    self.saves_written += 1
+                else:
+                    self.saves_failed += 1
+                self._condition.notify_all()
+                
+    def _write_save(self, profile_id, player_data, avatar):
+        """Save player data and avatar to the profile's save container
         
-    def save_player_data(self, player_data):
-        """Save player data to file"""
+        Returns False if the save failed.
+        """
         try:
-            os.makedirs(Config.SAVES_DIR, exist_ok=True)
-            with open(self.save_file, 'w') as f:
-                json.dump(player_data, f, indent=2)
+            saved_at = time.time()
+            sections = {
+                'meta': {'schema': SAVE_SCHEMA_VERSION, 'saved_at': saved_at},
+                'player': player_data,
+            }
+            if avatar is not None:
+                # Small raw copy the profile list reads without parsing the save
+                from src.graphics.image_tools import resample_nearest
+                sections['thumb'] = resample_nearest(avatar, *Config.PROFILE_THUMB_SIZE)
+                sections['avatar'] = avatar
+            data = build_container(sections, Config.SAVE_COMPRESS_LEVEL)
+            write_atomic(self.store.profile_path(profile_id), data)
+            
+            # Only this profile's index record is rewritten
+            _, table = read_table(data)
+            self.store.update_profile(profile_id, player_data, saved_at, table.get('thumb'))
+            return True
         except Exception as e:
             print(f"Failed to save player data: {e}")
+            return False
+            
+    def flush(self, timeout=None):
+        """Wait until every save requested so far is on disk
+        
+        Returns False if the timeout ran out first or the newest write failed.
+        """
+        with self._condition:
+            target = self._requested
+            
+            # Skip the coalescing delay for whatever is still pending
+            if self._pending is not None:
+                self._urgent = True
+                self._condition.notify_all()
+            if not self._condition.wait_for(lambda: self._written >= target, timeout):
+                return False
+            return self._saved >= target
+            
+    def close(self, timeout=None):
+        """Write any pending save and stop the writer thread
+        
+        Returns False if a requested save is not on disk.
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        if self._writer is not None:
+            self._writer.join(timeout)
+            self._writer = None
+        with self._condition:
+            return self._saved >= self._requested
+            
+    def select_profile(self, profile_id):
+        """Switch to another profile and load its player data"""
+        self.flush()
+        self.profile_id = profile_id
+        self._avatar = None
+        self._avatar_loaded = False
+        self.store.set_last_profile(profile_id)
+        return self.load_player_data()
+        
+    def new_profile(self):
+        """Start a new profile; it is created on disk by its first save"""
+        self.flush()
+        self.profile_id = None
+        self._avatar = None
+        self._avatar_loaded = True
+        return default_player_data()
+        
+    def delete_profile(self, profile_id):
+        """Delete a profile, after any save of it still being written
+        
+        Deleting the current profile starts a new one, as new_profile() does.
+        """
+        self.flush()
+        self.store.delete_profile(profile_id)
+        if profile_id == self.profile_id:
+            self.profile_id = None
+            self._avatar = None
+            self._avatar_loaded = True
             
     def load_player_data(self):
-        """Load player data from file"""
+        """Load player data from file
+        
+        Only the small player section is decoded; the avatar stays on disk
+        until load_avatar() is called.
+        """
+        if self.profile_id is not None:
+            player_data = self._read_save(self.save_file)
+            if player_data is not None:
+                return player_data
+        else:
+            player_data = self._import_legacy_save()
+            if player_data is not None:
+                return player_data
+                
+        # Return default player data
+        return default_player_data()
+        
+    def _read_save(self, path):
+        """Read player data from a save container, migrating old schemas"""
+        try:
+            container = read_container(path)
+            if container:
+                with container:
+                    schema = container.get('meta', {}).get('schema', 0)
+                    player_data = container.get('player')
+                if player_data is not None and schema < SAVE_SCHEMA_VERSION:
+                    player_data, avatar = migrate(player_data, self.load_avatar(), schema)
+                    self.save_player_data(player_data, avatar)
+                return player_data
+        except (SaveFormatError, OSError, ValueError) as e:
+            print(f"Failed to load player data: {e}")
+        return None
+        
+    def _import_legacy_save(self):
+        """Turn a save from before profiles existed into the first profile
+        
+        The old files are left alone.
+        """
         try:
-            if os.path.exists(self.save_file):
-                with open(self.save_file, 'r') as f:
-                    return json.load(f)
+            container = read_container(self.legacy_save_file)
+            if container:
+                import numpy as np
+                with container:
+                    schema = container.get('meta', {}).get('schema', 0)
+                    player_data = container.get('player')
+                    avatar = container.get('avatar')
+                    avatar = np.array(avatar) if avatar is not None else None
+                if player_data is not None:
+                    player_data, avatar = migrate(player_data, avatar, schema)
+                    self.save_player_data(player_data, avatar)
+                    return player_data
+        except (SaveFormatError, OSError, ValueError) as e:
+            print(f"Failed to import old save: {e}")
+            
+        try:
+            if os.path.exists(self.legacy_json_file):
+                with open(self.legacy_json_file, 'r') as f:
+                    player_data = json.load(f)
+                player_data, avatar = migrate(player_data, None, 0)
+                self.save_player_data(player_data, avatar)
+                return player_data
         except Exception as e:
             print(f"Failed to load player data: {e}")
+        return None
+        
+    def load_avatar(self):
+        """Get the saved avatar as an RGB array, or None if there isn't one"""
+        if self._avatar_loaded:
+            return self._avatar
             
-        # Return default player data
-        return {
-            'player_name': 'Player',
-            'has_avatar': False,
-            'avatar_path': '',
-            'skin_tone': 0.5,
-            'hair_style': 0.5,
-            'eye_color': 0.5,
-            'game_progress': 0,
-            'high_score': 0
-        }
\ No newline at end of file
+        self._avatar_loaded = True
+        if self.save_file is None:
+            return None
+        try:
+            container = read_container(self.save_file)
+            if container:
+                # Copy out of the mapping so the file can be replaced later
+                with container:
+                    avatar = container.get('avatar')
+                    if avatar is not None:
+                        import numpy as np
+                        self._avatar = np.array(avatar)
+                        self._avatar.flags.writeable = False
+        except (SaveFormatError, OSError, ValueError) as e:
+            print(f"Failed to load avatar: {e}")
+        return self._avatar
\ No newline at end of file
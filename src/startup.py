@@ -0,0 +1,84 @@
+"""
+Startup timing and background pre-warming of heavy modules
+"""
+
+import sys
+import time
+import importlib
+import threading
+
+class StartupTimer:
+    def __init__(self):
+        self.start = time.perf_counter()
+        
+        # (label, seconds since start) in the order they happened
+        self.marks = []
+        
+        # Module name -> (seconds to import, thread that imported it)
+        self.import_times = {}
+        self._lock = threading.Lock()
+        
+    def mark(self, label):
+        """Record a startup milestone"""
+        self.marks.append((label, time.perf_counter() - self.start))
+        
+    def timed_import(self, module_name):
+        """Import a module, recording how long it took if it wasn't loaded yet
+        
+        A module another thread is still importing is already in
+        sys.modules, half built; import_module() waits for it to finish.
+        """
+        loaded = module_name in sys.modules
+        begin = time.perf_counter()
+        module = importlib.import_module(module_name)
+        elapsed = time.perf_counter() - begin
+        
+        if not loaded:
+            with self._lock:
+                self.import_times.setdefault(module_name, (elapsed, threading.current_thread().name))
+        return module
+        
+    def elapsed(self, label):
+        """Get seconds since start for a recorded milestone"""
+        for mark_label, seconds in self.marks:
+            if mark_label == label:
+                return seconds
+        return None
+        
+    def report(self):
+        """Get a human-readable startup report"""
+        lines = ["Startup timing:"]
+        for label, seconds in self.marks:
+            lines.append(f"  {seconds * 1000:8.1f} ms  {label}")
+            
+        if self.import_times:
+            lines.append("Module imports:")
+            with self._lock:
+                imports = sorted(self.import_times.items(), key=lambda item: -item[1][0])
+            for module_name, (seconds, thread_name) in imports:
+                lines.append(f"  {seconds * 1000:8.1f} ms  {module_name} ({thread_name})")
+        return "\n".join(lines)
+
+def prewarm(module_names, timer, callbacks=()):
+    """Import modules and run warm-up callbacks on a background thread"""
+    def work():
+        for module_name in module_names:
+            try:
+                timer.timed_import(module_name)
+            except Exception as e:
+                print(f"Pre-warming {module_name} failed: {e}")
+                
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Pre-warm task failed: {e}")
+                
+        timer.mark("background pre-warm finished")
+        
+    thread = threading.Thread(target=work, name="prewarm", daemon=True)
+    thread.start()
+    return thread
+
+# Shared timer, started as early as the first import of this module
+startup_timer = StartupTimer()
\ No newline at end of file
@@ -3,15 +3,19 @@ Avatar creation state with webcam integration
 """
 
 import pygame
-import os
 from src.states.base_state import BaseState
 from src.config import Config
+from src.graphics.font_cache import render_text
+from src.graphics.frame_upload import FrameUploader
+from src.graphics.avatar_preview import AvatarPreview
 
 class AvatarCreationState(BaseState):
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.camera = None
+        self.camera_frame = None
         self.camera_surface = None
+        self.camera_upload = FrameUploader()
         self.captured_image = None
         self.is_photo_taken = False
         
@@ -24,17 +28,18 @@ class AvatarCreationState(BaseState):
         
         # Avatar preview
         self.avatar_surface = None
+        self.avatar_preview = AvatarPreview()
         
     def enter(self):
         """Initialize avatar creation"""
         self.is_photo_taken = False
         
+        # Create UI elements; the camera needs the preview size
+        self._create_ui()
+        
         # Initialize camera
         self._init_camera()
         
-        # Create UI elements
-        self._create_ui()
-        
     def exit(self):
         """Clean up avatar creation"""
         if self.camera:
@@ -42,21 +47,20 @@ class AvatarCreationState(BaseState):
                 self.camera.release()
             except:
                 pass
+            self.camera = None
             
     def _init_camera(self):
         """Initialize webcam"""
-        try:
-            import cv2
-            self.camera = cv2.VideoCapture(0)
-            if self.camera.isOpened():
-                self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, Config.WEBCAM_WIDTH)
-                self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, Config.WEBCAM_HEIGHT)
-                print("Camera initialized successfully")
-            else:
-                print("Camera not available")
-                self.camera = None
-        except Exception as e:
-            print(f"Camera initialization failed: {e}")
+        from src.systems.webcam_capture import WebcamCapture, open_source
+        
+        self.camera_frame = None
+        source = open_source(0)
+        if source:
+            # Frames are read and converted on a worker thread
+            self.camera = WebcamCapture(source, self.camera_rect.size).start()
+            print("Camera initialized successfully")
+        else:
+            print("Camera not available")
             self.camera = None
             
     def _create_ui(self):
@@ -111,7 +115,7 @@ class AvatarCreationState(BaseState):
                     
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = event.pos
                 
                 # Check button clicks
                 for i, button in enumerate(self.buttons):
@@ -133,7 +137,7 @@ class AvatarCreationState(BaseState):
                         slider['value'] = max(0, min(1, relative_x / slider['rect'].width))
                         
         elif event.type == pygame.MOUSEMOTION:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             for i, button in enumerate(self.buttons):
                 if button['rect'].collidepoint(mouse_pos):
                     self.selected_button = i
@@ -169,8 +173,7 @@ class AvatarCreationState(BaseState):
         screen.fill(Config.DARK_GRAY)
         
         # Title
-        font = pygame.font.Font(None, 48)
-        title_text = font.render("Create Your Avatar", True, Config.WHITE)
+        title_text = render_text("Create Your Avatar", 48, Config.WHITE)
         title_rect = title_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 30))
         screen.blit(title_text, title_rect)
         
@@ -182,13 +185,18 @@ class AvatarCreationState(BaseState):
             screen.blit(self.camera_surface, self.camera_rect)
         else:
             # No camera available message
-            font = pygame.font.Font(None, 24)
-            text = font.render("Camera not available - using default avatar", True, Config.RED)
+            text = render_text("Camera not available - using default avatar", 24, Config.RED)
             text_rect = text.get_rect(center=self.camera_rect.center)
             screen.blit(text, text_rect)
             
+        # Capture pipeline counters while profiling
+        if self.camera and self.profiler.enabled:
+            stats = self.camera.get_stats()
+            stats_text = render_text(f"camera {stats['delivered']} shown, {stats['dropped']} dropped, "
+                                     f"{stats['latency_ms']:.1f} ms latency", 18, Config.LIGHT_GRAY)
+            screen.blit(stats_text, (self.camera_rect.left, self.camera_rect.bottom + 4))
+            
         # Draw buttons
-        button_font = pygame.font.Font(None, 32)
         for i, button in enumerate(self.buttons):
             color = Config.WHITE if i == self.selected_button else Config.LIGHT_GRAY
             bg_color = Config.BLUE if i == self.selected_button else Config.DARK_GRAY
@@ -196,7 +204,7 @@ class AvatarCreationState(BaseState):
             pygame.draw.rect(screen, bg_color, button['rect'])
             pygame.draw.rect(screen, color, button['rect'], 2)
             
-            text = button_font.render(button['text'], True, color)
+            text = render_text(button['text'], 32, color)
             text_rect = text.get_rect(center=button['rect'].center)
             screen.blit(text, text_rect)
         
@@ -205,20 +213,17 @@ class AvatarCreationState(BaseState):
             self._draw_customization_ui(screen)
         
         # Draw instructions
-        font = pygame.font.Font(None, 24)
         if not self.is_photo_taken:
-            instruction_text = font.render("Position yourself in the camera and take a photo", True, Config.LIGHT_GRAY)
+            instruction_text = render_text("Position yourself in the camera and take a photo", 24, Config.LIGHT_GRAY)
         else:
-            instruction_text = font.render("Customize your avatar and confirm when ready", True, Config.LIGHT_GRAY)
+            instruction_text = render_text("Customize your avatar and confirm when ready", 24, Config.LIGHT_GRAY)
         instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 430))
         screen.blit(instruction_text, instruction_rect)
         
     def _draw_customization_ui(self, screen):
         """Draw customization interface"""
-        font = pygame.font.Font(None, 24)
-        
         # Name input
-        name_label = font.render("Player Name:", True, Config.WHITE)
+        name_label = render_text("Player Name:", 24, Config.WHITE)
         screen.blit(name_label, (500, 75))
         
         # Name input box
@@ -226,13 +231,13 @@ class AvatarCreationState(BaseState):
         pygame.draw.rect(screen, Config.DARK_GRAY, self.name_input_rect)
         pygame.draw.rect(screen, input_color, self.name_input_rect, 2)
         
-        name_text = font.render(self.player_name, True, Config.WHITE)
+        name_text = render_text(self.player_name, 24, Config.WHITE)
         screen.blit(name_text, (self.name_input_rect.x + 5, self.name_input_rect.y + 5))
         
         # Sliders
         for slider_name, slider in self.sliders.items():
             # Label
-            label_text = font.render(slider['label'] + ":", True, Config.WHITE)
+            label_text = render_text(slider['label'] + ":", 24, Config.WHITE)
             screen.blit(label_text, (slider['rect'].x, slider['rect'].y - 25))
             
             # Slider track
@@ -245,10 +250,9 @@ class AvatarCreationState(BaseState):
         
         # Avatar preview
         if self.avatar_surface:
-            preview_rect = pygame.Rect(500, 350, 200, 200)
+            preview_rect = pygame.Rect((500, 350), Config.AVATAR_PREVIEW_SIZE)
             pygame.draw.rect(screen, Config.WHITE, preview_rect, 2)
-            scaled_avatar = pygame.transform.scale(self.avatar_surface, (200, 200))
-            screen.blit(scaled_avatar, preview_rect)
+            screen.blit(self.avatar_surface, preview_rect)
             
     def _update_camera(self):
         """Update camera feed"""
@@ -256,24 +260,11 @@ class AvatarCreationState(BaseState):
             return
             
         try:
-            import cv2
-            import numpy as np
-            
-            ret, frame = self.camera.read()
-            if ret:
-                # Flip horizontally for mirror effect
-                frame = cv2.flip(frame, 1)
-                
-                # Convert BGR to RGB
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # Resize to fit preview area
-                frame = cv2.resize(frame, (self.camera_rect.width, self.camera_rect.height))
-                
-                # Convert to pygame surface
-                frame = np.rot90(frame)
-                frame = np.flipud(frame)
-                self.camera_surface = pygame.surfarray.make_surface(frame)
+            # Newest mirrored, RGB, preview-sized frame from the capture thread
+            frame = self.camera.get_frame()
+            if frame is not None:
+                self.camera_frame = frame
+                self.camera_surface = self.camera_upload.upload(frame)
         except Exception as e:
             print(f"Camera update error: {e}")
             
@@ -288,23 +279,16 @@ class AvatarCreationState(BaseState):
             return
             
         try:
-            import cv2
-            import numpy as np
-            
-            ret, frame = self.camera.read()
-            if ret:
-                # Process the captured frame
-                frame = cv2.flip(frame, 1)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = cv2.resize(frame, (self.camera_rect.width, self.camera_rect.height))
-                
+            # Prefer a fresh frame, else keep the one on screen
+            frame = self.camera.get_frame()
+            if frame is None:
+                frame = self.camera_frame
+            if frame is None:
+                frame = self.camera.get_frame(timeout=1.0)
+            if frame is not None:
                 # Store captured image
                 self.captured_image = frame.copy()
-                
-                # Convert to pygame surface
-                frame = np.rot90(frame)
-                frame = np.flipud(frame)
-                self.camera_surface = pygame.surfarray.make_surface(frame)
+                self.camera_surface = self.camera_upload.upload(frame)
                 
                 # Update state
                 self.is_photo_taken = True
@@ -320,19 +304,13 @@ class AvatarCreationState(BaseState):
             
     def _create_default_avatar(self):
         """Create default avatar"""
-        import numpy as np
-        
-        # Create a simple default avatar
-        width, height = 200, 200
-        avatar_array = np.zeros((width, height, 3), dtype=np.uint8)
+        from src.graphics.image_tools import generate
         
-        # Fill with a gradient
-        for y in range(height):
-            for x in range(width):
-                avatar_array[x, y] = [100 + x // 3, 150 + y // 3, 200]
+        # Same size as a camera photo; shared and read-only, so never modified
+        avatar_array = generate("default_avatar", self.camera_rect.width, self.camera_rect.height)
         
         self.captured_image = avatar_array
-        self.camera_surface = pygame.surfarray.make_surface(avatar_array)
+        self.camera_surface = self.camera_upload.upload(avatar_array)
             
     def _retake_photo(self):
         """Retake photo"""
@@ -346,42 +324,16 @@ class AvatarCreationState(BaseState):
             return
             
         try:
-            import cv2
-            import numpy as np
-            
-            # Create avatar preview
-            avatar_img = cv2.resize(self.captured_image, (200, 200))
-            
-            # Apply customizations based on slider values
-            skin_tone = self.sliders['skin_tone']['value']
-            
-            # Simple color adjustments
-            if skin_tone != 0.5:
-                avatar_img = self._adjust_skin_tone(avatar_img, skin_tone)
-                
-            # Convert to pygame surface
-            avatar_img = np.rot90(avatar_img)
-            avatar_img = np.flipud(avatar_img)
-            self.avatar_surface = pygame.surfarray.make_surface(avatar_img)
+            # Only the stages whose input changed since last frame are redone
+            if self.avatar_preview.image is not self.captured_image:
+                self.avatar_preview.set_image(self.captured_image)
+            self.avatar_surface = self.avatar_preview.get_surface(
+                self.sliders['skin_tone']['value'],
+                self.sliders['hair_style']['value'],
+                self.sliders['eye_color']['value'])
         except Exception as e:
             print(f"Avatar preview error: {e}")
             
-    def _adjust_skin_tone(self, image, tone_value):
-        """Adjust skin tone of the image"""
-        try:
-            import cv2
-            import numpy as np
-            
-            # Simple color adjustment
-            hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV)
-            
-            # Adjust saturation based on tone value
-            hsv[:, :, 1] = np.clip(hsv[:, :, 1] * (0.5 + tone_value), 0, 255)
-            
-            return cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB)
-        except:
-            return image
-        
     def _confirm_avatar(self):
         """Confirm avatar creation"""
         # Save avatar data
@@ -392,18 +344,9 @@ class AvatarCreationState(BaseState):
         player_data['hair_style'] = self.sliders['hair_style']['value']
         player_data['eye_color'] = self.sliders['eye_color']['value']
         
-        # Save avatar image if available
-        if self.captured_image is not None:
-            try:
-                import cv2
-                avatar_path = os.path.join(Config.SAVES_DIR, "avatar.png")
-                cv2.imwrite(avatar_path, cv2.cvtColor(self.captured_image, cv2.COLOR_RGB2BGR))
-                player_data['avatar_path'] = avatar_path
-            except Exception as e:
-                print(f"Failed to save avatar image: {e}")
-                player_data['avatar_path'] = ''
-        
-        self.game_manager.set_player_data(player_data)
+        # The avatar pixels are stored inside the save itself
+        player_data['avatar_path'] = ''
+        self.game_manager.set_player_data(player_data, self.captured_image)
         
         # Go to game
         from src.game_manager import GameStateType
@@ -10,6 +10,7 @@ class BaseState(ABC):
         self.game_manager = game_manager
         self.screen = game_manager.screen
         self.audio_manager = game_manager.audio_manager
+        self.profiler = game_manager.profiler
         
     @abstractmethod
     def enter(self):
@@ -33,5 +34,9 @@ class BaseState(ABC):
         
     @abstractmethod
     def render(self, screen):
-        """Render state to screen"""
+        """Render state to screen
+        
+        May return a list of changed rects to update only those regions of
+        the display; returning None updates the whole display.
+        """
         pass
\ No newline at end of file
@@ -7,23 +7,38 @@ import random
 import math
 from src.states.base_state import BaseState
 from src.config import Config
+from src.graphics.font_cache import render_text
+from src.graphics.gradient import vertical_gradient
+from src.graphics.surface_manager import overlay_surface
+from src.graphics.sprite_batch import SpriteBatch, LAYER_BACKGROUND
+from src.entities.ecs import EntityStore, movement_system, animation_system, render_system
+from src.systems.world_objects import INTERACTIVE_KINDS
 
 class GameState(BaseState):
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.paused = False
         
-        # Game entities
+        # Game entities in one component store; the player is one of them
         self.player = None
-        self.entities = []
+        self.entities = EntityStore()
+        
+        # Sky, world and entity sprites, drawn together once queued
+        self.sprite_batch = SpriteBatch()
         
         # Game systems
         self.weather_system = None
         self.camera_system = None
         
-        # Game world
-        self.world_objects = []
+        # Game world, streamed in chunks around the camera
+        self.world = None
         self.ground_level = Config.SCREEN_HEIGHT - 100
+        self.window_light_timer = 0
+        
+        # Dirty-region tracking
+        self._full_redraw = True
+        self._last_frame_key = None
+        self._last_player_rect = None
         
         # UI elements
         self.pause_buttons = []
@@ -34,13 +49,15 @@ class GameState(BaseState):
         # Initialize player
         from src.entities.player import Player
         player_data = self.game_manager.get_player_data()
-        self.player = Player(Config.SCREEN_WIDTH // 2, self.ground_level - 50, player_data)
+        self.entities = EntityStore()
+        self.player = Player(Config.SCREEN_WIDTH // 2, self.ground_level - 50, player_data,
+                             self.game_manager.get_avatar_image(), self.entities)
         
         # Initialize systems
         from src.systems.weather_system import WeatherSystem
         from src.systems.camera_system import CameraSystem
         
-        self.weather_system = WeatherSystem()
+        self.weather_system = WeatherSystem(self.audio_manager)
         self.camera_system = CameraSystem(self.player)
         
         # Create world objects
@@ -49,9 +66,15 @@ class GameState(BaseState):
         # Create pause menu
         self._create_pause_menu()
         
+        # First frame after entering always updates the whole display
+        self._full_redraw = True
+        
     def exit(self):
         """Clean up game state"""
-        pass
+        if self.world:
+            self.world.close()
+        if self.weather_system:
+            self.weather_system.stop_sounds()
         
     def handle_event(self, event):
         """Handle game events"""
@@ -81,14 +104,14 @@ class GameState(BaseState):
                     
         elif event.type == pygame.MOUSEBUTTONDOWN and self.paused:
             if event.button == 1:  # Left click
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = event.pos
                 for i, button in enumerate(self.pause_buttons):
                     if button['rect'].collidepoint(mouse_pos):
                         self.selected_pause_button = i
                         self._handle_pause_button_action(button['action'])
                         
         elif event.type == pygame.MOUSEMOTION and self.paused:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             for i, button in enumerate(self.pause_buttons):
                 if button['rect'].collidepoint(mouse_pos):
                     self.selected_pause_button = i
@@ -108,7 +131,7 @@ class GameState(BaseState):
         """Update game state"""
         if not self.paused:
             # Handle continuous input
-            keys = pygame.key.get_pressed()
+            keys = self.game_manager.get_pressed_keys()
             
             # Player movement
             if keys[pygame.K_a] or keys[pygame.K_LEFT]:
@@ -120,147 +143,139 @@ class GameState(BaseState):
             else:
                 self.player.set_running(False)
                 
-            # Update player
-            self.player.update(dt, self.ground_level)
+            # Move and animate the player and every other entity
+            with self.profiler.section('entities'):
+                movement_system(self.entities, dt, self.ground_level)
+                animation_system(self.entities, dt)
             
             # Update systems
-            self.weather_system.update(dt)
-            self.camera_system.update(dt)
+            with self.profiler.section('weather'):
+                self.weather_system.update(dt)
+            with self.profiler.section('camera'):
+                self.camera_system.update(dt)
+                
+            # Stream world chunks in and out around the view
+            with self.profiler.section('world'):
+                if self.world.update(*self._view_range()):
+                    self._full_redraw = True
             
-            # Update entities
-            for entity in self.entities:
-                entity.update(dt)
+            # Slowly switch building lights on and off
+            self.window_light_timer += dt
+            if self.window_light_timer > Config.WINDOW_LIGHT_INTERVAL:
+                self._toggle_random_window()
+                self.window_light_timer = 0
                 
     def render(self, screen):
         """Render game state"""
-        # Sky background
+        # Sky background, fading to a lighter horizon
         sky_color = self.weather_system.get_sky_color()
-        screen.fill(sky_color)
-        
-        # Apply camera offset
-        camera_offset = self.camera_system.get_offset()
-        
-        # Draw world (3D-style perspective)
-        self._draw_world(screen, camera_offset)
-        
-        # Draw entities
-        for entity in self.entities:
-            entity.render(screen, camera_offset)
+        horizon_color = self.weather_system.get_horizon_color()
+        sky = vertical_gradient((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT),
+                                sky_color, horizon_color)
+        batch = self.sprite_batch
+        batch.add(sky, (0, 0), LAYER_BACKGROUND)
+        
+        # Apply camera offset, interpolated between simulation ticks
+        alpha = self.game_manager.render_alpha
+        camera_offset = self.camera_system.get_offset(alpha)
+        
+        # Queue world (3D-style perspective)
+        with self.profiler.section('world_draw'):
+            self._draw_world(screen, camera_offset, batch)
+        
+        # Queue every entity in view, the player on top, then the name tag
+        with self.profiler.section('entities_draw'):
+            render_system(self.entities, screen, camera_offset, alpha, batch=batch)
+            self.player.render_name(screen, camera_offset, alpha, batch)
             
-        # Draw player
-        self.player.render(screen, camera_offset)
+        # Draw everything queued in one call
+        with self.profiler.section('sprites'):
+            batch.flush(screen)
+            batch.end_frame()
         
         # Draw weather effects
-        self.weather_system.render(screen)
+        with self.profiler.section('weather_draw'):
+            self.weather_system.render(screen)
         
         # Draw HUD
-        self._draw_hud(screen)
+        with self.profiler.section('hud'):
+            self._draw_hud(screen)
         
         # Draw pause overlay
         if self.paused:
             self._draw_pause_overlay(screen)
             
+        return self._collect_dirty_rects(camera_offset, sky_color, alpha)
+        
+    def _collect_dirty_rects(self, camera_offset, sky_color, alpha):
+        """Get the screen regions that changed since the last frame"""
+        # Anything that moves the whole picture forces a full update, and
+        # entities besides the player can be anywhere on screen
+        frame_key = (camera_offset, sky_color, self.paused, self.selected_pause_button)
+        full_redraw = (self._full_redraw or frame_key != self._last_frame_key or
+                       len(self.entities) > 1 or
+                       self.weather_system.rain_intensity > 0 or
+                       self.weather_system.lightning_active)
+        self._full_redraw = False
+        self._last_frame_key = frame_key
+        
+        # Player sprite plus the name tag above it
+        player_x, player_y = self.player.get_render_pos(alpha)
+        player_rect = pygame.Rect(player_x + camera_offset[0] - 100,
+                                  player_y + camera_offset[1] - 25,
+                                  self.player.width + 200, self.player.height + 30)
+        previous_player_rect = self._last_player_rect or player_rect
+        self._last_player_rect = player_rect
+        
+        if full_redraw:
+            return None
+            
+        # HUD text along the top edge changes every frame (FPS, position)
+        hud_rect = pygame.Rect(0, 0, Config.SCREEN_WIDTH, 60)
+        return [hud_rect, previous_player_rect.union(player_rect)]
+            
     def _create_world(self):
-        """Create game world objects"""
-        # Ground
-        self.world_objects.append({
-            'type': 'ground',
-            'rect': pygame.Rect(0, self.ground_level, Config.SCREEN_WIDTH * 3, 100),
-            'color': Config.GREEN
-        })
-        
-        # Buildings (3D-style)
-        building_positions = [200, 500, 800, 1200, 1600]
-        for i, x in enumerate(building_positions):
-            height = random.randint(150, 300)
-            self.world_objects.append({
-                'type': 'building',
-                'rect': pygame.Rect(x, self.ground_level - height, 80, height),
-                'color': Config.GRAY,
-                'height': height,
-                'depth': 40
-            })
+        """Create the streamed game world around the starting view"""
+        from src.systems.world_streamer import WorldStreamer
+        
+        if self.world:
+            self.world.close()
             
-        # Trees
-        tree_positions = [150, 350, 650, 950, 1350]
-        for x in tree_positions:
-            self.world_objects.append({
-                'type': 'tree',
-                'rect': pygame.Rect(x, self.ground_level - 60, 20, 60),
-                'color': Config.GREEN,
-                'trunk_color': (139, 69, 19)
-            })
+        # Seeded from the global RNG so seeded runs get the same world
+        self.world = WorldStreamer(random.getrandbits(32), self.ground_level)
+        self.world.prime(*self._view_range())
+        self.world.start()
+        
+    def _view_range(self):
+        """Get the world x range the camera shows"""
+        left = -self.camera_system.x
+        return left, left + Config.SCREEN_WIDTH
+        
+    def _draw_world(self, screen, camera_offset, batch=None):
+        """Draw the visible chunks of the pre-rendered world, or queue them on a sprite batch"""
+        if self.world is None:
+            return
             
-    def _draw_world(self, screen, camera_offset):
-        """Draw world objects with 3D perspective"""
-        for obj in self.world_objects:
-            if obj['type'] == 'ground':
-                # Draw ground
-                rect = obj['rect'].copy()
-                rect.x += camera_offset[0]
-                pygame.draw.rect(screen, obj['color'], rect)
-                
-                # Ground texture lines
-                for i in range(0, rect.width, 50):
-                    line_x = rect.x + i
-                    if 0 <= line_x <= Config.SCREEN_WIDTH:
-                        pygame.draw.line(screen, Config.DARK_GRAY, 
-                                       (line_x, rect.y), (line_x, rect.bottom), 2)
-                        
-            elif obj['type'] == 'building':
-                # Draw building with 3D effect
-                rect = obj['rect'].copy()
-                rect.x += camera_offset[0]
-                
-                if -100 <= rect.x <= Config.SCREEN_WIDTH + 100:
-                    # Main building face
-                    pygame.draw.rect(screen, obj['color'], rect)
-                    
-                    # 3D depth effect
-                    depth = obj['depth']
-                    # Right face
-                    points = [
-                        (rect.right, rect.top),
-                        (rect.right + depth, rect.top - depth),
-                        (rect.right + depth, rect.bottom - depth),
-                        (rect.right, rect.bottom)
-                    ]
-                    darker_color = tuple(max(0, c - 30) for c in obj['color'])
-                    pygame.draw.polygon(screen, darker_color, points)
-                    
-                    # Top face
-                    points = [
-                        (rect.left, rect.top),
-                        (rect.left + depth, rect.top - depth),
-                        (rect.right + depth, rect.top - depth),
-                        (rect.right, rect.top)
-                    ]
-                    lighter_color = tuple(min(255, c + 20) for c in obj['color'])
-                    pygame.draw.polygon(screen, lighter_color, points)
-                    
-                    # Windows
-                    for row in range(2, obj['height'] // 30):
-                        for col in range(1, 3):
-                            window_x = rect.x + col * 25
-                            window_y = rect.y + row * 30
-                            window_rect = pygame.Rect(window_x, window_y, 15, 20)
-                            window_color = Config.YELLOW if random.random() > 0.3 else Config.DARK_GRAY
-                            pygame.draw.rect(screen, window_color, window_rect)
-                            
-            elif obj['type'] == 'tree':
-                # Draw tree
-                rect = obj['rect'].copy()
-                rect.x += camera_offset[0]
-                
-                if -50 <= rect.x <= Config.SCREEN_WIDTH + 50:
-                    # Trunk
-                    trunk_rect = pygame.Rect(rect.x + 5, rect.y + 40, 10, 20)
-                    pygame.draw.rect(screen, obj['trunk_color'], trunk_rect)
-                    
-                    # Leaves (circular)
-                    pygame.draw.circle(screen, obj['color'], 
-                                     (rect.centerx, rect.y + 20), 25)
-                                     
+        self.world.draw(screen, camera_offset, batch)
+        
+    def _toggle_random_window(self):
+        """Switch one random window and patch it into its chunk's surface"""
+        from src.systems.world_streamer import window_count, draw_window
+        from src.systems.world_objects import BUILDING
+        
+        buildings = [(chunk, building) for chunk in self.world.chunks.values()
+                     for building in chunk.layers[BUILDING] if window_count(building.height)]
+        if not buildings:
+            return
+            
+        chunk, building = random.choice(buildings)
+        index = random.randrange(window_count(building.height))
+        building.window_mask ^= 1 << index
+        
+        # Only the window itself changes, so redraw just that rect in place
+        draw_window(chunk.surface, building, index, chunk.facade_offset(building))
+        self._full_redraw = True
+        
     def _create_pause_menu(self):
         """Create pause menu buttons"""
         button_width = 200
@@ -274,34 +289,31 @@ class GameState(BaseState):
         
     def _draw_hud(self, screen):
         """Draw HUD elements"""
-        font = pygame.font.Font(None, 24)
-        
         # Player name
         player_name = self.game_manager.get_player_data().get('player_name', 'Player')
-        name_text = font.render(f"Player: {player_name}", True, Config.WHITE)
+        name_text = render_text(f"Player: {player_name}", 24, Config.WHITE)
         screen.blit(name_text, (10, 10))
         
         # Weather status
-        weather_text = font.render(f"Weather: {self.weather_system.current_weather.title()}", True, Config.WHITE)
+        weather_text = render_text(f"Weather: {self.weather_system.current_weather.title()}", 24, Config.WHITE)
         screen.blit(weather_text, (10, 35))
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 20)
         instructions = [
             "WASD/Arrow Keys: Move | Shift: Run | Space: Jump",
             "E: Interact | 1-3: Weather | ESC: Pause"
         ]
         for i, instruction in enumerate(instructions):
-            text = instruction_font.render(instruction, True, Config.WHITE)
+            text = render_text(instruction, 20, Config.WHITE)
             screen.blit(text, (10, Config.SCREEN_HEIGHT - 40 + i * 20))
         
         # FPS counter
         fps = int(self.game_manager.clock.get_fps())
-        fps_text = font.render(f"FPS: {fps}", True, Config.WHITE)
+        fps_text = render_text(f"FPS: {fps}", 24, Config.WHITE)
         screen.blit(fps_text, (Config.SCREEN_WIDTH - 80, 10))
         
         # Player position
-        pos_text = font.render(f"X: {int(self.player.x)}", True, Config.WHITE)
+        pos_text = render_text(f"X: {int(self.player.x)}", 24, Config.WHITE)
         screen.blit(pos_text, (Config.SCREEN_WIDTH - 100, 35))
         
     def _toggle_pause(self):
@@ -311,19 +323,15 @@ class GameState(BaseState):
     def _draw_pause_overlay(self, screen):
         """Draw pause overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(Config.BLACK)
+        overlay = overlay_surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), Config.BLACK, 128)
         screen.blit(overlay, (0, 0))
         
         # Pause title
-        font = pygame.font.Font(None, 72)
-        pause_text = font.render("PAUSED", True, Config.WHITE)
+        pause_text = render_text("PAUSED", 72, Config.WHITE)
         pause_rect = pause_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 200))
         screen.blit(pause_text, pause_rect)
         
         # Draw pause menu buttons
-        button_font = pygame.font.Font(None, 48)
         for i, button in enumerate(self.pause_buttons):
             color = Config.WHITE if i == self.selected_pause_button else Config.LIGHT_GRAY
             bg_color = Config.BLUE if i == self.selected_pause_button else Config.DARK_GRAY
@@ -331,7 +339,7 @@ class GameState(BaseState):
             pygame.draw.rect(screen, bg_color, button['rect'])
             pygame.draw.rect(screen, color, button['rect'], 2)
             
-            text = button_font.render(button['text'], True, color)
+            text = render_text(button['text'], 48, color)
             text_rect = text.get_rect(center=button['rect'].center)
             screen.blit(text, text_rect)
         
@@ -340,9 +348,9 @@ class GameState(BaseState):
         # Check for nearby interactive objects
         player_rect = pygame.Rect(self.player.x - 25, self.player.y - 25, 50, 50)
         
-        for obj in self.world_objects:
-            if obj['type'] in ['building', 'tree']:
-                if player_rect.colliderect(obj['rect']):
-                    self.audio_manager.play_sfx("interaction")
-                    print(f"Interacted with {obj['type']}")
-                    break
\ No newline at end of file
+        # Only objects overlapping the player are returned by the index
+        for obj in self.world.objects_in(player_rect):
+            if obj.kind in INTERACTIVE_KINDS:
+                self.audio_manager.play_sfx("interaction")
+                print(f"Interacted with {obj.name}")
+                break
\ No newline at end of file
@@ -5,14 +5,13 @@ Main menu state
 import pygame
 from src.states.base_state import BaseState
 from src.config import Config
+from src.graphics.font_cache import render_text
+from src.graphics.gradient import vertical_gradient
 
 class MainMenuState(BaseState):
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.background_color = Config.CLEAR_SKY
-        self.title_font = pygame.font.Font(None, 72)
-        self.subtitle_font = pygame.font.Font(None, 36)
-        self.button_font = pygame.font.Font(None, 48)
         
         # Button properties
         self.buttons = []
@@ -22,6 +21,12 @@ class MainMenuState(BaseState):
         self.title_pulse = 0
         self.particle_system = []
         
+        # Profile list; thumbnails are loaded only for the page on screen
+        self.profiles = None
+        self.profile_page = 0
+        self.profile_rows = []
+        self.profile_rect = pygame.Rect(Config.SCREEN_WIDTH - 370, 260, 340, 60 * Config.PROFILE_PAGE_SIZE + 40)
+        
     def enter(self):
         """Initialize main menu"""
         # Create buttons
@@ -32,13 +37,18 @@ class MainMenuState(BaseState):
         
         self.buttons = [
             {'text': 'Start Adventure', 'rect': pygame.Rect(button_x, start_y, button_width, button_height), 'action': 'start'},
-            {'text': 'Settings', 'rect': pygame.Rect(button_x, start_y + 80, button_width, button_height), 'action': 'settings'},
-            {'text': 'Quit Game', 'rect': pygame.Rect(button_x, start_y + 160, button_width, button_height), 'action': 'quit'}
+            {'text': 'New Profile', 'rect': pygame.Rect(button_x, start_y + 80, button_width, button_height), 'action': 'new_profile'},
+            {'text': 'Settings', 'rect': pygame.Rect(button_x, start_y + 160, button_width, button_height), 'action': 'settings'},
+            {'text': 'Quit Game', 'rect': pygame.Rect(button_x, start_y + 240, button_width, button_height), 'action': 'quit'}
         ]
         
         # Initialize particles
         self._init_particles()
         
+        # Read the profile index once; pages are sliced from it
+        self.profiles = self.game_manager.save_manager.store.list_profiles()
+        self._show_profile_page(self.profile_page)
+        
     def exit(self):
         """Clean up main menu"""
         pass
@@ -54,17 +64,31 @@ class MainMenuState(BaseState):
                 self.audio_manager.play_sfx("button_click")
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                 self._handle_button_action(self.buttons[self.selected_button]['action'])
+            elif event.key == pygame.K_PAGEUP or event.key == pygame.K_LEFT:
+                self._show_profile_page(self.profile_page - 1)
+            elif event.key == pygame.K_PAGEDOWN or event.key == pygame.K_RIGHT:
+                self._show_profile_page(self.profile_page + 1)
+                
+        elif event.type == pygame.MOUSEWHEEL:
+            if self.profile_rect.collidepoint(pygame.mouse.get_pos()):
+                self._show_profile_page(self.profile_page - event.y)
                 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = event.pos
                 for i, button in enumerate(self.buttons):
                     if button['rect'].collidepoint(mouse_pos):
                         self.selected_button = i
                         self._handle_button_action(button['action'])
                         
+                # Pick a profile from the list
+                for row in self.profile_rows:
+                    if row['rect'].collidepoint(mouse_pos):
+                        self.audio_manager.play_sfx("button_click")
+                        self.game_manager.select_profile(row['profile']['id'])
+                        
         elif event.type == pygame.MOUSEMOTION:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             for i, button in enumerate(self.buttons):
                 if button['rect'].collidepoint(mouse_pos):
                     self.selected_button = i
@@ -82,6 +106,9 @@ class MainMenuState(BaseState):
                 self.game_manager.change_state(GameStateType.PLAYING)
             else:
                 self.game_manager.change_state(GameStateType.AVATAR_CREATION)
+        elif action == 'new_profile':
+            self.game_manager.new_profile()
+            self.game_manager.change_state(GameStateType.AVATAR_CREATION)
         elif action == 'settings':
             # TODO: Implement settings menu
             pass
@@ -107,7 +134,7 @@ class MainMenuState(BaseState):
         # Draw title with pulse effect
         import math
         pulse_scale = 1.0 + 0.1 * abs(math.sin(self.title_pulse))
-        title_text = self.title_font.render("StormRunner", True, Config.WHITE)
+        title_text = render_text("StormRunner", 72, Config.WHITE)
         title_rect = title_text.get_rect()
         
         # Scale title
@@ -118,7 +145,7 @@ class MainMenuState(BaseState):
         screen.blit(scaled_title, scaled_rect)
         
         # Draw subtitle
-        subtitle_text = self.subtitle_font.render("3D Adventure Game", True, Config.LIGHT_GRAY)
+        subtitle_text = render_text("3D Adventure Game", 36, Config.LIGHT_GRAY)
         subtitle_rect = subtitle_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 220))
         screen.blit(subtitle_text, subtitle_rect)
         
@@ -132,31 +159,83 @@ class MainMenuState(BaseState):
             pygame.draw.rect(screen, color, button['rect'], 2)
             
             # Draw button text
-            text = self.button_font.render(button['text'], True, color)
+            text = render_text(button['text'], 48, color)
             text_rect = text.get_rect(center=button['rect'].center)
             screen.blit(text, text_rect)
         
+        # Draw profile list
+        self._draw_profiles(screen)
+        
         # Draw instructions
-        instruction_font = pygame.font.Font(None, 24)
-        instruction_text = instruction_font.render("Use Arrow Keys and Enter, or click with mouse", True, Config.GRAY)
+        instruction_text = render_text("Use Arrow Keys and Enter, or click with mouse", 24, Config.GRAY)
         instruction_rect = instruction_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 50))
         screen.blit(instruction_text, instruction_rect)
         
         # Draw version info
-        version_font = pygame.font.Font(None, 24)
-        version_text = version_font.render("v1.0.0 - Python Edition", True, Config.GRAY)
+        version_text = render_text("v1.0.0 - Python Edition", 24, Config.GRAY)
         version_rect = version_text.get_rect(bottomright=(Config.SCREEN_WIDTH - 10, Config.SCREEN_HEIGHT - 10))
         screen.blit(version_text, version_rect)
         
+    def _page_count(self):
+        """Get the number of profile pages"""
+        page_size = Config.PROFILE_PAGE_SIZE
+        return max(1, (len(self.profiles) + page_size - 1) // page_size)
+        
+    def _show_profile_page(self, page):
+        """Switch the profile list to a page and load its thumbnails"""
+        from src.graphics.image_tools import to_surface
+        
+        self.profile_page = max(0, min(page, self._page_count() - 1))
+        store = self.game_manager.save_manager.store
+        
+        # Thumbnails of the previous page are dropped with its rows
+        self.profile_rows = []
+        for i, profile in enumerate(store.get_page(self.profile_page, Config.PROFILE_PAGE_SIZE, self.profiles)):
+            thumbnail = store.load_thumbnail(profile)
+            self.profile_rows.append({
+                'profile': profile,
+                'rect': pygame.Rect(self.profile_rect.x + 5, self.profile_rect.y + 35 + i * 60,
+                                    self.profile_rect.width - 10, 56),
+                'thumbnail': to_surface(thumbnail) if thumbnail is not None else None
+            })
+            
+    def _draw_profiles(self, screen):
+        """Draw the current page of the profile list"""
+        import time
+        
+        if not self.profile_rows:
+            return
+            
+        pygame.draw.rect(screen, Config.DARK_GRAY, self.profile_rect)
+        pygame.draw.rect(screen, Config.LIGHT_GRAY, self.profile_rect, 2)
+        header = render_text(f"Profiles ({len(self.profiles)})  page {self.profile_page + 1}/{self._page_count()}",
+                             24, Config.WHITE)
+        screen.blit(header, (self.profile_rect.x + 10, self.profile_rect.y + 8))
+        
+        current_id = self.game_manager.save_manager.profile_id
+        for row in self.profile_rows:
+            profile = row['profile']
+            rect = row['rect']
+            if profile['id'] == current_id:
+                pygame.draw.rect(screen, Config.BLUE, rect)
+                
+            thumb_rect = pygame.Rect(rect.x + 4, rect.y + 4, 48, 48)
+            if row['thumbnail']:
+                screen.blit(row['thumbnail'], thumb_rect)
+            else:
+                pygame.draw.rect(screen, Config.GRAY, thumb_rect)
+                
+            name_text = render_text(profile['name'] or "Player", 24, Config.WHITE)
+            screen.blit(name_text, (rect.x + 60, rect.y + 6))
+            played = time.strftime("%Y-%m-%d", time.localtime(profile['last_played']))
+            details = render_text(f"High score {profile['high_score']}  -  {played}", 20, Config.LIGHT_GRAY)
+            screen.blit(details, (rect.x + 60, rect.y + 30))
+            
     def _draw_gradient_background(self, screen):
         """Draw gradient background"""
-        for y in range(Config.SCREEN_HEIGHT):
-            ratio = y / Config.SCREEN_HEIGHT
-            color = [
-                int(Config.CLEAR_SKY[i] * (1 - ratio) + Config.DARK_GRAY[i] * ratio)
-                for i in range(3)
-            ]
-            pygame.draw.line(screen, color, (0, y), (Config.SCREEN_WIDTH, y))
+        background = vertical_gradient((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT),
+                                       Config.CLEAR_SKY, Config.DARK_GRAY)
+        screen.blit(background, (0, 0))
             
     def _init_particles(self):
         """Initialize background particles"""
@@ -11,6 +11,8 @@ class CameraSystem:
         self.target = target
         self.x = 0
         self.y = 0
+        self.prev_x = 0
+        self.prev_y = 0
         self.shake_intensity = 0
         self.shake_duration = 0
         self.shake_timer = 0
@@ -22,6 +24,10 @@ class CameraSystem:
         
     def update(self, dt):
         """Update camera position"""
+        # Remember last tick's position for render interpolation
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         if self.target:
             # Calculate target position
             target_x = self.target.x - Config.SCREEN_WIDTH // 2
@@ -43,11 +49,10 @@ class CameraSystem:
             elif self.target.y > camera_center_y + self.dead_zone_height // 2:
                 self.y = -(self.target.y - Config.SCREEN_HEIGHT // 2 - self.dead_zone_height // 2)
                 
-            # Smooth camera movement
-            self.x = self.x * (1 - self.follow_speed) + target_x * self.follow_speed
+            # Smooth camera movement toward centring the target
+            self.x = self.x * (1 - self.follow_speed) - target_x * self.follow_speed
             
-            # Limit camera bounds
-            self.x = max(-Config.SCREEN_WIDTH, min(0, self.x))
+            # Limit vertical camera bounds; the world is endless horizontally
             self.y = max(-200, min(0, self.y))
             
         # Update camera shake
@@ -58,10 +63,10 @@ class CameraSystem:
             if self.shake_duration <= 0:
                 self.shake_intensity = 0
                 
-    def get_offset(self):
-        """Get camera offset with shake"""
-        offset_x = self.x
-        offset_y = self.y
+    def get_offset(self, alpha=1.0):
+        """Get camera offset with shake, interpolated between ticks"""
+        offset_x = self.prev_x + (self.x - self.prev_x) * alpha
+        offset_y = self.prev_y + (self.y - self.prev_y) * alpha
         
         # Add shake effect
         if self.shake_intensity > 0:
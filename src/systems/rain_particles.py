@@ -0,0 +1,110 @@
+"""
+Structure-of-arrays rain particle engine backed by NumPy
+"""
+
+import random
+import pygame
+import numpy as np
+
+class RainParticleSystem:
+    # Longest streak a drop can have, in pixels
+    MAX_LENGTH = 20
+    MIN_LENGTH = 10
+    
+    def __init__(self, count, width, height, seed=None):
+        self.count = count
+        self.width = width
+        self.height = height
+        
+        # Derive the generator from the stdlib RNG so seeding `random` is enough
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.rng = np.random.default_rng(seed)
+        
+        # Contiguous particle attributes
+        self.x = self.rng.integers(0, width, count, endpoint=True).astype(np.float32)
+        self.y = self.rng.integers(-height, 0, count, endpoint=True).astype(np.float32)
+        self.speed = self.rng.uniform(5, 15, count).astype(np.float32)
+        self.length = self.rng.integers(self.MIN_LENGTH, self.MAX_LENGTH, count, endpoint=True).astype(np.int16)
+        self.alpha = self.rng.integers(100, 255, count, endpoint=True).astype(np.int16)
+        
+        # Step offsets along a streak, shared by every drop
+        self._steps = np.arange(self.MAX_LENGTH + 1, dtype=np.int32)
+        self._streak_cache = {}
+        
+    def update(self, dt, intensity, wind):
+        """Integrate all drops, then respawn the ones that left the screen"""
+        if intensity <= 0:
+            return
+            
+        self.y += self.speed * (dt * 0.1 * intensity)
+        self.x += wind * dt * 0.05
+        
+        # Drops that fell past the bottom restart above the screen
+        fallen = self.y > self.height
+        fallen_count = int(np.count_nonzero(fallen))
+        if fallen_count:
+            self.y[fallen] = self.rng.integers(-50, -10, fallen_count, endpoint=True)
+            self.x[fallen] = self.rng.integers(0, self.width, fallen_count, endpoint=True)
+            
+        # Drops blown off either side reappear at a random column
+        drifted = (self.x < -10) | (self.x > self.width + 10)
+        drifted_count = int(np.count_nonzero(drifted))
+        if drifted_count:
+            self.x[drifted] = self.rng.integers(0, self.width, drifted_count, endpoint=True)
+            
+    def visible_mask(self, intensity):
+        """Get mask of drops that are on screen and not fully transparent"""
+        return ((self.x >= 0) & (self.x <= self.width) &
+                (self.y >= 0) & (self.y <= self.height) &
+                ((self.alpha * intensity).astype(np.int16) > 0))
+                
+    def _streak_tables(self, slant):
+        """Get per-length x offsets and step masks for a given slant"""
+        if slant not in self._streak_cache:
+            steps = self._steps
+            lengths = np.maximum(steps, 1)
+            offsets = -(slant * steps[None, :]) // lengths[:, None]
+            on_streak = steps[None, :] <= lengths[:, None]
+            self._streak_cache[slant] = (offsets.astype(np.int32), on_streak)
+        return self._streak_cache[slant]
+        
+    def render(self, surface, intensity, slant, color):
+        """Rasterise every visible streak into the surface in one pass"""
+        visible = self.visible_mask(intensity)
+        if not visible.any():
+            return
+            
+        # The pair-write trick below needs 32-bit pixels and 8-byte aligned rows
+        pitch = surface.get_pitch()
+        if surface.get_bytesize() != 4 or pitch % 8:
+            self._render_lines(surface, visible, slant, color)
+            return
+            
+        x0 = self.x[visible].astype(np.int32)
+        y0 = self.y[visible].astype(np.int32)
+        length = self.length[visible]
+        offsets, on_streak = self._streak_tables(int(slant))
+        
+        # Streaks are two pixels wide, so each step writes one aligned pixel
+        # pair as a single 64-bit word; shape is (drops, steps)
+        columns = (x0[:, None] + offsets[length]) >> 1
+        rows = y0[:, None] + self._steps
+        keep = (on_streak[length] & (rows < surface.get_height()) &
+                (columns >= 0) & (columns < surface.get_width() // 2))
+        indices = rows[keep] * (pitch // 8) + columns[keep]
+        
+        mapped = np.uint64(surface.map_rgb(color) & 0xFFFFFFFF)
+        buffer = surface.get_buffer()
+        pixel_pairs = np.frombuffer(buffer, dtype=np.uint64)
+        pixel_pairs[indices] = mapped | (mapped << np.uint64(32))
+        
+        # Release the buffer so the surface is unlocked for blitting
+        del pixel_pairs, buffer
+        
+    def _render_lines(self, surface, visible, slant, color):
+        """Fallback renderer drawing one line per drop"""
+        for x, y, length in zip(self.x[visible], self.y[visible], self.length[visible]):
+            start_pos = (int(x), int(y))
+            end_pos = (int(x - slant), int(y + length))
+            pygame.draw.line(surface, color, start_pos, end_pos, 2)
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+Uniform-grid spatial index for range queries over world rects
+"""
+
+from src.config import Config
+
+class SpatialGrid:
+    """Items bucketed into square cells by the rects they cover
+    
+    Queries only look at the cells a rect touches, so their cost depends
+    on how much is near the query, not on how many items exist. Items can
+    be anything; they are tracked by identity and kept alive while indexed.
+    """
+    
+    def __init__(self, cell_size=None):
+        self.cell_size = cell_size or Config.SPATIAL_CELL_SIZE
+        
+        # Cell (column, row) -> {item id: item}
+        self.cells = {}
+        
+        # Item id -> (item, rect, cells it is in)
+        self.entries = {}
+        
+    def __len__(self):
+        return len(self.entries)
+        
+    def __contains__(self, item):
+        return id(item) in self.entries
+        
+    def _cells_for(self, rect):
+        """Get the cells a rect overlaps"""
+        size = self.cell_size
+        columns = range(rect.left // size, (rect.right - 1) // size + 1)
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+        return tuple((column, row) for column in columns for row in rows)
+        
+    def insert(self, item, rect):
+        """Add an item covering a rect"""
+        key = id(item)
+        if key in self.entries:
+            self.move(item, rect)
+            return
+            
+        cells = self._cells_for(rect)
+        self.entries[key] = (item, rect.copy(), cells)
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                bucket = self.cells[cell] = {}
+            bucket[key] = item
+            
+    def remove(self, item):
+        """Drop an item; unknown items are ignored"""
+        key = id(item)
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+            
+        for cell in entry[2]:
+            bucket = self.cells[cell]
+            del bucket[key]
+            if not bucket:
+                del self.cells[cell]
+                
+    def move(self, item, rect):
+        """Update the rect of an indexed item"""
+        key = id(item)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.insert(item, rect)
+            return
+            
+        # Moving within the same cells only replaces the rect
+        cells = self._cells_for(rect)
+        if cells == entry[2]:
+            self.entries[key] = (item, rect.copy(), cells)
+            return
+            
+        self.remove(item)
+        self.insert(item, rect)
+        
+    def query(self, rect):
+        """Get the items whose rects overlap a rect"""
+        entries = self.entries
+        cells = self._cells_for(rect)
+        if len(cells) == 1:
+            bucket = self.cells.get(cells[0])
+            if not bucket:
+                return []
+            return [item for key, item in bucket.items() if entries[key][1].colliderect(rect)]
+            
+        # Items spanning several cells show up in each of them
+        found = {}
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket:
+                for key, item in bucket.items():
+                    if key not in found and entries[key][1].colliderect(rect):
+                        found[key] = item
+        return list(found.values())
+        
+    def clear(self):
+        """Drop all items"""
+        self.cells.clear()
+        self.entries.clear()
\ No newline at end of file
@@ -6,9 +6,10 @@ import pygame
 import random
 import math
 from src.config import Config
+from src.graphics.surface_manager import overlay_surface
 
 class WeatherSystem:
-    def __init__(self):
+    def __init__(self, audio_manager=None):
         self.current_weather = "clear"
         self.weather_timer = 0
         self.weather_change_interval = Config.WEATHER_CHANGE_INTERVAL
@@ -26,20 +27,20 @@ class WeatherSystem:
         self.wind_strength = 0
         self.wind_direction = 1
         
+        # Rain and thunder sounds, when there is an audio manager to play them
+        self.audio_manager = audio_manager
+        self.rain_playing = False
+        self.rain_channel = None
+        
         # Initialize particles
         self._init_rain_particles()
         
     def _init_rain_particles(self):
         """Initialize rain particles"""
-        for _ in range(Config.RAIN_PARTICLES):
-            particle = {
-                'x': random.randint(0, Config.SCREEN_WIDTH),
-                'y': random.randint(-Config.SCREEN_HEIGHT, 0),
-                'speed': random.uniform(5, 15),
-                'length': random.randint(10, 20),
-                'alpha': random.randint(100, 255)
-            }
-            self.rain_particles.append(particle)
+        from src.systems.rain_particles import RainParticleSystem
+        self.rain_particles = RainParticleSystem(
+            Config.RAIN_PARTICLES, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT
+        )
             
     def set_weather(self, weather_type):
         """Set weather type"""
@@ -74,8 +75,9 @@ class WeatherSystem:
                 self._trigger_lightning()
                 self.lightning_timer = 0
                 
-        # Update rain particles
+        # Update rain particles and sound
         self._update_rain(dt)
+        self._update_rain_sound()
         
         # Update lightning
         if self.lightning_active:
@@ -83,6 +85,13 @@ class WeatherSystem:
             if self.lightning_duration <= 0:
                 self.lightning_active = False
                 
+    def stop_sounds(self):
+        """Stop the rain sound, e.g. when leaving the game"""
+        if self.rain_playing:
+            self.audio_manager.stop_sfx('rain')
+            self.rain_playing = False
+            self.rain_channel = None
+            
     def render(self, screen):
         """Render weather effects"""
         # Rain
@@ -113,6 +122,14 @@ class WeatherSystem:
             )
         return Config.CLEAR_SKY
         
+    def get_horizon_color(self):
+        """Get sky color near the horizon, a lighter haze of the sky color"""
+        sky_color = self.get_sky_color()
+        return tuple(
+            int(sky_color[i] * (1 - Config.HORIZON_HAZE) + Config.LIGHT_GRAY[i] * Config.HORIZON_HAZE)
+            for i in range(3)
+        )
+        
     def _change_weather_randomly(self):
         """Randomly change weather"""
         weather_types = ["clear", "rain", "storm"]
@@ -122,45 +139,40 @@ class WeatherSystem:
         
     def _update_rain(self, dt):
         """Update rain particles"""
-        if self.rain_intensity > 0:
-            for particle in self.rain_particles:
-                # Move particle
-                particle['y'] += particle['speed'] * dt * 0.1 * self.rain_intensity
-                particle['x'] += self.wind_strength * self.wind_direction * dt * 0.05
-                
-                # Reset particle if off screen
-                if particle['y'] > Config.SCREEN_HEIGHT:
-                    particle['y'] = random.randint(-50, -10)
-                    particle['x'] = random.randint(0, Config.SCREEN_WIDTH)
-                    
-                if particle['x'] < -10 or particle['x'] > Config.SCREEN_WIDTH + 10:
-                    particle['x'] = random.randint(0, Config.SCREEN_WIDTH)
+        self.rain_particles.update(dt, self.rain_intensity,
+                                   self.wind_strength * self.wind_direction)
                     
+    def _update_rain_sound(self):
+        """Loop the rain sound while it rains, as loud as the rain is heavy"""
+        if self.audio_manager is None:
+            return
+        if self.rain_intensity <= 0:
+            self.stop_sounds()
+            return
+            
+        if not self.rain_playing:
+            self.rain_channel = self.audio_manager.play_sfx('rain', loops=-1)
+            self.rain_playing = True
+        if self.rain_channel is not None:
+            self.rain_channel.set_volume(self.rain_intensity)
+            
     def _render_rain(self, screen):
         """Render rain particles"""
-        for particle in self.rain_particles:
-            if 0 <= particle['x'] <= Config.SCREEN_WIDTH and 0 <= particle['y'] <= Config.SCREEN_HEIGHT:
-                alpha = int(particle['alpha'] * self.rain_intensity)
-                if alpha > 0:
-                    # Create rain drop line
-                    start_pos = (int(particle['x']), int(particle['y']))
-                    end_pos = (int(particle['x'] - self.wind_strength * 5), 
-                             int(particle['y'] + particle['length']))
-                    
-                    # Draw rain line
-                    pygame.draw.line(screen, Config.RAIN_COLOR, start_pos, end_pos, 2)
+        self.rain_particles.render(screen, self.rain_intensity,
+                                   self.wind_strength * 5, Config.RAIN_COLOR)
                     
     def _trigger_lightning(self):
         """Trigger lightning effect"""
         self.lightning_active = True
         self.lightning_duration = Config.LIGHTNING_DURATION
+        if self.audio_manager is not None:
+            self.audio_manager.play_sfx('thunder')
         
     def _render_lightning(self, screen):
         """Render lightning effect"""
         # Flash effect
-        lightning_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-        lightning_surface.set_alpha(100)
-        lightning_surface.fill(Config.LIGHTNING_COLOR)
+        lightning_surface = overlay_surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT),
+                                            Config.LIGHTNING_COLOR, 100)
         screen.blit(lightning_surface, (0, 0))
         
         # Lightning bolt
@@ -0,0 +1,225 @@
+"""
+Background webcam capture with a bounded latest-frame-wins queue
+"""
+
+import time
+import threading
+from collections import deque
+from src.config import Config
+
+class CameraSource:
+    """Live webcam read through OpenCV"""
+    
+    def __init__(self, index=0):
+        import cv2
+        self.capture = cv2.VideoCapture(index)
+        if self.capture.isOpened():
+            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, Config.WEBCAM_WIDTH)
+            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, Config.WEBCAM_HEIGHT)
+            
+    def is_opened(self):
+        """Check if the camera could be opened"""
+        return self.capture.isOpened()
+        
+    def read(self):
+        """Block until the next BGR frame is available"""
+        return self.capture.read()
+        
+    def release(self):
+        """Release the camera"""
+        self.capture.release()
+
+class FileReplaySource:
+    """Replays BGR frames from a video or .npy file in place of a webcam
+    
+    A .npy file holds a (frames, height, width, 3) array. Frames loop
+    forever and, when realtime is set, are paced to the given rate like a
+    real camera.
+    """
+    
+    def __init__(self, path, fps=30, realtime=True):
+        self.path = path
+        self.interval = 1.0 / fps if fps else 0.0
+        self.realtime = realtime
+        self.frames = self._load(path)
+        self.index = 0
+        self.next_time = time.perf_counter()
+        
+    def _load(self, path):
+        """Load every frame of the file into memory"""
+        if path.endswith(".npy"):
+            import numpy as np
+            return list(np.load(path))
+            
+        import cv2
+        capture = cv2.VideoCapture(path)
+        frames = []
+        while True:
+            ret, frame = capture.read()
+            if not ret:
+                break
+            frames.append(frame)
+        capture.release()
+        return frames
+        
+    def is_opened(self):
+        """Check if the file had any frames"""
+        return len(self.frames) > 0
+        
+    def read(self):
+        """Get the next frame, waiting for its turn when replaying in real time"""
+        if not self.frames:
+            return False, None
+            
+        if self.realtime:
+            delay = self.next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self.next_time = max(self.next_time + self.interval, time.perf_counter())
+            
+        frame = self.frames[self.index]
+        self.index = (self.index + 1) % len(self.frames)
+        return True, frame.copy()
+        
+    def release(self):
+        """Drop the loaded frames"""
+        self.frames = []
+
+def open_source(index=0):
+    """Open the configured replay file, or the webcam; None if neither works"""
+    try:
+        if Config.WEBCAM_REPLAY_PATH:
+            source = FileReplaySource(Config.WEBCAM_REPLAY_PATH)
+        else:
+            source = CameraSource(index)
+        if source.is_opened():
+            return source
+        source.release()
+    except Exception as e:
+        print(f"Camera initialization failed: {e}")
+    return None
+
+class WebcamCapture:
+    """Reads and converts frames on a worker thread
+    
+    Frames are mirrored, converted to RGB and resized to the preview size
+    before they reach the main thread. Only the newest frames are kept;
+    older ones are counted as dropped.
+    """
+    
+    def __init__(self, source, size, mirror=True, queue_size=None):
+        self.source = source
+        self.size = size
+        self.mirror = mirror
+        
+        # Ready frames as (rgb_frame, capture_time), newest last
+        self._frames = deque(maxlen=queue_size or Config.WEBCAM_QUEUE_SIZE)
+        self._ready = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread = None
+        
+        # Counters
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+        self.failed_reads = 0
+        self.latencies = deque(maxlen=120)
+        self.process_times = deque(maxlen=120)
+        
+    def start(self):
+        """Start capturing on the worker thread"""
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="webcam-capture", daemon=True)
+            self._thread.start()
+        return self
+        
+    def release(self):
+        """Stop the worker thread and release the source
+        
+        A running worker releases the source itself once it stops reading,
+        which may be after this returns if a read is blocked.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        else:
+            self.source.release()
+        
+    def process(self, frame):
+        """Mirror, convert and resize a BGR frame to a preview-sized RGB frame"""
+        import cv2
+        
+        if self.mirror:
+            frame = cv2.flip(frame, 1)
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return cv2.resize(frame, self.size)
+        
+    def _run(self):
+        """Capture loop run by the worker thread"""
+        try:
+            self._capture_frames()
+        finally:
+            self.source.release()
+            
+    def _capture_frames(self):
+        """Read and queue frames until stopped"""
+        while not self._stop_event.is_set():
+            try:
+                ret, frame = self.source.read()
+                captured_at = time.perf_counter()
+                if not ret:
+                    self.failed_reads += 1
+                    time.sleep(0.01)
+                    continue
+                    
+                frame = self.process(frame)
+                self.process_times.append((time.perf_counter() - captured_at) * 1000.0)
+            except Exception as e:
+                print(f"Camera capture error: {e}")
+                self.failed_reads += 1
+                time.sleep(0.1)
+                continue
+                
+            with self._ready:
+                if len(self._frames) == self._frames.maxlen:
+                    self.frames_dropped += 1
+                self._frames.append((frame, captured_at))
+                self.frames_captured += 1
+                self._ready.notify()
+                
+    def get_frame(self, timeout=0.0):
+        """Get the newest ready frame, or None if nothing new arrived
+        
+        With a timeout, waits up to that many seconds for a frame.
+        """
+        with self._ready:
+            if not self._frames and timeout > 0:
+                self._ready.wait(timeout)
+            if not self._frames:
+                return None
+                
+            frame, captured_at = self._frames.pop()
+            
+            # Anything older than the newest frame is never shown
+            self.frames_dropped += len(self._frames)
+            self._frames.clear()
+            
+        self.frames_delivered += 1
+        self.latencies.append((time.perf_counter() - captured_at) * 1000.0)
+        return frame
+        
+    def get_stats(self):
+        """Get frame counters and average latencies in milliseconds"""
+        latencies = list(self.latencies)
+        process_times = list(self.process_times)
+        return {
+            'captured': self.frames_captured,
+            'delivered': self.frames_delivered,
+            'dropped': self.frames_dropped,
+            'failed_reads': self.failed_reads,
+            'latency_ms': sum(latencies) / len(latencies) if latencies else 0.0,
+            'max_latency_ms': max(latencies) if latencies else 0.0,
+            'process_ms': sum(process_times) / len(process_times) if process_times else 0.0,
+        }
\ No newline at end of file
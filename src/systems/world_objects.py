@@ -0,0 +1,76 @@
+"""
+Compact world objects tagged with integer kind ids
+
+Each kind is a slotted class, so an object carries no per-instance dict
+and only the fields its kind needs. Values shared by every object of a
+kind live on the class, and derived colors are worked out once and
+shared between objects of the same color.
+"""
+
+from src.config import Config
+
+# Kind ids, also the order chunks draw their kinds in
+GROUND = 0
+BUILDING = 1
+TREE = 2
+KIND_NAMES = ('ground', 'building', 'tree')
+
+# Kinds the player can interact with
+INTERACTIVE_KINDS = frozenset((BUILDING, TREE))
+
+# Shaded colors by (color, amount)
+_shades = {}
+
+def shade(color, amount):
+    """Get a color lightened (or darkened, for negative amounts) by a fixed step"""
+    key = (color, amount)
+    shaded = _shades.get(key)
+    if shaded is None:
+        shaded = _shades[key] = tuple(max(0, min(255, c + amount)) for c in color)
+    return shaded
+
+class WorldObject:
+    """Base of all world objects: a kind id and a world rect"""
+    
+    __slots__ = ('rect',)
+    kind = None
+    
+    def __init__(self, rect):
+        self.rect = rect
+        
+    @property
+    def name(self):
+        return KIND_NAMES[self.kind]
+
+class Ground(WorldObject):
+    """A strip of ground under a chunk"""
+    
+    __slots__ = ()
+    kind = GROUND
+    color = Config.GREEN
+
+class Building(WorldObject):
+    """A building with its face colors and a bit per window for lit windows"""
+    
+    __slots__ = ('color', 'darker_color', 'lighter_color', 'depth', 'window_mask')
+    kind = BUILDING
+    
+    def __init__(self, rect, color, depth, window_mask):
+        self.rect = rect
+        self.color = color
+        self.darker_color = shade(color, -30)
+        self.lighter_color = shade(color, 20)
+        self.depth = depth
+        self.window_mask = window_mask
+        
+    @property
+    def height(self):
+        return self.rect.height
+
+class Tree(WorldObject):
+    """A tree with a round crown"""
+    
+    __slots__ = ()
+    kind = TREE
+    color = Config.GREEN
+    trunk_color = (139, 69, 19)
\ No newline at end of file
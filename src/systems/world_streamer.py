@@ -0,0 +1,337 @@
+"""
+Endless world made of procedurally generated, fixed-width chunks
+
+Chunk contents depend only on the world seed and the chunk index, so a
+chunk can be thrown away when the camera leaves it and rebuilt
+identically when it comes back. Chunks are generated and baked into one
+surface each on a worker thread ahead of the camera, and only the chunks
+around the view are kept, so memory and per-frame cost don't grow with
+the distance travelled.
+"""
+
+import itertools
+import queue
+import random
+import threading
+import pygame
+from src.config import Config
+from src.graphics.surface_manager import create_surface, prepare
+from src.systems.spatial_index import SpatialGrid
+from src.systems.world_objects import GROUND, BUILDING, TREE, KIND_NAMES, Ground, Building, Tree
+
+# Building and tree dimensions
+BUILDING_WIDTH = 80
+BUILDING_DEPTH = 40
+BUILDING_MIN_HEIGHT = 150
+BUILDING_MAX_HEIGHT = 300
+TREE_WIDTH = 20
+TREE_HEIGHT = 60
+LEAF_RADIUS = 25
+
+# Ground strip below ground level
+GROUND_HEIGHT = 100
+
+def window_count(height):
+    """Get number of windows on a building of the given height"""
+    return max(0, height // 30 - 2) * 2
+
+def window_rect(building, index):
+    """Get window rect relative to the building's facade"""
+    row = index // 2 + 2
+    col = index % 2 + 1
+    return pygame.Rect(col * 25, building.depth + row * 30, 15, 20)
+
+def draw_window(surface, building, index, offset):
+    """Draw one window of a building in its current lit state"""
+    lit = building.window_mask & (1 << index)
+    window_color = Config.YELLOW if lit else Config.DARK_GRAY
+    pygame.draw.rect(surface, window_color, window_rect(building, index).move(offset))
+
+def draw_building(surface, building, offset):
+    """Draw a building facade with its 3D faces and windows at a facade offset"""
+    width = building.rect.width
+    height = building.rect.height
+    depth = building.depth
+    x, y = offset
+    
+    # Main building face
+    pygame.draw.rect(surface, building.color, (x, y + depth, width, height))
+    
+    # Right face
+    points = [
+        (x + width, y + depth),
+        (x + width + depth, y),
+        (x + width + depth, y + height),
+        (x + width, y + height + depth)
+    ]
+    pygame.draw.polygon(surface, building.darker_color, points)
+    
+    # Top face
+    points = [
+        (x, y + depth),
+        (x + depth, y),
+        (x + width + depth, y),
+        (x + width, y + depth)
+    ]
+    pygame.draw.polygon(surface, building.lighter_color, points)
+    
+    # Windows
+    for index in range(window_count(height)):
+        draw_window(surface, building, index, offset)
+
+class Chunk:
+    """One slice of the world: its objects and the surface they are baked into"""
+    
+    __slots__ = ('index', 'x', 'top', 'layers', 'surface')
+    
+    def __init__(self, index, x, top):
+        self.index = index
+        self.x = x
+        self.top = top
+        
+        # Objects grouped by kind id, so each kind is handled in one pass
+        self.layers = tuple([] for _ in KIND_NAMES)
+        self.surface = None
+        
+    @property
+    def objects(self):
+        """Iterate over the chunk's objects of every kind"""
+        return itertools.chain.from_iterable(self.layers)
+        
+    def add(self, obj):
+        """Add an object to its kind's layer"""
+        self.layers[obj.kind].append(obj)
+        
+    def facade_offset(self, building):
+        """Get where a building's facade sits on the chunk surface"""
+        return (building.rect.x - self.x, building.rect.y - building.depth - self.top)
+
+class WorldStreamer:
+    def __init__(self, seed, ground_level, chunk_width=None, preload=None, threaded=None):
+        self.seed = seed
+        self.ground_level = ground_level
+        self.chunk_width = chunk_width or Config.WORLD_CHUNK_WIDTH
+        self.preload = Config.WORLD_PRELOAD_CHUNKS if preload is None else preload
+        self.threaded = Config.WORLD_STREAM_THREAD if threaded is None else threaded
+        
+        # Chunk surfaces only cover the band that objects can reach
+        self.top = ground_level - BUILDING_MAX_HEIGHT - BUILDING_DEPTH
+        
+        # Loaded chunks by index, and their objects indexed by position;
+        # both only touched by the main thread
+        self.chunks = {}
+        self.index = SpatialGrid()
+        
+        # Plain ground shown where a chunk is still being generated
+        self._bare_ground = None
+        
+        # Requests to the worker, and the chunks it has finished
+        self._requests = queue.Queue()
+        self._done = []
+        self._done_lock = threading.Lock()
+        self._pending = set()
+        self._keep = range(0)
+        self._thread = None
+        
+        # Statistics
+        self.generated = 0
+        self.evicted = 0
+        
+    def start(self):
+        """Start the generator thread"""
+        if self.threaded and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="world-streamer", daemon=True)
+            self._thread.start()
+            
+    def close(self):
+        """Stop the generator thread and drop all chunks"""
+        if self._thread is not None:
+            self._requests.put(None)
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.chunks.clear()
+        self.index.clear()
+        self._pending.clear()
+        
+    def chunk_range(self, left, right):
+        """Get the indexes of the chunks overlapping world x from left to right"""
+        return range(int(left // self.chunk_width), int(right // self.chunk_width) + 1)
+        
+    def generate(self, index):
+        """Lay out one chunk's objects from the seed and bake its surface"""
+        rng = random.Random(f"{self.seed}:{index}")
+        chunk = Chunk(index, index * self.chunk_width, self.top)
+        
+        # Ground
+        chunk.add(Ground(pygame.Rect(chunk.x, self.ground_level, self.chunk_width, GROUND_HEIGHT)))
+        
+        # Buildings and trees left to right, kept clear of the chunk edges
+        # so nothing has to be drawn across two chunks
+        x = rng.randint(20, 150)
+        while True:
+            if rng.random() < 0.5:
+                if x + BUILDING_WIDTH + BUILDING_DEPTH > self.chunk_width:
+                    break
+                height = rng.randint(BUILDING_MIN_HEIGHT, BUILDING_MAX_HEIGHT)
+                mask = 0
+                for window in range(window_count(height)):
+                    if rng.random() > 0.3:
+                        mask |= 1 << window
+                chunk.add(Building(pygame.Rect(chunk.x + x, self.ground_level - height, BUILDING_WIDTH, height),
+                                   Config.GRAY, BUILDING_DEPTH, mask))
+                x += BUILDING_WIDTH + BUILDING_DEPTH
+            else:
+                if x + TREE_WIDTH // 2 + LEAF_RADIUS > self.chunk_width:
+                    break
+                chunk.add(Tree(pygame.Rect(chunk.x + x, self.ground_level - TREE_HEIGHT, TREE_WIDTH, TREE_HEIGHT)))
+                x += TREE_WIDTH + LEAF_RADIUS
+            x += rng.randint(60, 220)
+            
+        self._bake(chunk)
+        return chunk
+        
+    def _bake(self, chunk):
+        """Pre-render a chunk's objects into its surface
+        
+        This may run on the worker thread, so it draws onto a plain surface
+        and leaves converting it to the display format to _add_chunk().
+        """
+        surface = pygame.Surface((self.chunk_width, Config.SCREEN_HEIGHT - self.top))
+        surface.fill(Config.WORLD_COLORKEY)
+        offset = (-chunk.x, -self.top)
+        
+        # One pass per kind; objects never overlap, so kind order is safe
+        for ground in chunk.layers[GROUND]:
+            rect = ground.rect.move(offset)
+            pygame.draw.rect(surface, ground.color, rect)
+            
+            # Ground texture lines; chunk edges fall on the 50px grid
+            for line_x in range(rect.x, rect.right, 50):
+                pygame.draw.line(surface, Config.DARK_GRAY,
+                                 (line_x, rect.y), (line_x, rect.bottom), 2)
+                                 
+        for building in chunk.layers[BUILDING]:
+            draw_building(surface, building, chunk.facade_offset(building))
+            
+        for tree in chunk.layers[TREE]:
+            rect = tree.rect.move(offset)
+            
+            # Trunk
+            pygame.draw.rect(surface, tree.trunk_color, (rect.x + 5, rect.y + 40, 10, 20))
+            
+            # Leaves (circular)
+            pygame.draw.circle(surface, tree.color, (rect.centerx, rect.y + 20), LEAF_RADIUS)
+            
+        chunk.surface = surface
+        
+    def _run(self):
+        """Generate requested chunks until closed"""
+        while True:
+            index = self._requests.get()
+            if index is None:
+                return
+                
+            # Skip chunks the camera has already moved away from
+            if index not in self._keep:
+                continue
+                
+            chunk = self.generate(index)
+            with self._done_lock:
+                self._done.append(chunk)
+                
+    def prime(self, left, right):
+        """Generate the chunks around a view on the calling thread"""
+        self.update(left, right, wait=True)
+        
+    def update(self, left, right, wait=False):
+        """Request chunks near the view, take finished ones and evict far ones
+        
+        left and right are the world x range on screen. Returns True when a
+        chunk arrived inside that range, so the caller can redraw.
+        """
+        margin = self.preload * self.chunk_width
+        wanted = self.chunk_range(left - margin, right + margin)
+        self._keep = range(wanted.start - 1, wanted.stop + 1)
+        visible = self.chunk_range(left, right)
+        arrived = False
+        
+        # Ask for missing chunks, nearest the middle of the view first
+        center = (visible.start + visible.stop - 1) / 2
+        missing = [index for index in wanted if index not in self.chunks and index not in self._pending]
+        for index in sorted(missing, key=lambda index: abs(index - center)):
+            if self.threaded and not wait:
+                self._pending.add(index)
+                self._requests.put(index)
+            else:
+                self._add_chunk(self.generate(index))
+                arrived = arrived or index in visible
+                
+        # Take whatever the worker has finished
+        with self._done_lock:
+            done, self._done = self._done, []
+        for chunk in done:
+            self._pending.discard(chunk.index)
+            if chunk.index in self._keep:
+                self._add_chunk(chunk)
+                arrived = arrived or chunk.index in visible
+        self._pending.intersection_update(self._keep)
+        
+        # One chunk of slack either side stops chunks thrashing at a boundary
+        for index in [index for index in self.chunks if index not in self._keep]:
+            for obj in self.chunks.pop(index).objects:
+                self.index.remove(obj)
+            self.evicted += 1
+            
+        return arrived
+        
+    def _add_chunk(self, chunk):
+        """Make a generated chunk live and index its objects"""
+        chunk.surface = prepare(chunk.surface)
+        chunk.surface.set_colorkey(Config.WORLD_COLORKEY, pygame.RLEACCEL)
+        
+        old = self.chunks.get(chunk.index)
+        if old is not None:
+            for obj in old.objects:
+                self.index.remove(obj)
+        self.chunks[chunk.index] = chunk
+        for obj in chunk.objects:
+            self.index.insert(obj, obj.rect)
+        self.generated += 1
+        
+    def draw(self, screen, camera_offset, batch=None):
+        """Draw the chunks on screen; ones still being generated show bare ground
+        
+        With a sprite batch the chunks are queued on its world layer instead.
+        """
+        from src.graphics.sprite_batch import LAYER_WORLD
+        
+        offset_x = int(camera_offset[0])
+        blits = []
+        for index in self.chunk_range(-offset_x, -offset_x + Config.SCREEN_WIDTH):
+            chunk = self.chunks.get(index)
+            if chunk is not None:
+                blits.append((chunk.surface, (chunk.x + offset_x, chunk.top)))
+            else:
+                if self._bare_ground is None:
+                    self._bare_ground = create_surface((self.chunk_width, GROUND_HEIGHT))
+                    self._bare_ground.fill(Config.GREEN)
+                blits.append((self._bare_ground, (index * self.chunk_width + offset_x, self.ground_level)))
+                
+        if batch is not None:
+            batch.extend(blits, LAYER_WORLD)
+        else:
+            screen.blits(blits, doreturn=0)
+            
+    def objects_in(self, rect):
+        """Get the loaded objects overlapping a world rect"""
+        return self.index.query(rect)
+        
+    def get_stats(self):
+        """Get chunk counts"""
+        return {
+            'loaded': len(self.chunks),
+            'objects': len(self.index),
+            'pending': len(self._pending),
+            'generated': self.generated,
+            'evicted': self.evicted,
+        }
\ No newline at end of file
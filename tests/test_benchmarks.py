@@ -0,0 +1,20 @@
+"""
+Benchmark reports written and compared from the command line
+"""
+
+import json
+from benchmarks.runner import main
+
+ARGS = ["--filter", "spatial/move_entity", "--min-time", "0.01", "--no-alloc"]
+
+def test_output_report_round_trips_into_compare(tmp_path, monkeypatch, capsys):
+    # Each run starts where the user is, as two separate commands would
+    monkeypatch.chdir(tmp_path)
+    assert main(ARGS + ["--output", "baseline.json"]) == 0
+    with open(tmp_path / "baseline.json") as f:
+        report = json.load(f)
+    assert list(report['results']) == ["spatial/move_entity"]
+    
+    monkeypatch.chdir(tmp_path)
+    assert main(ARGS + ["--compare", "baseline.json", "--threshold", "1000"]) == 0
+    assert "No regressions" in capsys.readouterr().out
\ No newline at end of file
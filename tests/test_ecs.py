@@ -0,0 +1,106 @@
+"""
+Entity store bookkeeping and the batch systems
+"""
+
+import pygame
+from src.entities.ecs import (EntityStore, POSITION, VELOCITY, COLLIDER, SPRITE, ANIMATION,
+                              movement_system, animation_system, render_system)
+
+def _walker(store, x, y, vel_x=0.0):
+    """Spawn an entity with every component"""
+    entity = store.spawn()
+    store.add_position(entity, x, y)
+    store.add_velocity(entity, vel_x, 0.0, 1.0, 1.0)
+    store.add_collider(entity, 10, 20)
+    return entity
+
+def test_spawn_destroy_reuses_rows():
+    store = EntityStore(capacity=2)
+    entities = [_walker(store, i * 10.0, 0.0) for i in range(5)]
+    assert len(store.mask) >= 5
+    assert len(store) == 5
+    
+    store.destroy(entities[1])
+    assert len(store) == 4
+    assert store.select(POSITION).tolist() == [0, 2, 3, 4]
+    assert store.spawn() == entities[1]
+    assert store.end == 5
+
+def test_select_needs_every_component():
+    store = EntityStore(capacity=4)
+    moving = _walker(store, 0.0, 0.0)
+    still = store.spawn()
+    store.add_position(still, 0.0, 0.0)
+    
+    assert store.select(POSITION).tolist() == [moving, still]
+    assert store.select(POSITION | VELOCITY).tolist() == [moving]
+    assert store.has(moving, POSITION | COLLIDER)
+    assert not store.has(still, VELOCITY)
+
+def test_query_finds_overlapping_colliders():
+    store = EntityStore(capacity=4)
+    near = _walker(store, 100.0, 100.0)
+    _walker(store, 500.0, 100.0)
+    assert store.query(pygame.Rect(105, 110, 5, 5)).tolist() == [near]
+    assert store.query(pygame.Rect(0, 0, 50, 50)).tolist() == []
+
+def test_movement_lands_colliders_on_the_ground():
+    store = EntityStore(capacity=4)
+    entity = _walker(store, 0.0, 0.0, vel_x=5.0)
+    for _ in range(200):
+        movement_system(store, 16.0, 100)
+        
+    assert store.on_ground[entity]
+    assert store.y[entity] == 100 - store.height[entity]
+    assert store.vel_y[entity] == 0.0
+    assert store.x[entity] > 0.0
+
+def test_animation_runs_while_moving_and_resets_when_still():
+    store = EntityStore(capacity=4)
+    entity = _walker(store, 0.0, 0.0, vel_x=5.0)
+    store.add_animation(entity, frame_count=4, frame_time=10)
+    assert store.has(entity, ANIMATION)
+    for _ in range(3):
+        animation_system(store, 16.0)
+    assert store.frame[entity] != 0
+    
+    store.vel_x[entity] = 0.0
+    animation_system(store, 16.0)
+    assert store.frame[entity] == 0
+
+def test_render_draws_visible_sprites_by_layer():
+    class Variants:
+        def __init__(self, color):
+            self.right = pygame.Surface((4, 4))
+            self.right.fill(color)
+            self.left = self.right
+            
+    store = EntityStore(capacity=4)
+    red, blue = Variants((255, 0, 0)), Variants((0, 0, 255))
+    for variants, layer in ((red, 1), (blue, 0)):
+        entity = store.spawn()
+        store.add_position(entity, 10.0, 10.0)
+        store.add_sprite(entity, variants, layer)
+    hidden = store.spawn()
+    store.add_position(hidden, 5000.0, 10.0)
+    store.add_sprite(hidden, blue)
+    
+    screen = pygame.Surface((64, 64))
+    assert render_system(store, screen, (0, 0)) == 2
+    assert store.has(hidden, SPRITE)
+    assert tuple(screen.get_at((11, 11)))[:3] == (255, 0, 0)
+    assert len(store.sprites) == 2
+
+def test_destroy_frees_entities_without_components():
+    store = EntityStore(capacity=4)
+    bare = store.spawn()
+    walker = _walker(store, 0.0, 0.0)
+    
+    store.destroy(bare)
+    store.destroy(bare)
+    assert len(store) == 1
+    assert store.free == [bare]
+    assert store.select(0).tolist() == [walker]
+    assert store.spawn() == bare
+    assert store.spawn() == 2
+    assert len(store) == 3
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Profile index records, listing and rebuilding from the profile files
+"""
+
+import os
+import numpy as np
+from src.config import Config
+from src.profile_store import ProfileStore
+from src.save_format import build_container
+from src.save_manager import write_atomic
+
+def _write_profiles(directory, count):
+    """Write profile files directly, without an index, and get their thumbnails"""
+    store = ProfileStore(directory)
+    rng = np.random.default_rng(2)
+    thumbs = {}
+    for profile_id in range(1, count + 1):
+        thumbs[profile_id] = rng.integers(0, 256, Config.PROFILE_THUMB_SIZE[::-1] + (3,), dtype=np.uint8)
+        write_atomic(store.profile_path(profile_id), build_container({
+            'meta': {'schema': 1, 'saved_at': float(profile_id)},
+            'player': {'player_name': f"P{profile_id}", 'high_score': profile_id * 10},
+            'thumb': thumbs[profile_id],
+        }))
+    return thumbs
+
+def test_rebuilds_missing_index_from_profile_files(tmp_path):
+    directory = str(tmp_path)
+    thumbs = _write_profiles(directory, 5)
+    
+    store = ProfileStore(directory)
+    assert os.path.exists(store.index_file)
+    assert store.count() == 5
+    assert store.last_profile_id == 5
+    
+    # Most recently played first
+    page = store.get_page(0, 3)
+    assert [profile['name'] for profile in page] == ["P5", "P4", "P3"]
+    assert [profile['high_score'] for profile in page] == [50, 40, 30]
+    np.testing.assert_array_equal(store.load_thumbnail(page[0]), thumbs[5])
+    assert len(store.get_page(1, 3)) == 2
+
+def test_rebuilds_damaged_index(tmp_path):
+    directory = str(tmp_path)
+    _write_profiles(directory, 3)
+    store = ProfileStore(directory)
+    with open(store.index_file, 'r+b') as f:
+        f.write(b"JUNK")
+        
+    assert ProfileStore(directory).count() == 3
+
+def test_rebuild_skips_unreadable_profiles(tmp_path):
+    directory = str(tmp_path)
+    _write_profiles(directory, 3)
+    store = ProfileStore(directory)
+    with open(store.profile_path(2), 'wb') as f:
+        f.write(b"not a save")
+        
+    store.rebuild_index()
+    assert sorted(store.slots) == [1, 3]
+
+def test_records_survive_reopening(tmp_path):
+    directory = str(tmp_path)
+    store = ProfileStore(directory)
+    first = store.create_profile()
+    second = store.create_profile()
+    store.update_profile(first, {'player_name': 'One', 'high_score': 3}, 100.0)
+    store.update_profile(second, {'player_name': 'Two', 'high_score': 4}, 50.0)
+    store.delete_profile(second)
+    store.set_last_profile(first)
+    
+    reopened = ProfileStore(directory)
+    assert reopened.last_profile_id == first
+    assert [profile['name'] for profile in reopened.get_page(0, 10)] == ['One']
\ No newline at end of file
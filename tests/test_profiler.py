@@ -0,0 +1,58 @@
+"""
+Frame profiler switching on and off around timed sections
+"""
+
+from src.profiler import FrameProfiler
+
+def _frame(profiler, toggle_in=None):
+    """Time one frame with nested sections, toggling inside one if asked"""
+    profiler.begin_frame()
+    with profiler.section('events'):
+        if toggle_in == 'events':
+            profiler.toggle()
+    with profiler.section('update'):
+        with profiler.section('render'):
+            if toggle_in == 'render':
+                profiler.toggle()
+    profiler.end_frame()
+
+def test_toggle_off_inside_open_section():
+    profiler = FrameProfiler()
+    profiler.toggle()
+    _frame(profiler)
+    assert profiler.enabled
+    
+    # Turning off mid-frame finishes the frame first
+    _frame(profiler, toggle_in='events')
+    assert not profiler.enabled
+    assert len(profiler.samples) == 2
+    assert profiler._stack == []
+    
+    _frame(profiler)
+    assert len(profiler.samples) == 2
+
+def test_toggle_inside_nested_section():
+    profiler = FrameProfiler()
+    profiler.toggle()
+    _frame(profiler, toggle_in='render')
+    assert not profiler.enabled
+    assert set(profiler.samples[-1]) >= {'events', 'update', 'render', 'frame'}
+
+def test_toggle_on_inside_untimed_frame():
+    profiler = FrameProfiler()
+    _frame(profiler, toggle_in='events')
+    assert profiler.enabled
+    assert len(profiler.samples) == 0
+    
+    _frame(profiler)
+    assert len(profiler.samples) == 1
+
+def test_double_toggle_within_a_frame_cancels():
+    profiler = FrameProfiler()
+    profiler.toggle()
+    profiler.begin_frame()
+    with profiler.section('events'):
+        profiler.toggle()
+        profiler.toggle()
+    profiler.end_frame()
+    assert profiler.enabled
\ No newline at end of file
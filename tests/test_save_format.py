@@ -0,0 +1,76 @@
+"""
+Save container encoding, decoding and rejection of damaged files
+"""
+
+import numpy as np
+import pytest
+from src.save_format import (build_container, read_table, SaveContainer, SaveFormatError,
+                             HEADER, MAGIC, FORMAT_VERSION, SECTION_ALIGNMENT)
+
+SECTIONS = {
+    'meta': {'schema': 1, 'saved_at': 12.5},
+    'player': {'player_name': 'Ada', 'high_score': 420, 'tags': ['a', 'b']},
+    'blob': b"\x00\x01raw bytes",
+    'row': np.arange(10, dtype=np.uint8),
+    'mask': np.arange(12, dtype=np.uint8).reshape(3, 4),
+    'avatar': np.random.default_rng(0).integers(0, 256, (30, 40, 3), dtype=np.uint8),
+}
+
+def _write(tmp_path, data, name="test.sav"):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+def _check_sections(container):
+    """Check every section decodes to what was stored"""
+    for name, value in SECTIONS.items():
+        if isinstance(value, np.ndarray):
+            np.testing.assert_array_equal(container.get(name), value)
+        else:
+            assert container.get(name) == value
+
+@pytest.mark.parametrize("compress_level", [0, 6])
+def test_round_trip(tmp_path, compress_level):
+    path = _write(tmp_path, build_container(SECTIONS, compress_level))
+    with SaveContainer(path) as container:
+        assert container.version == FORMAT_VERSION
+        assert list(container.sections) == list(SECTIONS)
+        _check_sections(container)
+        assert 'missing' not in container
+        assert container.get('missing', 'default') == 'default'
+
+def test_raw_sections_are_aligned():
+    _, table = read_table(build_container(SECTIONS))
+    for kind, compression, shape, offset, length in table.values():
+        assert offset % SECTION_ALIGNMENT == 0
+    assert table['avatar'][2] == (30, 40, 3)
+
+def test_rejects_bad_section_names_and_arrays():
+    with pytest.raises(ValueError):
+        build_container({'a_section_name_that_is_too_long': {}})
+    with pytest.raises(ValueError):
+        build_container({'volume': np.zeros((2, 2, 2, 2), dtype=np.uint8)})
+
+def _cut_lengths():
+    """Lengths to cut a container to: inside the header, the table and the last section"""
+    data = build_container(SECTIONS)
+    avatar_offset = read_table(data)[1]['avatar'][3]
+    return [0, 4, HEADER.size, HEADER.size + 10, avatar_offset + 5]
+
+@pytest.mark.parametrize("length", _cut_lengths())
+def test_rejects_truncated_files(tmp_path, length):
+    path = _write(tmp_path, build_container(SECTIONS)[:length])
+    with pytest.raises(SaveFormatError):
+        SaveContainer(path)
+
+def test_rejects_other_files(tmp_path):
+    data = bytearray(build_container(SECTIONS))
+    data[:4] = b"PNG\0"
+    with pytest.raises(SaveFormatError):
+        SaveContainer(_write(tmp_path, bytes(data)))
+
+def test_rejects_newer_versions(tmp_path):
+    data = bytearray(build_container(SECTIONS))
+    HEADER.pack_into(data, 0, MAGIC, FORMAT_VERSION + 1, len(SECTIONS), 0)
+    with pytest.raises(SaveFormatError):
+        SaveContainer(_write(tmp_path, bytes(data)))
\ No newline at end of file
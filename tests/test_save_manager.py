@@ -0,0 +1,125 @@
+"""
+Saving profiles through the background writer, and migrating old saves
+"""
+
+import os
+import json
+import time
+import pygame
+import pytest
+import numpy as np
+from src.config import Config
+from src.profile_store import ProfileStore, FLAG_DELETED
+from src.save_format import build_container
+from src import save_manager
+from src.save_manager import SaveManager, migrate, write_atomic
+
+@pytest.fixture(autouse=True)
+def work_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def test_delete_profile_waits_for_pending_save(monkeypatch):
+    # Keep the save pending when the profile is deleted
+    monkeypatch.setattr(Config, 'SAVE_COALESCE_DELAY', 0.5)
+    manager = SaveManager()
+    manager.save_player_data({'player_name': 'Gone', 'high_score': 5})
+    profile_id = manager.profile_id
+    path = manager.save_file
+    
+    manager.delete_profile(profile_id)
+    manager.close()
+    
+    assert manager.profile_id is None
+    assert not os.path.exists(path)
+    assert ProfileStore(Config.PROFILES_DIR).count() == 0
+
+def test_flush_reports_failed_writes(monkeypatch):
+    monkeypatch.setattr(Config, 'SAVE_COALESCE_DELAY', 0.0)
+    manager = SaveManager()
+    
+    def fail(path, data):
+        raise OSError("disk full")
+    monkeypatch.setattr(save_manager, 'write_atomic', fail)
+    manager.save_player_data({'player_name': 'Lost'})
+    assert not manager.flush()
+    assert manager.saves_failed == 1
+    
+    # A later save that reaches disk covers the failed one
+    monkeypatch.setattr(save_manager, 'write_atomic', write_atomic)
+    manager.save_player_data({'player_name': 'Kept'})
+    assert manager.flush()
+    assert manager.close()
+    assert manager.saves_written == 1
+
+def test_idle_flush_keeps_the_next_save_coalescing(monkeypatch):
+    monkeypatch.setattr(Config, 'SAVE_COALESCE_DELAY', 0.5)
+    manager = SaveManager()
+    assert manager.flush()
+    
+    manager.save_player_data({'player_name': 'Later'})
+    time.sleep(0.1)
+    assert manager.saves_written == 0
+    assert manager.flush()
+    assert manager.saves_written == 1
+    manager.close()
+
+def test_update_profile_keeps_deleted_profiles_deleted():
+    store = ProfileStore(Config.PROFILES_DIR)
+    profile_id = store.create_profile()
+    store.delete_profile(profile_id)
+    
+    store.update_profile(profile_id, {'player_name': 'Late'}, 1.0)
+    
+    assert store.records[store.slots[profile_id]]['flags'] & FLAG_DELETED
+    assert store.count() == 0
+    assert ProfileStore(Config.PROFILES_DIR).count() == 0
+
+def _avatar(height=30, width=40):
+    return np.random.default_rng(1).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+def _saved_profile():
+    """Read back the player data and avatar of the last played profile"""
+    manager = SaveManager()
+    return manager.load_player_data(), manager.load_avatar()
+
+def test_migrates_v0_json_save_with_avatar_png():
+    avatar = _avatar()
+    os.makedirs(Config.SAVES_DIR, exist_ok=True)
+    avatar_path = os.path.join(Config.SAVES_DIR, "avatar.png")
+    pygame.image.save(pygame.surfarray.make_surface(avatar.swapaxes(0, 1)), avatar_path)
+    with open(os.path.join(Config.SAVES_DIR, "player_data.json"), 'w') as f:
+        json.dump({'player_name': 'Old', 'high_score': 7, 'has_avatar': True,
+                   'avatar_path': avatar_path}, f)
+                   
+    manager = SaveManager()
+    player_data = manager.load_player_data()
+    manager.close()
+    
+    assert player_data['player_name'] == 'Old'
+    assert player_data['avatar_path'] == ''
+    player_data, saved_avatar = _saved_profile()
+    assert player_data['high_score'] == 7
+    assert player_data['avatar_path'] == ''
+    np.testing.assert_array_equal(saved_avatar, avatar)
+
+def test_imports_legacy_container_save():
+    avatar = _avatar()
+    write_atomic(os.path.join(Config.SAVES_DIR, "player.sav"), build_container({
+        'player': {'player_name': 'Sav', 'high_score': 99, 'avatar_path': ''},
+        'avatar': avatar,
+    }))
+    
+    manager = SaveManager()
+    assert manager.load_player_data()['player_name'] == 'Sav'
+    manager.close()
+    
+    player_data, saved_avatar = _saved_profile()
+    assert player_data['high_score'] == 99
+    np.testing.assert_array_equal(saved_avatar, avatar)
+    assert ProfileStore(Config.PROFILES_DIR).count() == 1
+
+def test_migrate_clears_missing_avatar_path():
+    player_data, avatar = migrate({'avatar_path': 'gone.png'}, None, 0)
+    assert player_data['avatar_path'] == ''
+    assert avatar is None
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Spatial grid queries against a brute-force scan
+"""
+
+import random
+import pygame
+from src.systems.spatial_index import SpatialGrid
+
+def _scan(items, rect):
+    """Items overlapping a rect, found the slow way"""
+    return {id(item) for item in items if item['rect'].colliderect(rect)}
+
+def test_queries_match_linear_scan():
+    rng = random.Random(3)
+    grid = SpatialGrid(64)
+    items = []
+    for _ in range(300):
+        item = {'rect': pygame.Rect(rng.randint(-500, 2000), rng.randint(-200, 800),
+                                    rng.randint(1, 300), rng.randint(1, 300))}
+        grid.insert(item, item['rect'])
+        items.append(item)
+        
+    for _ in range(100):
+        rect = pygame.Rect(rng.randint(-600, 2000), rng.randint(-300, 800),
+                           rng.randint(1, 400), rng.randint(1, 400))
+        found = grid.query(rect)
+        assert len(found) == len({id(item) for item in found})
+        assert {id(item) for item in found} == _scan(items, rect)
+
+def test_move_and_remove():
+    grid = SpatialGrid(100)
+    item = {'rect': pygame.Rect(10, 10, 20, 20)}
+    grid.insert(item, item['rect'])
+    
+    # Within the same cell, then across cells
+    grid.move(item, pygame.Rect(50, 50, 20, 20))
+    assert grid.query(pygame.Rect(40, 40, 20, 20)) == [item]
+    grid.move(item, pygame.Rect(450, 50, 20, 20))
+    assert grid.query(pygame.Rect(40, 40, 20, 20)) == []
+    assert grid.query(pygame.Rect(440, 40, 20, 20)) == [item]
+    assert len(grid.cells) == 1
+    
+    grid.remove(item)
+    grid.remove(item)
+    assert item not in grid
+    assert len(grid) == 0
+    assert not grid.cells
+
+def test_reinserting_moves_the_item():
+    grid = SpatialGrid(100)
+    item = object()
+    grid.insert(item, pygame.Rect(0, 0, 10, 10))
+    grid.insert(item, pygame.Rect(300, 0, 10, 10))
+    assert len(grid) == 1
+    assert grid.query(pygame.Rect(0, 0, 10, 10)) == []
+    assert grid.query(pygame.Rect(300, 0, 10, 10)) == [item]
+
+def test_stored_rects_are_copies():
+    grid = SpatialGrid(100)
+    rect = pygame.Rect(0, 0, 10, 10)
+    grid.insert('item', rect)
+    rect.x = 500
+    assert grid.query(pygame.Rect(0, 0, 10, 10)) == ['item']
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Texture atlas packing, release with the sprite cache, and layered batches
+"""
+
+import gc
+import weakref
+import numpy as np
+import pygame
+import pytest
+from src.graphics.sprite_batch import TextureAtlas, SpriteBatch
+from src.graphics.sprite_cache import SpriteCache, image_key
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    yield
+    pygame.display.quit()
+
+def _solid(color, size=(32, 48)):
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+def test_added_images_share_the_atlas_surface():
+    atlas = TextureAtlas((128, 128))
+    first = atlas.add("a", _solid((255, 0, 0)))
+    second = atlas.add("b", _solid((0, 255, 0)))
+    assert first.get_parent() is atlas.surface
+    assert second.get_parent() is atlas.surface
+    assert first.get_at((5, 5))[:3] == (255, 0, 0)
+    assert second.get_at((5, 5))[:3] == (0, 255, 0)
+    assert atlas.add("a", _solid((0, 0, 255))) is first
+
+def test_released_space_is_reused_by_repacking():
+    atlas = TextureAtlas((100, 50))
+    for i in range(3):
+        atlas.add(i, _solid((i * 80, 0, 0)))
+    kept = atlas.regions[2]
+    
+    # Full until something is released
+    overflowed = _solid((1, 2, 3))
+    assert atlas.add("new", overflowed) is overflowed
+    atlas.release(0)
+    region = atlas.add("new", _solid((1, 2, 3)))
+    assert region.get_parent() is atlas.surface
+    assert atlas.repacks == 1
+    
+    # Repacked images keep their pixels; old subsurfaces stay valid
+    assert atlas.regions[2].get_at((1, 1))[:3] == (160, 0, 0)
+    assert kept.get_at((1, 1))[:3] == (160, 0, 0)
+
+def test_sprite_cache_eviction_releases_atlas_space_and_sources():
+    cache = SpriteCache(max_entries=2)
+    atlas = TextureAtlas((256, 256))
+    cache.eviction_listeners.append(atlas.release_variants)
+    
+    sources = []
+    for i in range(50):
+        image = np.full((48, 32, 3), i, dtype=np.uint8)
+        image.flags.writeable = False
+        variants = cache.get(image_key(image), (32, 48),
+                             lambda image=image: pygame.surfarray.make_surface(image.swapaxes(0, 1)), image)
+        packed = atlas.pack_variants(variants)
+        assert packed.source is None
+        sources.append(weakref.ref(image))
+        del image, variants
+        
+    # Only the cached sprites stay packed, and evicted sources can be freed
+    assert len(atlas.regions) == 4
+    assert len(atlas.variants) == 2
+    assert atlas.overflow == 0
+    gc.collect()
+    assert sum(ref() is not None for ref in sources) == 2
+
+def test_batch_draws_layers_lowest_first_in_one_call():
+    target = pygame.Surface((10, 10))
+    batch = SpriteBatch()
+    batch.add(_solid((0, 0, 255), (10, 10)), (0, 0), layer=5)
+    batch.add(_solid((255, 0, 0), (10, 10)), (0, 0), layer=1)
+    batch.extend([(_solid((0, 255, 0), (4, 4)), (0, 0))], layer=9)
+    batch.flush(target)
+    batch.end_frame()
+    
+    assert target.get_at((1, 1))[:3] == (0, 255, 0)
+    assert target.get_at((8, 8))[:3] == (0, 0, 255)
+    stats = batch.get_stats()
+    assert stats['last_draw_calls'] == 1
+    assert stats['last_blits'] == 3
\ No newline at end of file
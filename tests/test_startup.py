@@ -0,0 +1,52 @@
+"""
+Timed imports racing the background pre-warm thread
+"""
+
+import sys
+import time
+import threading
+from src.startup import StartupTimer
+
+SLOW_MODULE = '''
+import time
+time.sleep(0.3)
+
+class Late:
+    pass
+'''
+
+def test_timed_import_waits_for_import_in_progress(tmp_path, monkeypatch):
+    (tmp_path / "slow_state_module.py").write_text(SLOW_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "slow_state_module", raising=False)
+    
+    timer = StartupTimer()
+    worker = threading.Thread(target=timer.timed_import, args=("slow_state_module",), name="prewarm")
+    worker.start()
+    
+    # Wait until the worker has the module half built
+    deadline = time.perf_counter() + 5.0
+    while "slow_state_module" not in sys.modules:
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+        
+    module = timer.timed_import("slow_state_module")
+    assert hasattr(module, "Late")
+    worker.join()
+    
+    # Only the import that did the work is timed
+    assert timer.import_times["slow_state_module"][1] == "prewarm"
+    sys.modules.pop("slow_state_module", None)
+
+def test_timed_import_records_first_import_only():
+    timer = StartupTimer()
+    sys.modules.pop("colorsys", None)
+    timer.timed_import("colorsys")
+    first = timer.import_times["colorsys"]
+    timer.timed_import("colorsys")
+    assert timer.import_times["colorsys"] == first
+
+def test_timed_import_skips_timing_for_loaded_modules():
+    timer = StartupTimer()
+    timer.timed_import("time")
+    assert "time" not in timer.import_times
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Weather sounds following the rain and lightning
+"""
+
+from src.systems.weather_system import WeatherSystem
+
+class FakeChannel:
+    def __init__(self):
+        self.volume = None
+        
+    def set_volume(self, volume):
+        self.volume = volume
+
+class FakeAudio:
+    """Records the sounds played and stopped"""
+    
+    def __init__(self):
+        self.played = []
+        self.stopped = []
+        self.channel = FakeChannel()
+        
+    def play_sfx(self, sfx_name, volume=1.0, loops=0):
+        self.played.append((sfx_name, loops))
+        return self.channel
+        
+    def stop_sfx(self, sfx_name):
+        self.stopped.append(sfx_name)
+
+def _weather(audio):
+    weather = WeatherSystem(audio)
+    weather.weather_change_interval = float('inf')
+    return weather
+
+def test_rain_sound_loops_while_it_rains():
+    audio = FakeAudio()
+    weather = _weather(audio)
+    weather.update(16.0)
+    assert audio.played == []
+    
+    weather.set_weather("rain")
+    for _ in range(10):
+        weather.update(16.0)
+    assert audio.played == [('rain', -1)]
+    assert audio.channel.volume == weather.rain_intensity > 0
+    
+    weather.set_weather("clear")
+    for _ in range(100):
+        weather.update(16.0)
+    assert weather.rain_intensity == 0
+    assert audio.stopped == ['rain']
+
+def test_lightning_plays_thunder():
+    audio = FakeAudio()
+    weather = _weather(audio)
+    weather._trigger_lightning()
+    assert audio.played == [('thunder', 0)]
+
+def test_leaving_stops_the_rain():
+    audio = FakeAudio()
+    weather = _weather(audio)
+    weather.set_weather("storm")
+    weather.update(16.0)
+    weather.stop_sounds()
+    weather.stop_sounds()
+    assert audio.stopped == ['rain']
+
+def test_silent_without_audio_manager():
+    weather = _weather(None)
+    weather.set_weather("storm")
+    weather.update(16.0)
+    weather._trigger_lightning()
+    weather.stop_sounds()
+    assert not weather.rain_playing
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+Webcam capture thread driven by a replayed .npy file
+"""
+
+import threading
+import numpy as np
+import pytest
+from src.systems.webcam_capture import WebcamCapture, FileReplaySource
+
+pytest.importorskip("cv2")
+
+FRAME_COUNT = 5
+
+def _replay(tmp_path, realtime=False, fps=30):
+    """Get a replay of frames each filled with their index times ten"""
+    frames = np.stack([np.full((6, 8, 3), i * 10, dtype=np.uint8) for i in range(FRAME_COUNT)])
+    path = str(tmp_path / "replay.npy")
+    np.save(path, frames)
+    return FileReplaySource(path, fps, realtime)
+
+def _capture_reads(capture, reads):
+    """Run the worker until it has read a fixed number of frames"""
+    read = capture.source.read
+    count = [0]
+    def counted():
+        count[0] += 1
+        if count[0] == reads:
+            capture._stop_event.set()
+        return read()
+    capture.source.read = counted
+    thread = capture.start()._thread
+    thread.join(timeout=5.0)
+    assert not thread.is_alive()
+
+def test_replay_loops_until_released(tmp_path):
+    source = _replay(tmp_path)
+    assert source.is_opened()
+    values = [int(source.read()[1][0, 0, 0]) for _ in range(FRAME_COUNT + 2)]
+    assert values == [0, 10, 20, 30, 40, 0, 10]
+    
+    source.release()
+    assert not source.is_opened()
+    assert source.read() == (False, None)
+
+def test_newest_frame_wins(tmp_path):
+    capture = WebcamCapture(_replay(tmp_path), (4, 3), queue_size=2)
+    _capture_reads(capture, 7)
+    
+    # The queue held two frames, so five were pushed out while capturing
+    assert capture.frames_captured == 7
+    assert capture.frames_dropped == 5
+    
+    frame = capture.get_frame()
+    assert frame.shape == (3, 4, 3)
+    assert int(frame[0, 0, 0]) == 6 % FRAME_COUNT * 10
+    assert capture.get_frame() is None
+    
+    stats = capture.get_stats()
+    assert stats['captured'] == 7
+    assert stats['delivered'] == 1
+    assert stats['dropped'] == 6
+    assert stats['failed_reads'] == 0
+
+def test_frames_are_mirrored_and_converted_to_rgb(tmp_path):
+    capture = WebcamCapture(_replay(tmp_path), (2, 1))
+    frame = np.zeros((1, 2, 3), dtype=np.uint8)
+    frame[0, 0] = (255, 0, 0)  # blue on the left, in BGR
+    rgb = capture.process(frame)
+    assert rgb[0, 1].tolist() == [0, 0, 255]
+    assert rgb[0, 0].tolist() == [0, 0, 0]
+
+def test_release_stops_the_worker_and_releases_the_source(tmp_path):
+    source = _replay(tmp_path, realtime=True, fps=1000)
+    capture = WebcamCapture(source, (4, 3)).start()
+    thread = capture._thread
+    assert capture.get_frame(timeout=1.0) is not None
+    
+    capture.release()
+    assert not thread.is_alive()
+    assert not source.is_opened()
+
+def test_release_waits_for_a_blocked_read(tmp_path):
+    source = _replay(tmp_path)
+    capture = WebcamCapture(source, (4, 3))
+    reading = threading.Event()
+    unblock = threading.Event()
+    released_during_read = []
+    read, release = source.read, source.release
+    def blocked_read():
+        reading.set()
+        unblock.wait(5.0)
+        result = read()
+        reading.clear()
+        return result
+    def checked_release():
+        released_during_read.append(reading.is_set())
+        release()
+    source.read = blocked_read
+    source.release = checked_release
+    
+    thread = capture.start()._thread
+    assert reading.wait(1.0)
+    capture.release()
+    unblock.set()
+    thread.join(timeout=5.0)
+    
+    # The source is released once, after the read it was blocked in
+    assert released_during_read == [False]
+    assert not source.is_opened()
\ No newline at end of file